@@ -0,0 +1,89 @@
+# pyright: standard
+"""Compare the Cython MPO environment updates with the former implementation
+based on `np.tensordot`, for growing bond dimensions of the MPS."""
+
+from seemps.cython import _update_left_mpo_environment, _update_right_mpo_environment
+from .benchmark import BenchmarkSet, BenchmarkGroup
+from .benchmark_mps import warmup, system_version
+import numpy as np
+import sys
+
+GENERATOR = np.random.default_rng(13221231)
+
+PHYSICAL_DIMENSION = 2
+MPO_BOND_DIMENSION = 5
+
+
+def tensordot_left(rho, A, O, B):
+    aux = np.tensordot(B, rho, (0, 2))
+    aux = np.tensordot(aux, O, ([0, 3], [2, 0]))
+    return np.tensordot(aux, np.conj(A), ((1, 2), (0, 1))).transpose(2, 1, 0)
+
+
+def tensordot_right(rho, A, O, B):
+    aux = np.tensordot(np.conj(A), rho, (2, 0))
+    aux = np.tensordot(aux, O, ((1, 2), (1, 3)))
+    return np.tensordot(aux, B, ((1, 3), (2, 1)))
+
+
+def make_left(D, rng=GENERATOR):
+    d, W = PHYSICAL_DIMENSION, MPO_BOND_DIMENSION
+    A = rng.normal(size=(D, d, D))
+    O = rng.normal(size=(W, d, d, W))
+    rho = rng.normal(size=(D, W, D))
+    return (rho, A, O, A)
+
+
+def make_sweep(D, rng=GENERATOR):
+    """Ten sites, so that each update consumes the output of the previous one."""
+    return (make_left(D, rng)[0], [make_left(D, rng)[1:] for _ in range(10)])
+
+
+def numpy_sweep(rho, tensors):
+    for A, O, B in tensors:
+        rho = tensordot_left(rho, A, O, B)
+
+
+def cython_sweep(rho, tensors):
+    for A, O, B in tensors:
+        rho = _update_left_mpo_environment(rho, A, O, B)
+
+
+def run_all():
+    warmup(64 * 10 * 2 * 10)
+    sizes = [10, 20, 50, 100, 200]
+    data = BenchmarkSet(
+        name="Environments",
+        environment=system_version(),
+        groups=[
+            BenchmarkGroup.run(
+                name="LeftMPOEnvironment",
+                items=[
+                    ("tensordot", tensordot_left, make_left, sizes),
+                    ("cython", _update_left_mpo_environment, make_left, sizes),
+                ],
+            ),
+            BenchmarkGroup.run(
+                name="RightMPOEnvironment",
+                items=[
+                    ("tensordot", tensordot_right, make_left, sizes),
+                    ("cython", _update_right_mpo_environment, make_left, sizes),
+                ],
+            ),
+            BenchmarkGroup.run(
+                name="LeftMPOSweep",
+                items=[
+                    ("tensordot", numpy_sweep, make_sweep, sizes),
+                    ("cython", cython_sweep, make_sweep, sizes),
+                ],
+            ),
+        ],
+    )
+    if len(sys.argv) > 1:
+        data.write(sys.argv[1])
+    else:
+        data.write("./benchmark_environments.json")
+
+
+if __name__ == "__main__":
+    run_all()
@@ -0,0 +1,93 @@
+# pyright: standard
+"""Compare the cost and accuracy of the algorithms that evaluate polynomial
+expansions on MPS and MPO: Clenshaw, direct recursion and Paterson-Stockmeyer."""
+
+from seemps.state import DEFAULT_STRATEGY, mps_tensor_sum
+from seemps.analysis.mesh import RegularInterval
+from seemps.analysis.factories import mps_interval
+from seemps.analysis.expansion import ChebyshevExpansion
+from seemps.analysis.operators import x_mpo
+from .benchmark_mps import system_version
+import numpy as np
+import json
+import sys
+import time
+
+METHODS = ["clenshaw", "direct", "paterson-stockmeyer"]
+
+DEGREES = [25, 50, 100, 200]
+
+STRATEGY = DEFAULT_STRATEGY.replace(tolerance=1e-14)
+
+
+def func(x):
+    return np.sin(20 * x) * np.exp(-(x**2))
+
+
+def make_mps_1d(n=14):
+    interval = RegularInterval(-1.0, 1.0, 2**n)
+    return interval, func(interval.to_vector()), (-1.0, 1.0)
+
+
+def make_mps_2d(n=8):
+    interval = RegularInterval(-1.0, 1.0, 2**n)
+    x = interval.to_vector()
+    argument = mps_tensor_sum([mps_interval(interval), mps_interval(interval)])
+    return argument, func(np.add.outer(x, x)).reshape(-1), (-2.0, 2.0)
+
+
+def make_mpo(n=10):
+    a, b = -1.0, 1.0
+    dx = (b - a) / 2**n
+    x = np.linspace(a, b, 2**n, endpoint=False)
+    return x_mpo(n, a, dx), func(x), (a, b)
+
+
+def run_group(name, argument, exact, domain, to_vector, repeats=1):
+    print("-" * 50)
+    print(f"Executing group {name}")
+    items = []
+    for method in METHODS:
+        times, errors = [], []
+        for degree in DEGREES:
+            expansion = ChebyshevExpansion.project(func, domain, degree + 1)
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                result = to_vector(expansion, argument, method)
+                samples.append(time.perf_counter() - start)
+            times.append(min(samples))
+            errors.append(float(np.max(np.abs(result - exact))))
+            print(
+                f"Method {method:20} at degree {degree:3} took {times[-1]:5g} seconds, "
+                + f"max. error {errors[-1]:.2e}"
+            )
+        items.append(
+            {"name": method, "sizes": DEGREES, "times": times, "errors": errors}
+        )
+    return {"name": name, "items": items}
+
+
+def mps_vector(expansion, argument, method):
+    return expansion.to_mps(argument, strategy=STRATEGY, method=method).to_vector()
+
+
+def mpo_vector(expansion, argument, method):
+    return np.diag(
+        expansion.to_mpo(argument, strategy=STRATEGY, method=method).to_matrix()
+    )
+
+
+def run_all():
+    results = {"name": "Expansion", "environment": system_version(), "groups": []}
+    results["groups"].append(run_group("ChebyshevMPS1D", *make_mps_1d(), mps_vector))
+    results["groups"].append(run_group("ChebyshevMPS2D", *make_mps_2d(), mps_vector))
+    results["groups"].append(run_group("ChebyshevMPO", *make_mpo(), mpo_vector))
+    return results
+
+
+if __name__ == "__main__":
+    data = run_all()
+    filename = sys.argv[1] if len(sys.argv) > 1 else "./benchmark_expansion.json"
+    with open(filename, "w") as f:
+        json.dump(data, f)
@@ -0,0 +1,106 @@
+# pyright: standard
+"""Compare the accuracy and the cost of the random sketches available in
+`tt_rss`, on the Gaussian functions used in the TT-RSS tests."""
+
+from seemps.analysis.mesh import RegularInterval, Mesh, mps_to_mesh_matrix
+from seemps.analysis.sketching import tt_rss, BlackBoxLoadMPS, _make_sketch
+from .benchmark_mps import system_version
+import numpy as np
+import json
+import sys
+import time
+
+SKETCHES = ["gaussian", "srht", "countsketch", "sparse-sign", "khatri-rao"]
+
+COVARIANCE = np.array([[1.0, 0.6, 0.3], [0.6, 1.5, 0.4], [0.3, 0.4, 1.2]])
+
+
+def gaussian(tensor):
+    return np.exp(-0.5 * np.sum(tensor**2, axis=0))
+
+
+def rotated_gaussian(tensor):
+    Σ_inv = np.linalg.inv(COVARIANCE)
+    return np.exp(-0.5 * np.einsum("i...,ij,j...->...", tensor, Σ_inv, tensor))
+
+
+def make_problem(dimension, n, num_samples, max_bond, rng):
+    """Black box, samples, bond dimensions and exact tensor of a test function."""
+    interval = RegularInterval(-1.0, 1.0, 2**n)
+    mesh = Mesh([interval] * dimension)
+    func = gaussian if dimension < 3 else rotated_gaussian
+    black_box = BlackBoxLoadMPS(
+        func, mesh, mps_to_mesh_matrix([n] * dimension), [2] * (n * dimension)
+    )
+    if dimension < 3:
+        samples = rng.normal(size=(num_samples, dimension))
+    else:
+        samples = rng.multivariate_normal(np.zeros(3), COVARIANCE, size=num_samples)
+    exact = func(mesh.to_tensor(channels_first=True)).reshape(-1)
+    return black_box, samples, np.array([max_bond] * (n * dimension)), exact
+
+
+PROBLEMS = {
+    "Gaussian1D": (1, 10, 100, 10),
+    "Gaussian2D": (2, 8, 100, 10),
+    "RotatedGaussian3D": (3, 6, 1000, 100),
+}
+
+
+def run_all(repeats=3):
+    rng = np.random.default_rng(13221231)
+    results = {"name": "Sketching", "environment": system_version(), "groups": []}
+    for name, parameters in PROBLEMS.items():
+        black_box, samples, max_bonds, exact = make_problem(*parameters, rng=rng)
+        print("-" * 50)
+        print(f"Executing group {name}")
+        items = []
+        for sketch in SKETCHES:
+            times, errors = [], []
+            for seed in range(repeats):
+                t = time.perf_counter()
+                mps = tt_rss(
+                    black_box,
+                    samples,
+                    max_bonds,
+                    sketch=sketch,
+                    rng=np.random.default_rng(seed),
+                )
+                times.append(time.perf_counter() - t)
+                errors.append(float(np.max(np.abs(mps.to_vector() - exact))))
+            print(
+                f"Sketch {sketch:12} took {min(times):5g} seconds, "
+                + f"max. error {max(errors):.2e}"
+            )
+            items.append({"name": sketch, "times": times, "errors": errors})
+        results["groups"].append({"name": name, "items": items})
+    results["groups"].extend(run_apply(rng))
+    return results
+
+
+def run_apply(rng, rows=256, sizes=(2**10, 2**12, 2**14, 2**16)):
+    """Time of creating a (t, χ) sketch and applying it to a (rows, t) fiber."""
+    groups = []
+    for cols in [64, 256]:
+        print("-" * 50)
+        print(f"Executing group SketchApply{cols}")
+        items = []
+        for sketch in SKETCHES:
+            times = []
+            for t in sizes:
+                f = rng.normal(size=(rows, t))
+                multi_indices = rng.integers(0, 2, size=(t, 16))
+                start = time.perf_counter()
+                _make_sketch(sketch, multi_indices, [2] * 16, cols, rng).apply(f)
+                times.append(time.perf_counter() - start)
+                print(f"Sketch {sketch:12} at size {t} took {times[-1]:5g} seconds")
+            items.append({"name": sketch, "sizes": list(sizes), "times": times})
+        groups.append({"name": f"SketchApply{cols}", "items": items})
+    return groups
+
+
+if __name__ == "__main__":
+    data = run_all()
+    filename = sys.argv[1] if len(sys.argv) > 1 else "./benchmark_sketching.json"
+    with open(filename, "w") as f:
+        json.dump(data, f)
@@ -13,6 +13,7 @@ from . import (
     analysis,
     optimization,
     solve,
+    symmetry,
 )
 
 __all__ = [
@@ -27,6 +28,7 @@ __all__ = [
     "qft",
     "solve",
     "state",
+    "symmetry",
     "tools",
     "truncate",
     "version",
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Callable
-from ..mesh import Mesh, mps_to_mesh_matrix
+from ..mesh import Mesh, MeshIndexMapper, mps_to_mesh_matrix
 from ..evaluation import evaluate_mps
 from ...state import MPS
 from ...typing import Matrix, Vector
@@ -24,18 +31,219 @@ class BlackBox(ABC):
     func: Callable
     physical_dimensions: list[int]
     evals: int
+    cache_hits: int
+    cache_misses: int
+    cache_size: int
+    _cache: OrderedDict[bytes, np.generic] | None
+    _executor: Executor | str | None
+    _chunk_size: int | None
+    _max_workers: int
 
     def __init__(self, func: Callable, physical_dimensions: list):
         self.func = func
         self.physical_dimensions = physical_dimensions
         self.evals = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_size = 0
+        self._cache = None
+        self._executor = None
+        self._chunk_size = None
+        self._max_workers = 1
 
     @abstractmethod
-    def __getitem__(self, mps_indices: Matrix) -> Vector: ...
+    def evaluate(self, mps_indices: Matrix) -> Vector:
+        """Evaluate the function on a matrix of MPS indices, one row per point.
+
+        This is the method that subclasses implement. The number of
+        evaluations is recorded by the caller, so that it remains correct
+        when chunks of indices are evaluated concurrently.
+        """
+        ...
+
+    def __getitem__(self, mps_indices: Matrix) -> Vector:
+        if self._cache is None:
+            return self._evaluate_rows(mps_indices)
+        return self._cached_evaluate(np.asarray(mps_indices))
+
+    def __getstate__(self) -> dict:
+        # Copies sent to worker processes do not carry the cache or the pool
+        state = self.__dict__.copy()
+        state["_cache"] = None
+        state["_executor"] = None
+        return state
 
     def record_evaluations(self, n: int = 1) -> None:
         self.evals += n
 
+    def enable_cache(self, cache_size: int = 2**20) -> BlackBox:
+        """Memoize the evaluations of this black box.
+
+        TCI sweeps request heavily overlapping sets of indices, which are
+        then taken from the cache instead of calling `func` again. The
+        cache keeps at most `cache_size` points, discarding the least
+        recently used ones first. Each point costs one key of one byte per
+        site (for physical dimensions up to 256) and one value. The number
+        of rows found in the cache and of rows that had to be evaluated is
+        tracked in `cache_hits` and `cache_misses`. A `cache_size` of 0
+        disables and clears the cache.
+
+        Parameters
+        ----------
+        cache_size : int, default = 2**20
+            Maximum number of points kept in the cache.
+
+        Returns
+        -------
+        BlackBox
+            This same object, for convenience.
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.cache_size = cache_size
+        if cache_size == 0:
+            self._cache = None
+        else:
+            if self._cache is None:
+                self._cache = OrderedDict()
+            self._evict()
+        return self
+
+    @contextmanager
+    def parallel_evaluation(
+        self,
+        executor: Executor | str | None = "thread",
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[BlackBox]:
+        """Evaluate batches of indices concurrently within a `with` block.
+
+        Every batch of indices requested from the black box is split into
+        chunks of consecutive rows that are evaluated concurrently, and
+        whose values are reassembled in the order of the rows.
+
+        Parameters
+        ----------
+        executor : Executor | str | None, default = "thread"
+            Either an existing :class:`concurrent.futures.Executor`, or one
+            of "thread" or "process" to create a thread or process pool for
+            the duration of the block, or "asyncio" to run the chunks as
+            concurrent tasks of an event loop. In the latter case, `func`
+            must be a coroutine function. If an event loop is already running
+            in this thread (e.g. in Jupyter), the tasks run on a new event
+            loop in a helper thread, and the running loop is blocked until
+            each batch is evaluated. With "process", the black box
+            must be picklable, which excludes lambdas and local functions.
+            `None` evaluates serially.
+        max_workers : int | None, default = None
+            Number of workers of the pool. Defaults to `os.cpu_count()`.
+        chunk_size : int | None, default = None
+            Number of rows per chunk. By default, each batch is split
+            evenly into `max_workers` chunks.
+
+        Yields
+        ------
+        BlackBox
+            This same object.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        pool: Executor | None = None
+        if executor == "thread":
+            executor = pool = ThreadPoolExecutor(max_workers)
+        elif executor == "process":
+            executor = pool = ProcessPoolExecutor(max_workers)
+        elif isinstance(executor, str) and executor != "asyncio":
+            raise Exception(f'Unknown black-box executor "{executor}"')
+        previous = (self._executor, self._chunk_size, self._max_workers)
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self._max_workers = max_workers
+        try:
+            yield self
+        finally:
+            self._executor, self._chunk_size, self._max_workers = previous
+            if pool is not None:
+                pool.shutdown()
+
+    def _evaluate_rows(self, mps_indices: Matrix) -> Vector:
+        """Evaluate rows of indices, dispatching chunks to the executor."""
+        self.record_evaluations(len(mps_indices))
+        executor = self._executor
+        n = len(mps_indices)
+        if executor is None or n == 0:
+            return self.evaluate(mps_indices)
+        step = max(self._chunk_size or -(-n // self._max_workers), 1)
+        chunks = [mps_indices[i : i + step] for i in range(0, n, step)]
+        if executor == "asyncio":
+            values = _run_evaluations(self.evaluate, chunks)
+        elif len(chunks) == 1:
+            values = [self.evaluate(mps_indices)]
+        else:
+            assert isinstance(executor, Executor)
+            values = list(executor.map(self.evaluate, chunks))
+        return np.concatenate([np.asarray(v).reshape(-1) for v in values])
+
+    def _packed_rows(self, mps_indices: Matrix) -> list[bytes]:
+        """Pack each row of indices into a compact bytes key."""
+        dtype = np.min_scalar_type(max(self.physical_dimensions) - 1)
+        rows = np.ascontiguousarray(mps_indices, dtype=dtype)
+        rows = rows.reshape(len(rows), -1)
+        return (
+            rows.view(np.dtype((np.void, rows.itemsize * rows.shape[1])))
+            .reshape(-1)
+            .tolist()
+        )
+
+    def _cached_evaluate(self, mps_indices: Matrix) -> Vector:
+        cache = self._cache
+        assert cache is not None
+        keys = self._packed_rows(mps_indices)
+        missing: dict[bytes, int] = {}
+        for row, key in enumerate(keys):
+            if key in cache:
+                cache.move_to_end(key)
+            elif key not in missing:
+                missing[key] = row
+        self.cache_hits += len(keys) - len(missing)
+        self.cache_misses += len(missing)
+        if missing:
+            values = self._evaluate_rows(mps_indices[list(missing.values())])
+            cache.update(zip(missing, values))
+        output = np.array([cache[key] for key in keys])
+        self._evict()
+        return output
+
+    def _evict(self) -> None:
+        cache = self._cache
+        if cache is not None:
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+
+def _run_evaluations(evaluate: Callable, chunks: list[Matrix]) -> list[Vector]:
+    """Run `evaluate` on all chunks concurrently in an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_gather_evaluations(evaluate, chunks))
+    # asyncio.run() cannot be called from a running event loop, so the
+    # chunks are evaluated by a new event loop in a helper thread.
+    with ThreadPoolExecutor(1) as helper:
+        return helper.submit(
+            lambda: asyncio.run(_gather_evaluations(evaluate, chunks))
+        ).result()
+
+
+async def _gather_evaluations(evaluate: Callable, chunks: list[Matrix]) -> list[Vector]:
+    """Run `evaluate` on all chunks as concurrent tasks of the event loop."""
+
+    async def run(chunk: Matrix) -> Vector:
+        values = evaluate(chunk)
+        return await values if inspect.isawaitable(values) else values
+
+    return await asyncio.gather(*(run(chunk) for chunk in chunks))
+
 
 class BlackBoxLoadMPS(BlackBox):
     """
@@ -91,6 +299,7 @@ class BlackBoxLoadMPS(BlackBox):
 
     mesh: Mesh
     map_matrix: Matrix | None
+    mapper: MeshIndexMapper
 
     def __init__(
         self,
@@ -105,13 +314,10 @@ class BlackBoxLoadMPS(BlackBox):
         super().__init__(func, physical_dimensions)
         self.mesh = mesh
         self.map_matrix = map_matrix
+        self.mapper = MeshIndexMapper(map_matrix, mesh)
 
-    def __getitem__(self, mps_indices: Matrix) -> Vector:
-        self.record_evaluations(len(mps_indices))
-        mesh_indices = (
-            mps_indices if self.map_matrix is None else mps_indices @ self.map_matrix
-        )
-        coordinates = self.mesh[mesh_indices]
+    def evaluate(self, mps_indices: Matrix) -> Vector:
+        coordinates = self.mapper.coordinates(mps_indices)
         # Transpose because of opposite conventions for mesh (dimension index last)
         # and cross (dimension index first).
         return self.func(coordinates.T)  # type: ignore
@@ -199,8 +405,7 @@ class BlackBoxLoadMPO(BlackBox):
             [s * base_mpo + s for s in range(base_mpo)] if self.is_diagonal else None
         )
 
-    def __getitem__(self, mps_indices: np.ndarray) -> np.ndarray:
-        self.record_evaluations(len(mps_indices))
+    def evaluate(self, mps_indices: np.ndarray) -> np.ndarray:
         row_indices = (mps_indices // self.base_mpo) @ self.map_matrix
         col_indices = (mps_indices % self.base_mpo) @ self.map_matrix
         mesh_indices = np.hstack((row_indices, col_indices))
@@ -256,8 +461,7 @@ class BlackBoxComposeMPS(BlackBox):
         super().__init__(func, physical_dimensions)
         self.mps_list = mps_list
 
-    def __getitem__(self, mps_indices: Matrix) -> Vector:
-        self.record_evaluations(len(mps_indices))
+    def evaluate(self, mps_indices: Matrix) -> Vector:
         mps_values = []
         for mps in self.mps_list:
             mps_values.append(evaluate_mps(mps, mps_indices))
@@ -6,12 +6,14 @@ import numpy as np
 import scipy
 import dataclasses
 import functools
+import warnings
+from concurrent.futures import Executor
 from typing import TypeAlias
 
 from ...state import MPS
 from ...tools import SEED, Logger, make_logger
 from ...typing import Vector, Matrix, Tensor3, Tensor4, Natural
-from ..evaluation import random_mps_indices, evaluate_mps
+from ..evaluation import random_mps_indices, evaluate_mps_prefixes
 from .black_box import BlackBox
 
 
@@ -28,6 +30,10 @@ class CrossStrategy:
     rng: np.random.Generator = dataclasses.field(
         default_factory=lambda: np.random.default_rng(SEED)
     )
+    executor: Executor | str | None = None
+    max_workers: Natural | None = None
+    chunk_size: Natural | None = None
+    reuse_pivots: bool = True
     """
     Abstract dataclass containing the base parameters for tensor cross interpolation.
 
@@ -55,6 +61,20 @@ class CrossStrategy:
         Maximum number of evaluations allowed.
     rng : np.random.Generator, default=`numpy.random.default_rng(seemps.tools.SEED)`
         Random number generator used to initialize the algorithm and sample the error.
+    executor : Executor | str | None, default=None
+        Backend used to evaluate the black-box function concurrently: an existing
+        `concurrent.futures.Executor`, "thread", "process" or "asyncio" (see
+        :meth:`~seemps.analysis.cross.black_box.BlackBox.parallel_evaluation`).
+        If None, the function is evaluated serially on the calling thread.
+    max_workers : Natural | None, default=None
+        Number of workers for the executor. If None, uses the number of CPUs.
+    chunk_size : Natural | None, default=None
+        Number of indices per concurrent task. If None, each batch of indices is
+        split evenly among the workers.
+    reuse_pivots : bool, default=True
+        Whether the maxvol-based variants (DMRG and Maxvol) start each maxvol
+        decomposition from the pivots found at the same bond in the previous
+        sweep, instead of a full LU decomposition.
     """
 
     def __post_init__(self) -> None:
@@ -80,6 +100,7 @@ class CrossInterpolation:
     information.
     """
 
+    strategy: CrossStrategy
     black_box: BlackBox
     sites: int
     I_l: list[np.ndarray]
@@ -161,6 +182,37 @@ class CrossInterpolation:
             return functools.reduce(cartesian_row, indices)
         return functools.reduce(cartesian_column, indices)
 
+    @staticmethod
+    def locate_pivots(
+        pivots: IndexMatrix, candidates: IndexMatrix, rank: int
+    ) -> IndexVector | None:
+        """
+        Returns the positions within `candidates` of the first `rank` rows of
+        `pivots`, to warm-start the maxvol decomposition with the pivots of the
+        previous sweep. Returns None if there are not enough pivots or some of
+        them are no longer among the candidates.
+        """
+        if len(pivots) < rank or pivots.shape[1] != candidates.shape[1]:
+            return None
+        dtype = np.dtype((np.void, candidates.dtype.itemsize * candidates.shape[1]))
+        rows = np.ascontiguousarray(candidates).view(dtype).reshape(-1).tolist()
+        position = {row: i for i, row in enumerate(rows)}
+        keys = np.ascontiguousarray(pivots[:rank], dtype=candidates.dtype)
+        try:
+            return np.array(
+                [position[row] for row in keys.view(dtype).reshape(-1).tolist()]
+            )
+        except KeyError:
+            return None
+
+    def _initial_pivots(
+        self, pivots: IndexMatrix, candidates: IndexMatrix, rank: int
+    ) -> IndexVector | None:
+        """Pivots to warm-start maxvol with, if `reuse_pivots` is enabled."""
+        if not self.strategy.reuse_pivots:
+            return None
+        return self.locate_pivots(pivots, candidates, rank)
+
     @staticmethod
     def points_to_indices(points: Matrix) -> tuple[list[Matrix], list[Matrix]]:
         if points.ndim == 1:
@@ -288,7 +340,7 @@ class CrossError:
             )
             self.black_box_evals = cross.black_box[self.mps_indices].reshape(-1)
             self.norm = self.lp_distance(self.black_box_evals)
-        mps_evals = evaluate_mps(cross.mps, self.mps_indices)
+        mps_evals = evaluate_mps_prefixes(cross.mps, self.mps_indices)
         error = self.lp_distance(mps_evals - self.black_box_evals)
         return error / self.norm if self.error_relative else error
 
@@ -344,6 +396,7 @@ def maxvol_square(
     A: Matrix,
     max_iter: int = 10,
     tol: float = 1.05,
+    initial: IndexVector | None = None,
 ) -> tuple[Matrix, Matrix]:
     """
     Returns the row indices I of a tall matrix A of size (n x r) with n > r that give place
@@ -358,6 +411,12 @@ def maxvol_square(
         Maximum number of iterations allowed.
     tol : float, default=1.1
         Sensibility of the algorithm.
+    initial : np.ndarray | None, default=None
+        Optional r row indices from which to start the search, such as the
+        pivots of a previous sweep. The coefficients are then obtained by
+        factorizing only the (r x r) submatrix A[initial, :], and the pivots
+        are refined by rank-1 updates. If this submatrix is numerically
+        singular, the search starts from a full LU decomposition of A.
 
     Returns
     -------
@@ -370,12 +429,16 @@ def maxvol_square(
     if n <= r:
         I, B = np.arange(n, dtype=int), np.eye(n)
         return I, B
-    P, L, U = scipy.linalg.lu(A)
-    I = P[:, :r].argmax(axis=0)
-    Q = scipy.linalg.solve_triangular(U, A.T, trans=1)
-    B = scipy.linalg.solve_triangular(
-        L[:r, :], Q, trans=1, unit_diagonal=True, lower=True
-    ).T
+    start = None if initial is None else _maxvol_warm_start(A, initial)
+    if start is None:
+        P, L, U = scipy.linalg.lu(A)
+        I = P[:, :r].argmax(axis=0)
+        Q = scipy.linalg.solve_triangular(U, A.T, trans=1)
+        B = scipy.linalg.solve_triangular(
+            L[:r, :], Q, trans=1, unit_diagonal=True, lower=True
+        ).T
+    else:
+        I, B = start
     for _ in range(max_iter):
         i, j = np.divmod(abs(B).argmax(), r)
         if abs(B[i, j]) <= tol:
@@ -388,6 +451,21 @@ def maxvol_square(
     return I, B
 
 
+def _maxvol_warm_start(A: Matrix, I: IndexVector) -> tuple[Matrix, Matrix] | None:
+    """Coefficients B such that A = B A[I, :], or None if A[I, :] is singular."""
+    r = A.shape[1]
+    if len(I) != r or len(np.unique(I)) != r:
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+        lu, piv = scipy.linalg.lu_factor(A[I, :], check_finite=False)
+    diagonal = np.abs(np.diag(lu))
+    if not diagonal.min() > r * np.finfo(lu.dtype).eps * diagonal.max():
+        return None
+    B = scipy.linalg.lu_solve((lu, piv), A.T, trans=1, check_finite=False).T
+    return np.array(I, dtype=int), B
+
+
 def cross_interpolation(
     cross_strategy: CrossStrategy,
     black_box: BlackBox,
@@ -420,7 +498,14 @@ def cross_interpolation(
     error_calculator = CrossError(cross_strategy)
 
     converged = False
-    with make_logger(1) as logger:
+    with (
+        make_logger(1) as logger,
+        black_box.parallel_evaluation(
+            cross_strategy.executor,
+            cross_strategy.max_workers,
+            cross_strategy.chunk_size,
+        ),
+    ):
         results = CrossResults(cross.mps)
         for i in range(cross_strategy.range_iters[1] // 2):
             # Left-to-right half sweep
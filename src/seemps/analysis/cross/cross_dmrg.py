@@ -80,12 +80,14 @@ class CrossInterpolationDMRG(CrossInterpolation):
                 Q, _ = scipy.linalg.qr(
                     C, mode="economic", overwrite_a=True, check_finite=False
                 )  # type: ignore
+                candidates = self.combine_indices(self.I_l[k], self.I_s[k])
                 I, G = maxvol_square(
                     Q,
                     cross_strategy.maxiter_maxvol,
                     cross_strategy.tol_maxvol_square,  # type: ignore
+                    self._initial_pivots(self.I_l[k + 1], candidates, r),
                 )
-                self.I_l[k + 1] = self.combine_indices(self.I_l[k], self.I_s[k])[I]
+                self.I_l[k + 1] = candidates[I]
                 self.mps[k] = G.reshape(r_l, s1, r)
             else:
                 self.mps[k] = U.reshape(r_l, s1, r)
@@ -97,12 +99,14 @@ class CrossInterpolationDMRG(CrossInterpolation):
                 Q, _ = scipy.linalg.qr(
                     R.T, mode="economic", overwrite_a=True, check_finite=False
                 )  # type: ignore
+                candidates = self.combine_indices(self.I_s[k + 1], self.I_g[k + 1])
                 I, G = maxvol_square(
                     Q,
                     cross_strategy.maxiter_maxvol,
                     cross_strategy.tol_maxvol_square,  # type: ignore
+                    self._initial_pivots(self.I_g[k], candidates, r),
                 )
-                self.I_g[k] = self.combine_indices(self.I_s[k + 1], self.I_g[k + 1])[I]
+                self.I_g[k] = candidates[I]
                 self.mps[k + 1] = (G.T).reshape(r, s2, r_g)
             else:
                 self.mps[k] = (U @ S).reshape(r_l, s1, r)
@@ -68,17 +68,20 @@ class CrossInterpolationMaxvol(CrossInterpolation):
             Q, _ = scipy.linalg.qr(
                 C, mode="economic", overwrite_a=True, check_finite=False
             )  # type: ignore
+            candidates = self.combine_indices(self.I_l[k], self.I_s[k], row_major=True)
+            initial = None
+            if k < self.sites - 1:
+                initial = self._initial_pivots(self.I_l[k + 1], candidates, r_g)
             I, _ = _choose_maxvol(
                 Q,  # type: ignore
                 cross_strategy.rank_kick,
                 cross_strategy.max_iters_maxvol,
                 cross_strategy.tol_maxvol_square,
                 cross_strategy.tol_maxvol_rect,
+                initial,
             )
             if k < self.sites - 1:
-                self.I_l[k + 1] = self.combine_indices(
-                    self.I_l[k], self.I_s[k], row_major=True
-                )[I]
+                self.I_l[k + 1] = candidates[I]
 
         else:
             if k > 0:
@@ -86,17 +89,19 @@ class CrossInterpolationMaxvol(CrossInterpolation):
                 Q, _ = scipy.linalg.qr(
                     R.T, mode="economic", overwrite_a=True, check_finite=False
                 )  # type: ignore
+                candidates = self.combine_indices(
+                    self.I_s[k], self.I_g[k], row_major=True
+                )
                 I, G = _choose_maxvol(
                     Q,  # type: ignore
                     cross_strategy.rank_kick,
                     cross_strategy.max_iters_maxvol,
                     cross_strategy.tol_maxvol_square,
                     cross_strategy.tol_maxvol_rect,
+                    self._initial_pivots(self.I_g[k - 1], candidates, r_l),
                 )
                 self.mps[k] = (G.T).reshape(-1, s, r_g, order="F")
-                self.I_g[k - 1] = self.combine_indices(
-                    self.I_s[k], self.I_g[k], row_major=True
-                )[I]
+                self.I_g[k - 1] = candidates[I]
             else:
                 self.mps[0] = fiber
 
@@ -136,6 +141,7 @@ def _choose_maxvol(
     max_iter: int,
     tol: float,
     tol_rect: float,
+    initial: np.ndarray | None = None,
 ) -> tuple[Matrix, Matrix]:
     n, r = A.shape
     min_kick, max_kick = rank_kick
@@ -144,9 +150,11 @@ def _choose_maxvol(
     if n <= r:
         I, B = np.arange(n, dtype=int), np.eye(n)
     elif rank_kick == 0:
-        I, B = maxvol_square(A, max_iter, tol)
+        I, B = maxvol_square(A, max_iter, tol, initial)
     else:
-        I, B = maxvol_rectangular(A, (min_kick, max_kick), max_iter, tol, tol_rect)
+        I, B = maxvol_rectangular(
+            A, (min_kick, max_kick), max_iter, tol, tol_rect, initial
+        )
     return I, B
 
 
@@ -156,6 +164,7 @@ def maxvol_rectangular(
     max_iter: int = 10,
     tol: float = 1.05,
     tol_rect: float = 1.05,
+    initial: np.ndarray | None = None,
 ) -> tuple[Matrix, Matrix]:
     # TODO: Add a docstring
     n, r = A.shape
@@ -163,7 +172,7 @@ def maxvol_rectangular(
     max_rank = min(r + rank_kick[1], n)
     if min_rank < r or min_rank > max_rank or max_rank > n:
         raise ValueError("Invalid minimum/maximum number of added rows")
-    I0, B = maxvol_square(A, max_iter, tol)
+    I0, B = maxvol_square(A, max_iter, tol, initial)
     I = np.hstack([I0, np.zeros(max_rank - r, dtype=I0.dtype)])
     S = np.ones(n, dtype=int)
     S[I0] = 0
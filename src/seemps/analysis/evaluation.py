@@ -1,8 +1,13 @@
 from __future__ import annotations
+from collections.abc import Iterable, Iterator
 import numpy as np
 from ..tools import DEFAULT_RNG
 from ..state import MPS
 from ..typing import Vector, Matrix
+from .mesh import Mesh, MeshIndexMapper
+
+#: Default number of index rows evaluated together by the streaming evaluators.
+DEFAULT_CHUNK_SIZE: int = 2**16
 
 
 def evaluate_mps(mps: MPS, mps_indices: Matrix) -> Vector:
@@ -31,6 +36,159 @@ def evaluate_mps(mps: MPS, mps_indices: Matrix) -> Vector:
     return A.reshape(-1)
 
 
+def _evaluate_prefix_tree(mps: MPS, mps_indices: Matrix) -> Vector:
+    """Contract the MPS along a set of indices, sharing common prefixes.
+
+    The rows of `mps_indices` are organized as the leaves of a trie. At
+    each site, the distinct prefixes ``(i_0, ..., i_k)`` are the nodes
+    of the current level, and only those are contracted with the MPS,
+    grouping them by their last physical index so that each group is a
+    single matrix product.
+    """
+    n = mps_indices.shape[0]
+    dtype = np.result_type(*[A.dtype for A in mps])
+    vectors = np.ones((1, 1), dtype=dtype)
+    node = np.zeros(n, dtype=np.intp)
+    for k, A in enumerate(mps):
+        d = A.shape[1]
+        keys, node = np.unique(node * d + mps_indices[:, k], return_inverse=True)
+        parent, index = np.divmod(keys, d)
+        # `keys` is sorted, so each parent's children are contiguous and
+        # the children with a given physical index are found by masking.
+        new_vectors = np.empty((keys.size, A.shape[2]), dtype=dtype)
+        for i in np.unique(index):
+            mask = index == i
+            new_vectors[mask] = vectors[parent[mask]] @ A[:, i, :]
+        vectors = new_vectors
+    return vectors[node, 0]
+
+
+def evaluate_mps_prefixes(
+    mps: MPS, mps_indices: Matrix, chunk_size: int | None = DEFAULT_CHUNK_SIZE
+) -> Vector:
+    """
+    Evaluates a collection of MPS indices, contracting shared prefixes once.
+
+    This produces the same values as :func:`evaluate_mps`, but the partial
+    products of index rows that share their leading indices are computed
+    only once, which is much cheaper for the heavily overlapping index sets
+    that appear in tensor cross interpolation or when sweeping a mesh. The
+    rows are processed in chunks of `chunk_size`, which bounds the memory
+    of the intermediate contractions.
+
+    Parameters
+    ----------
+    mps : MPS
+        The MPS to evaluate.
+    mps_indices : Matrix
+        An array of indices to be evaluated on the MPS.
+    chunk_size : int | None, default = DEFAULT_CHUNK_SIZE
+        Maximum number of rows contracted together. `None` processes all
+        rows at once.
+
+    Returns
+    -------
+    Vector
+        The vector of evaluations corresponding to the provided indices.
+    """
+    mps_indices = np.asarray(mps_indices)
+    if mps_indices.ndim == 1:
+        mps_indices = mps_indices.reshape(1, -1)
+    n = mps_indices.shape[0]
+    if chunk_size is None or n <= chunk_size:
+        return _evaluate_prefix_tree(mps, mps_indices)
+    return np.concatenate(list(evaluate_mps_stream(mps, mps_indices, chunk_size)))
+
+
+def evaluate_mps_stream(
+    mps: MPS,
+    mps_indices: Matrix | Iterable[Matrix],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Vector]:
+    """
+    Lazily evaluates an MPS over a stream of index rows.
+
+    Parameters
+    ----------
+    mps : MPS
+        The MPS to evaluate.
+    mps_indices : Matrix | Iterable[Matrix]
+        Either an array of indices, which is split into chunks of
+        `chunk_size` rows, or an iterable producing such arrays, which are
+        evaluated one at a time.
+    chunk_size : int, default = DEFAULT_CHUNK_SIZE
+        Number of rows per chunk when `mps_indices` is an array.
+
+    Yields
+    ------
+    Vector
+        The evaluations of each chunk, in the order of the input rows.
+    """
+    if isinstance(mps_indices, np.ndarray):
+        rows = mps_indices.reshape(1, -1) if mps_indices.ndim == 1 else mps_indices
+        chunks = (
+            rows[start : start + chunk_size]
+            for start in range(0, rows.shape[0], chunk_size)
+        )
+    else:
+        chunks = mps_indices
+    for chunk in chunks:
+        yield _evaluate_prefix_tree(mps, np.asarray(chunk))
+
+
+def iterate_mesh_indices(
+    mesh: Mesh, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Matrix]:
+    """
+    Iterates over all integer coordinates of a `Mesh` in chunks.
+
+    Points are produced in C (row-major) order, the same order as in
+    :meth:`Mesh.to_tensor`, as matrices of shape ``(chunk, mesh.dimension)``.
+    """
+    total = int(np.prod(mesh.dimensions))
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        yield np.stack(np.unravel_index(flat, mesh.dimensions), axis=-1)
+
+
+def evaluate_mesh_stream(
+    mps: MPS,
+    mesh: Mesh,
+    map_matrix: Matrix,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[Matrix, Vector]]:
+    """
+    Streams the values of an MPS over every point of a `Mesh`.
+
+    The mesh is traversed in C order in chunks of `chunk_size` points, so
+    that the full tensor is never held in memory. Consecutive points share
+    their most significant MPS indices, which makes the prefix-sharing
+    evaluation of :func:`evaluate_mps_prefixes` particularly effective.
+
+    Parameters
+    ----------
+    mps : MPS
+        The MPS encoding the function on the mesh.
+    mesh : Mesh
+        The mesh to traverse.
+    map_matrix : Matrix
+        Matrix relating MPS indices and mesh coordinates, as returned by
+        :func:`~seemps.analysis.mesh.mps_to_mesh_matrix`.
+    chunk_size : int, default = DEFAULT_CHUNK_SIZE
+        Number of mesh points evaluated together.
+
+    Yields
+    ------
+    tuple[Matrix, Vector]
+        The integer mesh coordinates of each chunk and the corresponding
+        values of the MPS.
+    """
+    mapper = MeshIndexMapper(map_matrix)
+    for mesh_indices in iterate_mesh_indices(mesh, chunk_size):
+        mps_indices = mapper.to_mps_indices(mesh_indices)
+        yield mesh_indices, _evaluate_prefix_tree(mps, mps_indices)
+
+
 def random_mps_indices(
     physical_dimensions: list[int],
     num_indices: int = 1000,
@@ -1,10 +1,12 @@
 from __future__ import annotations
+import math
 import numpy as np
-from typing import Callable
+import scipy.linalg  # type: ignore
+from typing import Callable, Literal, TypeAlias
 from abc import ABC, abstractmethod
 from ...state import MPS, MPSSum, CanonicalMPS, Strategy, DEFAULT_STRATEGY, simplify
 from ...operators import MPO, MPOList, MPOSum, simplify_mpo
-from ...typing import Vector
+from ...typing import Vector, Matrix
 from ...tools import make_logger
 from ..mesh import Interval
 from ..factories import mps_interval
@@ -12,6 +14,9 @@ from ..factories import mps_interval
 
 ScalarFunction = Callable[[Vector], float]
 
+#: Algorithms available to evaluate a :class:`PolynomialExpansion` on a MPS or MPO.
+ExpansionMethod: TypeAlias = Literal["clenshaw", "direct", "paterson-stockmeyer"]
+
 # TODO: Implement polynomial bases with unbounded orthogonality domains (e.g. Hermite with [-∞, ∞])
 
 
@@ -93,6 +98,7 @@ class PolynomialExpansion(ABC):
         clenshaw: bool = True,
         strategy: Strategy = DEFAULT_STRATEGY,
         rescale_argument: bool = True,
+        method: ExpansionMethod | None = None,
     ) -> MPS:
         """
         Construct the MPS representation of a composed function via a polynomial expansion.
@@ -101,9 +107,11 @@ class PolynomialExpansion(ABC):
         provided either as an `Interval` or an `MPS`, this method builds an MPS approximation
         of the composed function f(g(x)).
 
-        Evaluation can be performed either using the Clenshaw recurrence or by direct
-        polynomial recursion. If the polynomial family has a finite `orthogonality_domain`,
-        the argument is affinely mapped to that domain prior to evaluation.
+        Evaluation can be performed using the Clenshaw recurrence, by direct polynomial
+        recursion, or with the Paterson-Stockmeyer scheme, which replaces the `d` products of
+        MPS in the other methods by about `2√d` of them. If the polynomial family has a
+        finite `orthogonality_domain`, the argument is affinely mapped to that domain prior
+        to evaluation.
 
         Parameters
         ----------
@@ -116,6 +124,8 @@ class PolynomialExpansion(ABC):
         rescale_argument : bool, default=True
             Whether to rescale the argument to the orthogonality domain of the basis, if applicable.
             This utilizes the methods `rescale_mps` and `rescale_mpo` defined in the basis subclass.
+        method : {"clenshaw", "direct", "paterson-stockmeyer"}, optional
+            Algorithm used to evaluate the expansion. If given, it overrides `clenshaw`.
 
         Returns
         -------
@@ -123,7 +133,7 @@ class PolynomialExpansion(ABC):
             An MPS approximation of f(g(x)).
         """
         return _mps_polynomial_expansion(
-            self, argument, clenshaw, strategy, rescale_argument
+            self, argument, clenshaw, strategy, rescale_argument, method
         )
 
     def to_mpo(
@@ -132,6 +142,7 @@ class PolynomialExpansion(ABC):
         clenshaw: bool = True,
         strategy: Strategy = DEFAULT_STRATEGY,
         rescale_argument: bool = True,
+        method: ExpansionMethod | None = None,
     ) -> MPO:
         """
         Construct the MPO representation of a composed function via a polynomial expansion.
@@ -140,9 +151,11 @@ class PolynomialExpansion(ABC):
         provided either as an `MPO`, this method builds an MPO approximation of the composed
         function f(g(x)).
 
-        Evaluation can be performed either using the Clenshaw recurrence or by direct
-        polynomial recursion. If the polynomial family has a finite `orthogonality_domain`,
-        the argument is affinely mapped to that domain prior to evaluation.
+        Evaluation can be performed using the Clenshaw recurrence, by direct polynomial
+        recursion, or with the Paterson-Stockmeyer scheme, which replaces the `d` products of
+        MPO in the other methods by about `2√d` of them. If the polynomial family has a
+        finite `orthogonality_domain`, the argument is affinely mapped to that domain prior
+        to evaluation.
 
         Parameters
         ----------
@@ -155,6 +168,8 @@ class PolynomialExpansion(ABC):
         rescale_argument : bool, default=True
             Whether to rescale the argument to the orthogonality domain of the basis, if applicable.
             This utilizes the methods `rescale_mps` and `rescale_mpo` defined in the basis subclass.
+        method : {"clenshaw", "direct", "paterson-stockmeyer"}, optional
+            Algorithm used to evaluate the expansion. If given, it overrides `clenshaw`.
 
         Returns
         -------
@@ -162,7 +177,7 @@ class PolynomialExpansion(ABC):
             An MPO approximation of f(g(x)).
         """
         return _mpo_polynomial_expansion(
-            self, argument, clenshaw, strategy, rescale_argument
+            self, argument, clenshaw, strategy, rescale_argument, method
         )
 
 
@@ -194,7 +209,9 @@ def _mps_polynomial_expansion(
     clenshaw: bool = True,
     strategy: Strategy = DEFAULT_STRATEGY,
     rescale_argument: bool = True,
+    method: ExpansionMethod | None = None,
 ) -> MPS:
+    method = _expansion_method(clenshaw, method)
     logger = make_logger(2)
 
     if isinstance(argument, Interval):
@@ -219,7 +236,7 @@ def _mps_polynomial_expansion(
     d = len(c) - 1
     recurrences = [expansion.recurrence_coefficients(l) for l in range(d + 2)]
 
-    if clenshaw:
+    if method == "clenshaw":
         # Y_k = c_k I + (α_k X + β_k) Y_{k+1} - γ_{k+1} Y_{k+2}
         logger("MPS Clenshaw evaluation started")
         Y_kp1 = Y_kp2 = I_hat.zero_state()
@@ -250,7 +267,7 @@ def _mps_polynomial_expansion(
             states.append(Y_kp1)
         F = simplify(MPSSum(weights, states, check_args=False), strategy=strategy)
 
-    else:
+    elif method == "direct":
         # P_{k+1} = (α_{k} X + β_{k}) P_k - γ_k P_{k-1}
         # F_{k+1} = F_k + c_{k+1} P_{k+1}
         logger("MPS expansion (direct) started")
@@ -287,6 +304,73 @@ def _mps_polynomial_expansion(
             )
             P_km1, P_k = P_k, P_kp1
 
+    else:
+        # F = ∑_i R_i Q_i(G), where the giant step G = P_m(X) is the argument of the
+        # basis polynomials Q_i = P_i, and R_i = ∑_{j<m} a_ij P_j(X) are combinations
+        # of the baby steps P_0(X), ..., P_{m-1}(X). The sum is evaluated with the
+        # Clenshaw recurrence on G, with only O(√d) products of MPS:
+        # Y_i = R_i + (α_i G + β_i) Y_{i+1} - γ_{i+1} Y_{i+2}
+        logger("MPS Paterson-Stockmeyer evaluation started")
+        a = _paterson_stockmeyer_coefficients(expansion)
+        s, m = a.shape[0] - 1, a.shape[1]
+
+        # Baby steps P_0, P_1, ..., P_m
+        P = [norm_I * I_hat]
+        P.append(
+            simplify(
+                σ * norm_X * X_hat
+                if μ == 0  # Avoid zero branch when μ == 0
+                else MPSSum([σ * norm_X, μ * norm_I], [X_hat, I_hat], check_args=False),
+                strategy=strategy,
+            )
+        )
+        for k in range(1, m):
+            α_k, β_k, γ_k = recurrences[k]
+            weights = [α_k * norm_X, -γ_k]
+            states = [X_hat * P[k], P[k - 1]]
+            if β_k != 0:
+                weights.append(β_k)
+                states.append(P[k])
+            P.append(
+                simplify(MPSSum(weights, states, check_args=False), strategy=strategy)
+            )
+        norm_G = P[m].norm()
+        G_hat = CanonicalMPS(P[m], center=0, normalize=True, strategy=strategy)
+        R = [
+            simplify(MPSSum(list(a_i), P[:m], check_args=False), strategy=strategy)
+            for a_i in a
+        ]
+        logger(
+            f"MPS Paterson-Stockmeyer baby steps m={m}, giant steps s={s}, maxbond={G_hat.max_bond_dimension()}"
+        )
+
+        # Backward recursion: i = s, s-1, ..., 1
+        Y_kp1 = Y_kp2 = I_hat.zero_state()
+        for k in range(s, 0, -1):
+            α_k, β_k, _ = recurrences[k]
+            _, _, γ_kp1 = recurrences[k + 1]
+
+            weights = [1.0, α_k * norm_G, -γ_kp1]
+            states = [R[k], G_hat * Y_kp1, Y_kp2]
+            if β_k != 0:
+                weights.append(β_k)
+                states.append(Y_kp1)
+
+            Y_k = simplify(MPSSum(weights, states, check_args=False), strategy=strategy)
+            logger(
+                f"MPS Paterson-Stockmeyer step {k + 1}/{s + 1}, maxbond={Y_k.max_bond_dimension()}, error={Y_k.error():6e}"
+            )
+            Y_kp2, Y_kp1 = Y_kp1, Y_k
+
+        # F = R_0 + (σ G + μ) * Y_1 - γ_1 Y_2
+        _, _, γ_1 = recurrences[1]
+        weights = [1.0, σ * norm_G, -γ_1]
+        states = [R[0], G_hat * Y_kp1, Y_kp2]
+        if μ != 0:
+            weights.append(μ)
+            states.append(Y_kp1)
+        F = simplify(MPSSum(weights, states, check_args=False), strategy=strategy)
+
     logger.close()
     return F
 
@@ -297,7 +381,9 @@ def _mpo_polynomial_expansion(
     clenshaw: bool = True,
     strategy: Strategy = DEFAULT_STRATEGY,
     rescale_argument: bool = True,
+    method: ExpansionMethod | None = None,
 ) -> MPO:
+    method = _expansion_method(clenshaw, method)
     logger = make_logger(2)
 
     X = expansion.rescale_mpo(argument) if rescale_argument else argument
@@ -310,7 +396,7 @@ def _mpo_polynomial_expansion(
     recurrences = [expansion.recurrence_coefficients(l) for l in range(d + 2)]
 
     mpos: list[MPO | MPOList]
-    if clenshaw:
+    if method == "clenshaw":
         # Y_k = c_k I + (α_k X + β_k) y_{k+1} - γ_{k+1} Y_{k+2}
         logger("MPO Clenshaw evaluation started")
         Y_kp1 = Y_kp2 = MPO([np.zeros((1, 2, 2, 1))] * len(X))
@@ -340,7 +426,7 @@ def _mpo_polynomial_expansion(
             mpos.append(Y_kp1)
         F = simplify_mpo(MPOSum(mpos, weights), strategy=strategy)
 
-    else:
+    elif method == "direct":
         # P_{k+1} = (α_{k} X + β_{k}) P_k - γ_k P_{k-1}
         # F_{k+1} = F_k + c_{k+1} P_{k+1}
         logger("MPO expansion (direct) started")
@@ -368,5 +454,117 @@ def _mpo_polynomial_expansion(
             )
             P_km1, P_k = P_k, P_kp1
 
+    else:
+        # F = ∑_i R_i Q_i(G), with the same decomposition as in the MPS case
+        logger("MPO Paterson-Stockmeyer evaluation started")
+        a = _paterson_stockmeyer_coefficients(expansion)
+        s, m = a.shape[0] - 1, a.shape[1]
+
+        # Baby steps P_0, P_1, ..., P_m
+        P = [I, simplify_mpo(MPOSum(weights=[σ, μ], mpos=[X, I]), strategy=strategy)]
+        for k in range(1, m):
+            α_k, β_k, γ_k = recurrences[k]
+            weights = [α_k, -γ_k]
+            mpos = [MPOList([X, P[k]]), P[k - 1]]
+            if β_k != 0:
+                weights.append(β_k)
+                mpos.append(P[k])
+            P.append(simplify_mpo(MPOSum(mpos, weights), strategy=strategy))
+        G = P[m]
+        R = [simplify_mpo(MPOSum(P[:m], list(a_i)), strategy=strategy) for a_i in a]
+        logger(
+            f"MPO Paterson-Stockmeyer baby steps m={m}, giant steps s={s}, maxbond={G.max_bond_dimension()}"
+        )
+
+        # Backward recursion: i = s, s-1, ..., 1
+        Y_kp1 = Y_kp2 = MPO([np.zeros((1, 2, 2, 1))] * len(X))
+        for k in range(s, 0, -1):
+            α_k, β_k, _ = recurrences[k]
+            _, _, γ_kp1 = recurrences[k + 1]
+
+            weights = [1.0, α_k, -γ_kp1]
+            mpos = [R[k], MPOList([G, Y_kp1]), Y_kp2]
+            if β_k != 0:
+                weights.append(β_k)
+                mpos.append(Y_kp1)
+            Y_k = simplify_mpo(MPOSum(mpos, weights), strategy=strategy)
+            logger(
+                f"MPO Paterson-Stockmeyer step {k + 1}/{s + 1}, maxbond={Y_k.max_bond_dimension()}"
+            )
+            Y_kp2, Y_kp1 = Y_kp1, Y_k
+
+        # F = R_0 + (σ G + μ) * Y_1 - γ_1 Y_2
+        _, _, γ_1 = recurrences[1]
+        weights = [1.0, σ, -γ_1]
+        mpos = [R[0], MPOList([G, Y_kp1]), Y_kp2]
+        if μ != 0:
+            weights.append(μ)
+            mpos.append(Y_kp1)
+        F = simplify_mpo(MPOSum(mpos, weights), strategy=strategy)
+
     logger.close()
     return F
+
+
+def _expansion_method(
+    clenshaw: bool, method: ExpansionMethod | None
+) -> ExpansionMethod:
+    if method is None:
+        return "clenshaw" if clenshaw else "direct"
+    if method not in ("clenshaw", "direct", "paterson-stockmeyer"):
+        raise Exception(f'Unknown polynomial expansion method "{method}"')
+    return method
+
+
+def _paterson_stockmeyer_coefficients(expansion: PolynomialExpansion) -> Matrix:
+    """
+    Return the coefficients `a` of the decomposition
+
+        f(x) = ∑_{i=0}^s R_i(x) P_i(P_m(x)),   R_i(x) = ∑_{j=0}^{m-1} a[i, j] P_j(x),
+
+    of a polynomial expansion of degree `d`, using `m ≈ √d` baby steps. The
+    products P_j(x) P_i(P_m(x)) have degree `i m + j`, so that the coefficients
+    follow from a triangular system in the basis {P_k}, built with the matrix
+    that represents the multiplication by `x` in that basis. The system is well
+    conditioned for Chebyshev polynomials, but the coefficients may grow for
+    other bases when the expansion coefficients do not decay.
+    """
+    c = np.asarray(expansion.coefficients)
+    d = len(c) - 1
+    m = max(1, math.isqrt(d))
+    s = d // m
+    σ, μ = expansion.affine_fix
+    recurrences = [expansion.recurrence_coefficients(k) for k in range(d + 1)]
+
+    # x P_0 = (P_1 - μ P_0) / σ and x P_k = (P_{k+1} - β_k P_k + γ_k P_{k-1}) / α_k,
+    # truncated to polynomials of degree d.
+    Id = np.eye(d + 1)
+    J = np.zeros((d + 1, d + 1))
+    J[0, 0] = -μ / σ
+    if d > 0:
+        J[1, 0] = 1 / σ
+    for k in range(1, d + 1):
+        α_k, β_k, γ_k = recurrences[k]
+        J[k, k] = -β_k / α_k
+        J[k - 1, k] = γ_k / α_k
+        if k < d:
+            J[k + 1, k] = 1 / α_k
+
+    # Giant step G = P_m(J). Truncation does not affect the products of degree <= d.
+    G_km1, G = Id, σ * J + μ * Id
+    for k in range(1, m):
+        α_k, β_k, γ_k = recurrences[k]
+        G_km1, G = G, α_k * (J @ G) + β_k * G - γ_k * G_km1
+
+    # Columns P_i(G) P_j, of degree i m + j, sorted by increasing degree.
+    Q_km1, Q_k = Id[:, :m], σ * (G @ Id[:, :m]) + μ * Id[:, :m]
+    columns = [Q_km1, Q_k]
+    for k in range(1, s):
+        α_k, β_k, γ_k = recurrences[k]
+        Q_km1, Q_k = Q_k, α_k * (G @ Q_k) + β_k * Q_k - γ_k * Q_km1
+        columns.append(Q_k)
+    M = np.hstack(columns)[:, : d + 1]
+
+    a = scipy.linalg.solve_triangular(M, c, lower=False)
+    a = np.concatenate([a, np.zeros((s + 1) * m - (d + 1), dtype=a.dtype)])
+    return a.reshape(s + 1, m)
@@ -435,20 +435,177 @@ def mesh_to_mps_indices(mesh_indices: Matrix, map_matrix: Matrix) -> Matrix:
     to MPS indices is therefore constructed here algorithmically by decomposing mesh indices into
     their quantized components.
     """
-    if not (mesh_indices.shape[1] == map_matrix.shape[1]):
-        raise ValueError("Invalid dimensions")
-
-    K = mesh_indices.shape[0]
-    n, m = map_matrix.shape
-    mps_indices = np.zeros((K, n), dtype=int)
-    for dim in range(m):
-        rows = np.where(map_matrix[:, dim] != 0)[0]
-        weights = map_matrix[rows, dim]
-        col = mesh_indices[:, dim].copy()
-        for r, w in zip(rows, weights):
-            mps_indices[:, r] = col // w
-            col = col % w
-    return mps_indices
+    return MeshIndexMapper(map_matrix).to_mps_indices(mesh_indices)
+
+
+class MeshIndexMapper:
+    """
+    Precomputed mapping between MPS indices, mesh indices and mesh coordinates.
+
+    The transformation matrix of :func:`mps_to_mesh_matrix`, possibly permuted
+    with :func:`interleaving_permutation`, is analyzed once and converted into
+    integer tables. MPS indices are mapped to mesh indices with an integer
+    product by the table of weights, and mesh indices are decomposed back into
+    MPS indices with bit shifts and masks when all weights are powers of two.
+
+    If a `mesh` is given, :meth:`coordinates` maps MPS indices directly to
+    points of the mesh, skipping the validation of :class:`Interval` indices,
+    which are correct by construction. Points of a :class:`RegularInterval` or
+    :class:`IntegerInterval` are computed with their affine formula, while
+    those of a :class:`ChebyshevInterval` are read from a precomputed lookup
+    table, avoiding the evaluation of trigonometric functions.
+
+    Parameters
+    ----------
+    map_matrix : Matrix | None
+        Integer matrix of shape (n, m) relating `n` MPS sites and `m` mesh
+        dimensions. If None, MPS indices are taken as mesh indices.
+    mesh : Mesh, optional
+        The mesh whose coordinates are computed by :meth:`coordinates`.
+    max_table_size : int, default = 2**20
+        Largest interval for which a lookup table of its points is stored.
+        Larger intervals are evaluated through :meth:`Interval.__getitem__`.
+
+    Attributes
+    ----------
+    weights : Matrix | None
+        Integer version of `map_matrix`.
+    mesh : Mesh | None
+        The supplied mesh.
+    tables : list[Vector | None]
+        Lookup tables of the points along each dimension of the mesh.
+    """
+
+    weights: NDArray[np.int64] | None
+    mesh: Mesh | None
+    tables: list[Vector | None]
+    _digits: list[tuple[int, int, int, int]] | None
+    _rows: list[tuple[NDArray[np.intp], NDArray[np.int64]]]
+
+    def __init__(
+        self,
+        map_matrix: Matrix | None,
+        mesh: Mesh | None = None,
+        max_table_size: int = 2**20,
+    ):
+        self.mesh = mesh
+        self.tables = (
+            []
+            if mesh is None
+            else [_interval_table(i, max_table_size) for i in mesh.intervals]
+        )
+        self._rows = []
+        self._digits = None
+        if map_matrix is None:
+            self.weights = None
+            return
+        map_matrix = np.asarray(map_matrix)
+        weights = map_matrix.astype(np.int64)
+        if not np.array_equal(weights, map_matrix) or np.any(weights < 0):
+            raise ValueError("The map matrix must have non-negative integer entries")
+        if mesh is not None and weights.shape[1] != mesh.dimension:
+            raise ValueError("The map matrix does not match the mesh dimension")
+        self.weights = weights
+
+        # For each dimension, the sites that contribute to it, sorted by
+        # decreasing weight, which is the order in which they are decoded.
+        for dim in range(weights.shape[1]):
+            rows = np.nonzero(weights[:, dim])[0]
+            rows = rows[np.argsort(-weights[rows, dim], kind="stable")]
+            self._rows.append((rows, weights[rows, dim]))
+
+        # If all weights are powers of two, each digit is (x >> shift) & mask,
+        # the most significant one being unbounded (mask = -1).
+        nonzero = weights[weights != 0]
+        if np.all(nonzero & (nonzero - 1) == 0):
+            self._digits = []
+            for dim, (rows, w) in enumerate(self._rows):
+                shifts = [int(x).bit_length() - 1 for x in w]
+                for k, (row, shift) in enumerate(zip(rows, shifts)):
+                    mask = -1 if k == 0 else (1 << (shifts[k - 1] - shift)) - 1
+                    self._digits.append((int(row), dim, shift, mask))
+
+    @property
+    def dimension(self) -> int:
+        """Number of dimensions of the mesh indices."""
+        if self.weights is not None:
+            return self.weights.shape[1]
+        if self.mesh is not None:
+            return self.mesh.dimension
+        raise ValueError("MeshIndexMapper without map matrix nor mesh")
+
+    def to_mesh_indices(self, mps_indices: Matrix) -> Matrix:
+        """Map a matrix of MPS indices, one per row, to integer mesh indices."""
+        if self.weights is None:
+            return mps_indices
+        return np.asarray(mps_indices) @ self.weights
+
+    def to_mps_indices(self, mesh_indices: Matrix) -> Matrix:
+        """
+        Map a matrix of integer mesh indices, one per row, to MPS indices.
+
+        This is the decomposition described in :func:`mesh_to_mps_indices`.
+        """
+        mesh_indices = np.asarray(mesh_indices)
+        if self.weights is None:
+            return mesh_indices
+        if mesh_indices.shape[1] != self.weights.shape[1]:
+            raise ValueError("Invalid dimensions")
+        K = mesh_indices.shape[0]
+        columns = mesh_indices.T.astype(np.int64)
+        mps_indices = np.zeros((self.weights.shape[0], K), dtype=int)
+        if self._digits is not None:
+            for row, dim, shift, mask in self._digits:
+                digit = mps_indices[row]
+                np.right_shift(columns[dim], shift, out=digit)
+                digit &= mask
+        else:
+            for dim, (rows, weights) in enumerate(self._rows):
+                col = columns[dim]
+                for r, w in zip(rows, weights):
+                    mps_indices[r] = col // w
+                    col = col % w
+        return mps_indices.T
+
+    def coordinates(self, mps_indices: Matrix) -> NDArray[np.floating]:
+        """
+        Map a matrix of MPS indices, one per row, to coordinates of the mesh.
+
+        The output has the same layout as :meth:`Mesh.__getitem__`, with the
+        dimension index last.
+        """
+        if self.mesh is None:
+            raise ValueError("MeshIndexMapper requires a mesh to compute coordinates")
+        mesh_indices = self.to_mesh_indices(mps_indices)
+        return np.stack(
+            [
+                _interval_points(interval, table, mesh_indices[..., n])
+                for n, (interval, table) in enumerate(
+                    zip(self.mesh.intervals, self.tables)
+                )
+            ],
+            axis=-1,
+        )
+
+
+def _interval_table(interval: Interval, max_table_size: int) -> Vector | None:
+    if isinstance(interval, ArrayInterval):
+        return interval.values
+    if isinstance(interval, ChebyshevInterval) and interval.size <= max_table_size:
+        return interval[np.arange(interval.size)]
+    return None
+
+
+def _interval_points(
+    interval: Interval, table: Vector | None, indices: NDArray[np.integer]
+) -> NDArray[np.floating]:
+    if table is not None:
+        return table[indices]
+    if isinstance(interval, RegularInterval):
+        return interval._start_displaced + indices * interval.step
+    if isinstance(interval, IntegerInterval):
+        return interval.start + indices * interval.step
+    return interval[indices]
 
 
 __all__ = [
@@ -463,4 +620,5 @@ __all__ = [
     "mps_to_mesh_matrix",
     "interleaving_permutation",
     "mesh_to_mps_indices",
+    "MeshIndexMapper",
 ]
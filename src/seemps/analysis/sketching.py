@@ -1,13 +1,17 @@
 from __future__ import annotations
+import copy
 import numpy as np
 import scipy.linalg
+import scipy.sparse
 import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import TypeAlias
 
 from seemps.state import MPS, Strategy, DEFAULT_STRATEGY
 from seemps.state.schmidt import _destructive_svd
-from seemps.cython import destructively_truncate_vector, _contract_last_and_first
-from seemps.analysis.mesh import Mesh, mesh_to_mps_indices
+from seemps.cython import destructively_truncate_vector
+from seemps.analysis.mesh import Mesh
 from seemps.analysis.cross import BlackBoxLoadMPS
 from seemps.typing import Vector, Matrix, Tensor3
 from ..tools import DEFAULT_RNG
@@ -43,16 +47,14 @@ class SketchedCross:
         n = self.sites
 
         mesh_indices = _samples_to_mesh_indices(samples, black_box.mesh)
-        if black_box.map_matrix is None:
-            mps_indices = mesh_indices
-        else:
-            mps_indices = mesh_to_mps_indices(mesh_indices, black_box.map_matrix)
+        mps_indices = black_box.mapper.to_mps_indices(mesh_indices)
 
         # Sets of multi-index sets: left (I_l), physical (I_s) and right (I_r).
         # Equivalent to the recursive prefix and suffix sets S_k and T_k.
-        self.I_l = [np.unique(mps_indices[:, :ℓ], axis=0) for ℓ in range(n + 1)]  # noqa: E741
+        dims = black_box.physical_dimensions
+        self.I_l = [_unique_rows(mps_indices[:, :ℓ], dims[:ℓ])[0] for ℓ in range(n + 1)]  # noqa: E741
         self.I_s = [np.arange(s).reshape(-1, 1) for s in black_box.physical_dimensions]
-        self.I_r = [np.unique(mps_indices[:, ℓ:], axis=0) for ℓ in range(n + 1)]  # noqa: E741
+        self.I_r = [_unique_rows(mps_indices[:, ℓ:], dims[ℓ:])[0] for ℓ in range(n + 1)]  # noqa: E741
 
     @staticmethod
     def combine_indices(*indices: IndexMatrix) -> IndexMatrix:
@@ -68,15 +70,38 @@ class SketchedCross:
         mps_indices = self.combine_indices(i_l, i_s, i_r)
         return self.black_box[mps_indices].reshape((len(i_l), len(i_s), len(i_r)))
 
+    def fiber_size(self, k: int) -> int:
+        """Number of function evaluations in the fiber of site `k`."""
+        return len(self.I_l[k]) * len(self.I_s[k]) * len(self.I_r[k + 1])
+
+    def sketch_fiber(
+        self, k: int, Ω: Matrix | _Sketch, chunk_size: int | None = None
+    ) -> Tensor3:
+        """
+        Computes the sketch ``f_k · Ω`` of the fiber of site `k`, evaluating the
+        black box on blocks of at most `chunk_size` multi-indices and accumulating
+        their contributions, so that the full fiber is never held in memory.
+        """
+        sketch = _DenseSketch(Ω) if isinstance(Ω, np.ndarray) else Ω
+        return _sketch_fiber(
+            self.black_box,
+            self.I_l[k],
+            self.I_s[k],
+            self.I_r[k + 1],
+            sketch,
+            chunk_size,
+        )
+
     @property
     def recursive_sets(self) -> list[tuple[Vector, Vector]]:
         β_list: list[Vector] = [np.zeros(self.I_l[1].shape[0], dtype=int)]
         x_list: list[Vector] = [self.I_l[1][:, 0]]
+        dims = self.black_box.physical_dimensions
         for k in range(1, self.sites):
-            S_k = self.I_l[k]
             S_kp1 = self.I_l[k + 1]
-            index_map = {tuple(row): idx for idx, row in enumerate(S_k)}
-            β_k = np.array([index_map[tuple(row[:-1])] for row in S_kp1], dtype=int)
+            # The prefixes of S_{k+1} are exactly S_k, in the same lexicographic
+            # order, so the inverse indices of their unique rows locate them.
+            _, β_k = _unique_rows(S_kp1[:, :-1], dims[:k])
             x_k = S_kp1[:, -1].astype(int)
             β_list.append(β_k)
             x_list.append(x_k)
@@ -88,6 +113,11 @@ def tt_rss(
     samples: Matrix,
     max_bond_dimensions: Vector | None = None,
     strategy: Strategy = DEFAULT_STRATEGY,
+    chunk_size: int | None = None,
+    executor: Executor | str | None = None,
+    max_workers: int | None = None,
+    sketch: str = "gaussian",
+    rng: np.random.Generator = DEFAULT_RNG,
 ) -> MPS:
     """
     Tensor Train via Recursive Sketching from Samples (TT-RSS).
@@ -114,6 +144,33 @@ def tt_rss(
     strategy : Strategy, optional
         SVD rank-revealing strategy, determining the complexity of the target MPS.
         Defaults to DEFAULT_STRATEGY.
+    chunk_size : int, optional
+        Maximum number of function evaluations per call to the black box. If given,
+        each fiber is evaluated in blocks and its sketch is accumulated block by
+        block, which bounds the memory required for large numbers of samples.
+        Defaults to evaluating each fiber at once.
+    executor : Executor | str, optional
+        If given, the sketches of different sites are formed concurrently in an
+        existing `concurrent.futures.Executor`, or in a new pool created with
+        "process" or "thread". With processes, the black box must be picklable,
+        which excludes lambdas and local functions. Defaults to forming the
+        sketches serially.
+    max_workers : int, optional
+        Number of workers of the pool created for `executor`.
+    sketch : str, default="gaussian"
+        Family of the random (t, χ_k) matrices Ω that compress the fibers:
+
+        * "gaussian": dense isometries obtained from Gaussian matrices.
+        * "srht": subsampled randomized Hadamard transforms.
+        * "countsketch": one random sign per row of Ω, applied as a sparse product.
+        * "sparse-sign": up to eight random signs per row of Ω.
+        * "khatri-rao": row-wise products of one small Gaussian matrix per site
+          of the suffix multi-index.
+
+        Except for "gaussian", which requires a QR decomposition of a dense
+        (t, χ_k) matrix, these take O(t) memory or less, and Ω is never stored.
+    rng : np.random.Generator, default=`seemps.tools.DEFAULT_RNG`
+        Random number generator for the sketches.
 
     Returns
     -------
@@ -124,15 +181,19 @@ def tt_rss(
     sketched_cross = SketchedCross(black_box, samples)
 
     # Sketching
-    Φ_tensors: list[Tensor3] = []
+    sketches: list[_Sketch] = []
+    dimensions = black_box.physical_dimensions
     for k in range(sketched_cross.sites):
-        f_k = sketched_cross.sample_fiber(k)
-        t = f_k.shape[2]
+        suffixes = sketched_cross.I_r[k + 1]
+        t = len(suffixes)
         if max_bond_dimensions is not None:
             χ = min(t, max_bond_dimensions[k])
         else:
             χ = min(t, strategy.get_max_bond_dimension())
-        Φ_tensors.append(_contract_last_and_first(f_k, _random_isometry(t, χ)))
+        sketches.append(_make_sketch(sketch, suffixes, dimensions[k + 1 :], χ, rng))
+    Φ_tensors = _sketch_all_fibers(
+        sketched_cross, sketches, chunk_size, executor, max_workers
+    )
 
     # Trimming
     B_tensors: list[Tensor3] = []
@@ -170,6 +231,106 @@ def tt_rss(
     return MPS(cores)
 
 
+def _unique_rows(
+    rows: IndexMatrix, dimensions: list[int]
+) -> tuple[IndexMatrix, Vector]:
+    """
+    Equivalent to ``np.unique(rows, axis=0, return_inverse=True)``. When possible,
+    each row is encoded as a mixed-radix integer with the given `dimensions`,
+    which sorts in lexicographic order and is much faster to deduplicate.
+    """
+    if rows.shape[1] == 0:
+        return rows[:1], np.zeros(len(rows), dtype=int)
+    if np.sum(np.log2(dimensions)) >= 62:
+        unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+        return unique, inverse.reshape(-1)
+    weights = np.cumprod([1] + list(dimensions[:0:-1]), dtype=np.int64)[::-1]
+    _, first, inverse = np.unique(
+        rows @ weights, return_index=True, return_inverse=True
+    )
+    return rows[first], inverse.reshape(-1)
+
+
+def _sketch_fiber(
+    black_box: BlackBoxLoadMPS,
+    i_l: IndexMatrix,
+    i_s: IndexMatrix,
+    i_r: IndexMatrix,
+    sketch: _Sketch,
+    chunk_size: int | None,
+) -> Tensor3:
+    """Accumulate the sketch of a fiber over blocks of left and right multi-indices."""
+    L, s, R = len(i_l), len(i_s), len(i_r)
+    χ = sketch.cols
+    if chunk_size is None or L * s * R <= chunk_size:
+        mps_indices = SketchedCross.combine_indices(i_l, i_s, i_r)
+        f = black_box[mps_indices].reshape(L * s, R)
+        return sketch.apply(f).reshape(L, s, χ)
+    R_block = max(1, min(R, chunk_size // (L * s)))
+    L_block = max(1, min(L, chunk_size // (s * R_block)))
+    Φ: Tensor3 | None = None
+    for l0 in range(0, L, L_block):
+        i_l_block = i_l[l0 : l0 + L_block]
+        Φ_block: Tensor3 | None = None
+        for r0 in range(0, R, R_block):
+            i_r_block = i_r[r0 : r0 + R_block]
+            mps_indices = SketchedCross.combine_indices(i_l_block, i_s, i_r_block)
+            f = black_box[mps_indices].reshape(len(i_l_block) * s, len(i_r_block))
+            term = sketch.apply(f, r0).reshape(len(i_l_block), s, χ)
+            Φ_block = term if Φ_block is None else Φ_block + term
+        assert Φ_block is not None
+        if L_block == L:
+            return Φ_block
+        if Φ is None:
+            Φ = np.empty((L, s, χ), dtype=Φ_block.dtype)
+        Φ[l0 : l0 + L_block] = Φ_block
+    assert Φ is not None
+    return Φ
+
+
+def _sketch_all_fibers(
+    sketched_cross: SketchedCross,
+    sketches: list[_Sketch],
+    chunk_size: int | None,
+    executor: Executor | str | None,
+    max_workers: int | None,
+) -> list[Tensor3]:
+    """Form the sketches of all sites, possibly concurrently in an executor."""
+    sites = range(sketched_cross.sites)
+    if executor is None:
+        return [sketched_cross.sketch_fiber(k, sketches[k], chunk_size) for k in sites]
+    pool: Executor | None = None
+    if executor == "process":
+        executor = pool = ProcessPoolExecutor(max_workers)
+    elif executor == "thread":
+        executor = pool = ThreadPoolExecutor(max_workers)
+    elif isinstance(executor, str):
+        raise Exception(f'Unknown sketching executor "{executor}"')
+    # Workers use a copy without cache, and the evaluations are recorded below
+    black_box = copy.copy(sketched_cross.black_box)
+    try:
+        futures = [
+            executor.submit(
+                _sketch_fiber,
+                black_box,
+                sketched_cross.I_l[k],
+                sketched_cross.I_s[k],
+                sketched_cross.I_r[k + 1],
+                sketches[k],
+                chunk_size,
+            )
+            for k in sites
+        ]
+        Φ_tensors = [future.result() for future in futures]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    sketched_cross.black_box.record_evaluations(
+        sum(sketched_cross.fiber_size(k) for k in sites)
+    )
+    return Φ_tensors
+
+
 def _samples_to_mesh_indices(samples: Matrix, mesh: Mesh) -> Matrix:
     """
     Project continuous sample points onto the nearest nodes of a discretization mesh.
@@ -195,6 +356,160 @@ def _samples_to_mesh_indices(samples: Matrix, mesh: Mesh) -> Matrix:
     return indices
 
 
+#: Number of rows of a structured sketch that are generated at once.
+SKETCH_BLOCK_ROWS: int = 2**12
+
+
+class _Sketch(ABC):
+    """Random (rows, cols) matrix Ω that compresses fibers as ``f @ Ω``."""
+
+    rows: int
+    cols: int
+
+    @abstractmethod
+    def block(self, start: int, stop: int) -> Matrix:
+        """Returns the rows ``Ω[start:stop]`` as a dense matrix."""
+        ...
+
+    def apply(self, f: Matrix, start: int = 0) -> Matrix:
+        """Returns ``f @ Ω[start:start + f.shape[1]]``.
+
+        The rows of Ω are generated in blocks of `SKETCH_BLOCK_ROWS`, which
+        keeps the cost of a matrix product while never storing Ω as a whole.
+        """
+        t = f.shape[1]
+        if t <= SKETCH_BLOCK_ROWS:
+            return f @ self.block(start, start + t)
+        output = np.zeros((f.shape[0], self.cols), dtype=np.result_type(f, 1.0))
+        for r0 in range(0, t, SKETCH_BLOCK_ROWS):
+            r1 = min(r0 + SKETCH_BLOCK_ROWS, t)
+            output += f[:, r0:r1] @ self.block(start + r0, start + r1)
+        return output
+
+
+class _DenseSketch(_Sketch):
+    def __init__(self, Ω: Matrix):
+        self.Ω = Ω
+        self.rows, self.cols = Ω.shape
+
+    def block(self, start: int, stop: int) -> Matrix:
+        return self.Ω[start:stop]
+
+    def apply(self, f: Matrix, start: int = 0) -> Matrix:
+        return f @ self.Ω[start : start + f.shape[1]]
+
+
+class _SRHTSketch(_Sketch):
+    """Subsampled randomized Hadamard transform ``D H P / sqrt(cols)``."""
+
+    def __init__(self, rows: int, cols: int, rng: np.random.Generator):
+        self.rows, self.cols = rows, cols
+        self.size = 1 << (rows - 1).bit_length()
+        self.signs = rng.choice([-1.0, 1.0], size=rows)
+        self.columns = rng.choice(self.size, size=cols, replace=False)
+
+    def block(self, start: int, stop: int) -> Matrix:
+        # Entries of the Sylvester-Hadamard matrix are (-1)^popcount(i & j)
+        i = np.arange(start, stop).reshape(-1, 1)
+        H = 1.0 - 2.0 * _parity(i & self.columns)
+        return H * (self.signs[start:stop, np.newaxis] / np.sqrt(self.cols))
+
+
+def _parity(x: np.ndarray) -> np.ndarray:
+    """Parity of the number of set bits of non-negative 64-bit integers."""
+    x = x ^ (x >> 32)
+    for shift in (16, 8, 4, 2, 1):
+        x ^= x >> shift
+    return x & 1
+
+
+class _SparseSignSketch(_Sketch):
+    """Sparse matrix with `nonzeros` random signs per row (CountSketch for 1)."""
+
+    def __init__(self, rows: int, cols: int, nonzeros: int, rng: np.random.Generator):
+        self.rows, self.cols = rows, cols
+        if nonzeros == 1:
+            # Balanced buckets, so that no column is left empty when cols <= rows
+            columns = (rng.permutation(rows) % cols).reshape(-1, 1)
+        else:
+            # Distinct columns in each row, drawn in blocks of bounded memory
+            step = max(1, 2**20 // cols)
+            columns = np.concatenate(
+                [
+                    np.argpartition(
+                        rng.random((min(step, rows - r0), cols)), nonzeros - 1, axis=1
+                    )[:, :nonzeros]
+                    for r0 in range(0, rows, step)
+                ]
+            )
+        signs = rng.choice([-1.0, 1.0], size=(rows, nonzeros)) / np.sqrt(nonzeros)
+        self.Ω = scipy.sparse.csr_array(
+            (
+                signs.reshape(-1),
+                (np.repeat(np.arange(rows), nonzeros), columns.reshape(-1)),
+            ),
+            shape=(rows, cols),
+        )
+
+    def block(self, start: int, stop: int) -> Matrix:
+        return self.Ω[start:stop].toarray()
+
+    def apply(self, f: Matrix, start: int = 0) -> Matrix:
+        # Computed as (Ω^T f^T)^T so that the sparse matrix drives the product
+        return (self.Ω[start : start + f.shape[1]].T @ f.T).T
+
+
+class _KhatriRaoSketch(_Sketch):
+    """Rows ``Ω[r] = ∏_j G_j[i_j(r)] / sqrt(cols)`` for the multi-indices i(r)."""
+
+    def __init__(
+        self,
+        multi_indices: IndexMatrix,
+        dimensions: list[int],
+        cols: int,
+        rng: np.random.Generator,
+    ):
+        self.rows, self.cols = len(multi_indices), cols
+        self.multi_indices = multi_indices
+        self.factors = [rng.normal(size=(d, cols)) for d in dimensions]
+
+    def block(self, start: int, stop: int) -> Matrix:
+        Ω = np.full((stop - start, self.cols), 1.0 / np.sqrt(self.cols))
+        for j, G in enumerate(self.factors):
+            Ω *= G[self.multi_indices[start:stop, j]]
+        return Ω
+
+
+_SKETCH_KINDS = ("gaussian", "srht", "countsketch", "sparse-sign", "khatri-rao")
+
+
+def _make_sketch(
+    kind: str,
+    multi_indices: IndexMatrix,
+    dimensions: list[int],
+    cols: int,
+    rng: np.random.Generator,
+) -> _Sketch:
+    """Creates a sketch of the given `kind` for the rows given by `multi_indices`."""
+    rows = len(multi_indices)
+    if kind == "gaussian":
+        return _DenseSketch(_random_isometry(rows, cols, rng))
+    elif kind not in _SKETCH_KINDS:
+        raise Exception(f'Unknown sketch "{kind}"')
+    elif cols >= rows:
+        # Nothing to compress: avoid rank losses of small random sign matrices
+        return _DenseSketch(np.eye(rows))
+    elif kind == "srht":
+        return _SRHTSketch(rows, cols, rng)
+    elif kind == "countsketch":
+        return _SparseSignSketch(rows, cols, 1, rng)
+    elif kind == "sparse-sign":
+        return _SparseSignSketch(rows, cols, min(cols, 8), rng)
+    elif kind == "khatri-rao":
+        return _KhatriRaoSketch(multi_indices, dimensions, cols, rng)
+    raise Exception(f'Unknown sketch "{kind}"')
+
+
 def _random_isometry(
     rows: int, cols: int, rng: np.random.Generator = DEFAULT_RNG
 ) -> Matrix:
@@ -1,15 +1,20 @@
 from .core import (
     _begin_environment,
     _canonicalize,
+    _cast_to_precision,
+    _configure_randomized_svd,
     _contract_last_and_first,
     _contract_nrjl_ijk_klm,
     _destructive_svd,
     _gemm,
     _left_orth_2site,
+    _randomized_svd,
     _right_orth_2site,
     _recanonicalize,
     _update_left_environment,
+    _update_left_mpo_environment,
     _update_right_environment,
+    _update_right_mpo_environment,
     _update_in_canonical_form_right,
     _update_in_canonical_form_left,
     _end_environment,
@@ -21,6 +26,7 @@ from .core import (
     GemmOrder,
     NO_TRUNCATION,
     MAX_BOND_DIMENSION,
+    Precision,
     scprod,
     Simplification,
     Strategy,
@@ -31,6 +37,8 @@ from .core import (
 __all__ = [
     "_begin_environment",
     "_canonicalize",
+    "_cast_to_precision",
+    "_configure_randomized_svd",
     "_contract_last_and_first",
     "_contract_nrjl_ijk_klm",
     "_destructive_svd",
@@ -38,19 +46,23 @@ __all__ = [
     "_gemm",
     "_join_environments",
     "_left_orth_2site",
+    "_randomized_svd",
     "_right_orth_2site",
     "_recanonicalize",
     "_select_svd_driver",
     "_update_in_canonical_form_right",
     "_update_in_canonical_form_left",
     "_update_left_environment",
+    "_update_left_mpo_environment",
     "_update_right_environment",
+    "_update_right_mpo_environment",
     "destructively_truncate_vector",
     "DEFAULT_STRATEGY",
     "DEFAULT_TOLERANCE",
     "GemmOrder",
     "MAX_BOND_DIMENSION",
     "NO_TRUNCATION",
+    "Precision",
     "Truncation",
     "scprod",
     "Simplification",
@@ -124,9 +124,8 @@ def _contract_nrjl_ijk_klm(U, A, B) -> cnp.ndarray:
         _matmul(
             U,
             _as_3tensor(
-                <cnp.ndarray>cnp.PyArray_MatrixProduct(
-                    _as_matrix(<cnp.ndarray>A, a*d, b),
-                    _as_matrix(<cnp.ndarray>B, b, e*c)),
+                __gemm(_as_matrix(<cnp.ndarray>A, a*d, b), GEMM_NORMAL,
+                       _as_matrix(<cnp.ndarray>B, b, e*c), GEMM_NORMAL),
                 a, d*e, c)
         ),
         a, d, e, c)
@@ -1,6 +1,14 @@
 from enum import IntEnum
 import numpy as np
-from ..typing import Vector, Unitary, Tensor3, Tensor4, Environment, Weight
+from ..typing import (
+    Vector,
+    Unitary,
+    Tensor3,
+    Tensor4,
+    Environment,
+    MPOEnvironment,
+    Weight,
+)
 
 MAX_BOND_DIMENSION: int
 
@@ -16,6 +24,10 @@ class Simplification(IntEnum):
     VARIATIONAL = 2
     VARIATIONAL_EXACT_GUESS = 3
 
+class Precision(IntEnum):
+    DOUBLE = 0
+    SINGLE = 1
+
 class Strategy:
     def __init__(
         self: Strategy,
@@ -26,6 +38,7 @@ class Strategy:
         max_sweeps: int = 16,
         normalize: bool = False,
         simplify: Simplification = Simplification.VARIATIONAL,
+        precision: Precision = Precision.DOUBLE,
     ): ...
     def replace(
         self: Strategy,
@@ -36,6 +49,7 @@ class Strategy:
         max_sweeps: int | None = None,
         normalize: bool | None = None,
         simplify: Simplification | None = None,
+        precision: Precision | None = None,
     ) -> Strategy: ...
     def set_normalization(self: Strategy, normalize: bool) -> Strategy: ...
     def get_tolerance(self) -> float: ...
@@ -46,6 +60,7 @@ class Strategy:
     def get_method(self) -> int: ...
     def get_normalize_flag(self) -> bool: ...
     def get_simplify_flag(self) -> bool: ...
+    def get_precision(self) -> Precision: ...
     def __str__(self) -> str: ...
 
 DEFAULT_TOLERANCE: float
@@ -54,7 +69,10 @@ NO_TRUNCATION: Strategy
 
 DEFAULT_STRATEGY: Strategy
 
-def destructively_truncate_vector(s: Vector, strategy: Strategy) -> float: ...
+def destructively_truncate_vector(
+    s: Vector, strategy: Strategy, discarded: float = 0.0
+) -> float: ...
+def _cast_to_precision(A: np.ndarray, strategy: Strategy) -> np.ndarray: ...
 def _contract_nrjl_ijk_klm(U: Unitary, A: Tensor3, B: Tensor3) -> Tensor4: ...
 def _contract_last_and_first(A: np.ndarray, B: np.ndarray) -> np.ndarray: ...
 def _begin_environment(D: int | None = 1) -> Environment: ...
@@ -64,6 +82,12 @@ def _update_right_environment(
 def _update_left_environment(
     B: Tensor3, A: Tensor3, rho: Environment
 ) -> Environment: ...
+def _update_left_mpo_environment(
+    rho: MPOEnvironment, A: Tensor3, O: Tensor4, B: Tensor3
+) -> MPOEnvironment: ...
+def _update_right_mpo_environment(
+    rho: MPOEnvironment, A: Tensor3, O: Tensor4, B: Tensor3
+) -> MPOEnvironment: ...
 def _end_environment(rho: Environment) -> Weight: ...
 def _join_environments(rhoL: Environment, rhoR: Environment) -> Weight: ...
 def scprod(bra: MPS, ket: MPS) -> Weight: ...
@@ -86,6 +110,12 @@ def _right_orth_2site(
 ) -> tuple[Tensor3, Tensor3, float]: ...
 def _select_svd_driver(which: str): ...
 def _destructive_svd(A: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+def _randomized_svd(
+    A: np.ndarray, rank: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]: ...
+def _configure_randomized_svd(
+    oversampling: int = 10, power_iterations: int = 2, max_rank_fraction: float = 0.25
+) -> None: ...
 
 class GemmOrder(IntEnum):
     NORMAL = 0
@@ -1,11 +1,16 @@
+#
+# The initial environments are identities, which are exact in any precision.
+# We store them in single precision so that they do not promote the type of
+# the tensors they are contracted with.
+#
 cdef _eye = np.eye
-cdef _empty_environment = _eye(1)
+cdef _empty_environment = _eye(1, dtype=np.float32)
 
 def _begin_environment(int D = 1) -> cnp.ndarray:
     """Initiate the computation of a left environment from two MPS."""
     if D == 1:
         return _empty_environment
-    return _eye(D)
+    return _eye(D, dtype=np.float32)
 
 cdef cnp.ndarray __update_left_environment(object B, object A, object rho):
     if (cnp.PyArray_Check(A) == 0 or
@@ -66,6 +71,124 @@ def _update_right_environment(object B, object A, object rho) ->  cnp.ndarray:
     from the bra and ket of a scalar product."""
     return __update_right_environment(B, A, rho)
 
+#
+# Environments of an MPO between a bra and a ket are tensors rho[a,c,b] with
+# the indices of the bra, the MPO and the ket. A left update computes
+#
+#   output[d,e,f] = sum conj(A[a,j,d]) rho[a,c,b] O[c,j,i,e] B[b,i,f]
+#
+# absorbing either the ket or the bra first, whichever takes fewer operations
+# for the given shapes. Both orders only reshape their large intermediates,
+# using batched products where a plain GEMM would need a transposition, and
+# the output is contiguous in the layout that the next update consumes. The
+# right updates run the same kernels on the mirrored tensors A[d,j,a],
+# O[e,j,i,c] and B[f,i,b], whose copies are small compared to the
+# intermediates.
+#
+cdef cnp.ndarray __mpo_environment_ket_first(
+        cnp.ndarray rho, cnp.ndarray A, cnp.ndarray O, cnp.ndarray B,
+        Py_ssize_t a, Py_ssize_t c, Py_ssize_t b, Py_ssize_t j,
+        Py_ssize_t i, Py_ssize_t e, Py_ssize_t d, Py_ssize_t f):
+    cdef cnp.ndarray aux
+    # aux[a,c,i,f] = rho[a,c,b] B[b,i,f]
+    aux = __gemm(_as_2tensor(rho, a * c, b), GEMM_NORMAL,
+                 _as_2tensor(B, b, i * f), GEMM_NORMAL)
+    # aux[a,j,e,f] = O[c,j,i,e] aux[a,c,i,f], batched over 'a'
+    aux = _matmul(_as_2tensor(O.transpose(1, 3, 0, 2), j * e, c * i),
+                  _as_3tensor(aux, a, c * i, f))
+    # output[d,e,f] = conj(A[a,j,d]) aux[a,j,e,f]
+    return _as_3tensor(__gemm(_as_2tensor(A, a * j, d), GEMM_ADJOINT,
+                              _as_2tensor(aux, a * j, e * f), GEMM_NORMAL),
+                       d, e, f)
+
+cdef cnp.ndarray __mpo_environment_bra_first(
+        cnp.ndarray rho, cnp.ndarray A, cnp.ndarray O, cnp.ndarray B,
+        Py_ssize_t a, Py_ssize_t c, Py_ssize_t b, Py_ssize_t j,
+        Py_ssize_t i, Py_ssize_t e, Py_ssize_t d, Py_ssize_t f):
+    cdef:
+        cnp.ndarray aux, Oj, x
+        cnp.ndarray output = None
+        cnp.ndarray buffer = None
+        Py_ssize_t n
+    # aux[j,d,c,b] = conj(A[a,j,d]) rho[a,c,b]
+    aux = _as_4tensor(__gemm(_as_2tensor(A, a, j * d), GEMM_ADJOINT,
+                             _as_2tensor(rho, a, c * b), GEMM_NORMAL),
+                      j, d, c, b)
+    # output[d,b,i,e] = aux[j,d,c,b] O[c,j,i,e], batched over 'd' and
+    # accumulated over the physical index 'j' with a single buffer
+    Oj = _as_3tensor(O.transpose(1, 0, 2, 3), j, c, i * e)
+    for n in range(j):
+        x = aux[n].transpose(0, 2, 1)
+        if output is None:
+            output = _matmul(x, Oj[n])
+        else:
+            if buffer is None:
+                buffer = _empty_as_array(output)
+            _matmul(x, Oj[n], out=buffer)
+            output += buffer
+    # output[d,e,f] = aux[d,b,i,e] B[b,i,f], batched over 'd'
+    return _matmul(_as_3tensor(output, d, b * i, e).transpose(0, 2, 1),
+                   _as_2tensor(B, b * i, f))
+
+cdef cnp.ndarray __update_left_mpo_environment(object rho, object A, object O,
+                                               object B, str name):
+    if (cnp.PyArray_Check(rho) == 0 or
+        cnp.PyArray_Check(A) == 0 or
+        cnp.PyArray_Check(O) == 0 or
+        cnp.PyArray_Check(B) == 0 or
+        cnp.PyArray_NDIM(<cnp.ndarray>rho) != 3 or
+        cnp.PyArray_NDIM(<cnp.ndarray>A) != 3 or
+        cnp.PyArray_NDIM(<cnp.ndarray>O) != 4 or
+        cnp.PyArray_NDIM(<cnp.ndarray>B) != 3):
+        raise ValueError(f"Invalid arguments to {name}")
+    cdef:
+        Py_ssize_t a = cnp.PyArray_DIM(<cnp.ndarray>A, 0)
+        Py_ssize_t j = cnp.PyArray_DIM(<cnp.ndarray>A, 1)
+        Py_ssize_t d = cnp.PyArray_DIM(<cnp.ndarray>A, 2)
+        Py_ssize_t c = cnp.PyArray_DIM(<cnp.ndarray>O, 0)
+        Py_ssize_t i = cnp.PyArray_DIM(<cnp.ndarray>O, 2)
+        Py_ssize_t e = cnp.PyArray_DIM(<cnp.ndarray>O, 3)
+        Py_ssize_t b = cnp.PyArray_DIM(<cnp.ndarray>B, 0)
+        Py_ssize_t f = cnp.PyArray_DIM(<cnp.ndarray>B, 2)
+        double ket_first, bra_first
+    if (cnp.PyArray_DIM(<cnp.ndarray>rho, 0) != a or
+        cnp.PyArray_DIM(<cnp.ndarray>rho, 1) != c or
+        cnp.PyArray_DIM(<cnp.ndarray>rho, 2) != b or
+        cnp.PyArray_DIM(<cnp.ndarray>O, 1) != j or
+        cnp.PyArray_DIM(<cnp.ndarray>B, 1) != i):
+        raise ValueError(f"Mismatched dimensions in {name}")
+    ket_first = (<double>a * c * b * i * f + <double>a * c * i * j * e * f
+                 + <double>a * j * d * e * f)
+    bra_first = (<double>a * j * d * c * b + <double>d * b * c * j * i * e
+                 + <double>d * e * b * i * f)
+    if ket_first <= bra_first:
+        return __mpo_environment_ket_first(rho, A, O, B, a, c, b, j, i, e, d, f)
+    return __mpo_environment_bra_first(rho, A, O, B, a, c, b, j, i, e, d, f)
+
+def _update_left_mpo_environment(object rho, object A, object O, object B) -> cnp.ndarray:
+    """Extend the left environment `rho[a,c,b]` of an MPO with the tensors
+    'A' of the bra, 'O' of the MPO and 'B' of the ket, producing the
+    contiguous environment `output[d,e,f]`."""
+    return __update_left_mpo_environment(rho, A, O, B, "_update_left_mpo_environment")
+
+def _update_right_mpo_environment(object rho, object A, object O, object B) -> cnp.ndarray:
+    """Extend the right environment `rho[d,e,f]` of an MPO with the tensors
+    'A' of the bra, 'O' of the MPO and 'B' of the ket, producing the
+    contiguous environment `output[a,c,b]`."""
+    if (cnp.PyArray_Check(A) == 0 or
+        cnp.PyArray_Check(O) == 0 or
+        cnp.PyArray_Check(B) == 0 or
+        cnp.PyArray_NDIM(<cnp.ndarray>A) != 3 or
+        cnp.PyArray_NDIM(<cnp.ndarray>O) != 4 or
+        cnp.PyArray_NDIM(<cnp.ndarray>B) != 3):
+        raise ValueError("Invalid arguments to _update_right_mpo_environment")
+    return __update_left_mpo_environment(
+        rho,
+        (<cnp.ndarray>A).transpose(2, 1, 0),
+        (<cnp.ndarray>O).transpose(3, 1, 2, 0),
+        (<cnp.ndarray>B).transpose(2, 1, 0),
+        "_update_right_mpo_environment")
+
 cdef __end_environment(cnp.ndarray rho):
     return cnp.PyArray_GETITEM(rho, cnp.PyArray_DATA(rho))
 
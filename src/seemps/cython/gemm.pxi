@@ -1,4 +1,5 @@
-from scipy.linalg.cython_blas cimport dgemm, zgemm
+from scipy.linalg.cython_blas cimport sgemm, dgemm, cgemm, zgemm
+from cpython.pystate cimport PyThreadState
 
 """
 In Python we use C-stype order for arrays. In BLAS, the arrays are in Fortran
@@ -13,6 +14,30 @@ is equivalent to *gemm(B', A', C')
 where A', B' and C' are Fotran ordered arrays on the same memory region.
 """
 
+#
+# BLAS and LAPACK calls run without the GIL, so that independent contractions
+# can be computed concurrently from a thread pool. Releasing and reacquiring
+# the GIL has a cost of its own, which we avoid for the tiny matrices that
+# are common in MPS with small bond dimensions. Cython only accepts constant
+# conditions in `with nogil(...)`, hence the explicit calls below.
+#
+cdef extern from "Python.h":
+    PyThreadState *PyEval_SaveThread()
+    void PyEval_RestoreThread(PyThreadState *)
+
+cdef Py_ssize_t __nogil_min_work = 32768
+
+cdef inline PyThreadState *__release_gil(Py_ssize_t work) noexcept:
+    """Release the GIL if `work`, the size of a BLAS or LAPACK call, is
+    large enough. The result must be passed to `__restore_gil()`."""
+    if work >= __nogil_min_work:
+        return PyEval_SaveThread()
+    return NULL
+
+cdef inline void __restore_gil(PyThreadState *state) noexcept:
+    if state != NULL:
+        PyEval_RestoreThread(state)
+
 class GemmOrder:
     NORMAL = 0
     TRANSPOSE = 1
@@ -26,36 +51,62 @@ def _gemm(cnp.ndarray B, int BT, cnp.ndarray A, int AT) -> cnp.ndarray:
         raise ValueError()
     return __gemm(B, BT, A, AT)
 
+cdef inline bint __is_single(int type) noexcept:
+    return type == cnp.NPY_FLOAT32 or type == cnp.NPY_COMPLEX64
+
+cdef inline bint __is_complex(int type) noexcept:
+    return type == cnp.NPY_COMPLEX64 or type == cnp.NPY_COMPLEX128
+
+cdef cnp.ndarray __cast_to_precision(cnp.ndarray A, int precision):
+    """Cast `A` to the real or complex type with the given precision,
+    avoiding copies when the type already matches."""
+    cdef:
+        int type = cnp.PyArray_TYPE(A)
+        int new_type
+    if precision == PRECISION_SINGLE:
+        new_type = cnp.NPY_COMPLEX64 if __is_complex(type) else cnp.NPY_FLOAT32
+    else:
+        new_type = cnp.NPY_COMPLEX128 if __is_complex(type) else cnp.NPY_DOUBLE
+    if type == new_type:
+        return A
+    return <cnp.ndarray>cnp.PyArray_Cast(A, new_type)
+
+def _cast_to_precision(A, Strategy strategy) -> cnp.ndarray:
+    """Cast tensor `A` to the floating point precision requested by
+    `strategy`, preserving whether it is real or complex."""
+    if cnp.PyArray_Check(A) == 0:
+        raise ValueError("_cast_to_precision expects a tensor")
+    return __cast_to_precision(<cnp.ndarray>A, strategy.precision)
+
 cdef cnp.ndarray __gemm(cnp.ndarray B, int BT, cnp.ndarray A, int AT):
-    A = cnp.PyArray_GETCONTIGUOUS(A)
-    B = cnp.PyArray_GETCONTIGUOUS(B)
+    #
+    # Both matrices are computed in single precision only when both are
+    # float32 or complex64. Otherwise they are promoted to double precision.
+    #
     cdef:
         int Atype = cnp.PyArray_TYPE(A)
         int Btype = cnp.PyArray_TYPE(B)
-    if Atype == cnp.NPY_DOUBLE:
-        if Btype == cnp.NPY_COMPLEX128:
-            return _zgemm(<cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_COMPLEX128), AT, B, BT)
-        elif Btype == cnp.NPY_DOUBLE:
-            return _dgemm(A, AT, B, BT)
-        elif Btype == cnp.NPY_COMPLEX64:
-            return _zgemm(<cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_COMPLEX128), AT,
-                          <cnp.ndarray>cnp.PyArray_Cast(B, cnp.NPY_COMPLEX128), BT)
-        else:
-            return _dgemm(A, AT, <cnp.ndarray>cnp.PyArray_Cast(B, cnp.NPY_DOUBLE), BT)
-    elif Atype == cnp.NPY_COMPLEX128:
-        if Btype == cnp.NPY_DOUBLE:
-            return _zgemm(A, AT, <cnp.ndarray>cnp.PyArray_Cast(B, cnp.NPY_COMPLEX128), BT)
-        elif Btype == cnp.NPY_COMPLEX128:
-            return _zgemm(A, AT, B, BT)
-        elif Btype == cnp.NPY_COMPLEX64:
-            return _zgemm(A, AT, <cnp.ndarray>cnp.PyArray_Cast(B, cnp.NPY_COMPLEX128), BT)
-        elif Btype == cnp.NPY_DOUBLE:
-            return _zgemm(A, AT, <cnp.ndarray>cnp.PyArray_Cast(B, cnp.NPY_COMPLEX128), BT)
-    elif Atype == cnp.NPY_COMPLEX64:
-        return __gemm(B, BT, <cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_COMPLEX128), AT)
+        int precision = (PRECISION_SINGLE if __is_single(Atype) and __is_single(Btype)
+                         else PRECISION_DOUBLE)
+        int type
+    if __is_complex(Atype) or __is_complex(Btype):
+        type = cnp.NPY_COMPLEX64 if precision == PRECISION_SINGLE else cnp.NPY_COMPLEX128
     else:
-        return __gemm(B, BT, <cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_DOUBLE), AT)
-    raise ValueError((A.dtype, B.dtype))
+        type = cnp.NPY_FLOAT32 if precision == PRECISION_SINGLE else cnp.NPY_DOUBLE
+    if Atype != type:
+        A = <cnp.ndarray>cnp.PyArray_Cast(A, type)
+    if Btype != type:
+        B = <cnp.ndarray>cnp.PyArray_Cast(B, type)
+    A = cnp.PyArray_GETCONTIGUOUS(A)
+    B = cnp.PyArray_GETCONTIGUOUS(B)
+    if type == cnp.NPY_DOUBLE:
+        return _dgemm(A, AT, B, BT)
+    elif type == cnp.NPY_COMPLEX128:
+        return _zgemm(A, AT, B, BT)
+    elif type == cnp.NPY_FLOAT32:
+        return _sgemm(A, AT, B, BT)
+    else:
+        return _cgemm(A, AT, B, BT)
 
 cdef cnp.ndarray _dgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
     cdef:
@@ -82,11 +133,13 @@ cdef cnp.ndarray _dgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
         cnp.ndarray C = _empty_matrix(n, m, cnp.NPY_DOUBLE)
         double alpha = 1.0
         double beta = 0.0
-    dgemm(Aorder, Border, &m, &n, &k, &alpha,
-          <double*>cnp.PyArray_DATA(A), &lda,
-          <double*>cnp.PyArray_DATA(B), &ldb,
-          &beta,
-          <double*>cnp.PyArray_DATA(C), &m)
+        double *Adata = <double*>cnp.PyArray_DATA(A)
+        double *Bdata = <double*>cnp.PyArray_DATA(B)
+        double *Cdata = <double*>cnp.PyArray_DATA(C)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * k)
+    dgemm(Aorder, Border, &m, &n, &k, &alpha, Adata, &lda, Bdata, &ldb,
+          &beta, Cdata, &m)
+    __restore_gil(gil)
     return C
 
 cdef cnp.ndarray _zgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
@@ -114,9 +167,79 @@ cdef cnp.ndarray _zgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
         cnp.ndarray C = _empty_matrix(n, m, cnp.NPY_COMPLEX128)
         double complex alpha = 1.0
         double complex beta = 0.0
-    zgemm(Aorder, Border, &m, &n, &k, &alpha,
-          <double complex*>cnp.PyArray_DATA(A), &lda,
-          <double complex*>cnp.PyArray_DATA(B), &ldb,
-          &beta,
-          <double complex*>cnp.PyArray_DATA(C), &m)
+        double complex *Adata = <double complex*>cnp.PyArray_DATA(A)
+        double complex *Bdata = <double complex*>cnp.PyArray_DATA(B)
+        double complex *Cdata = <double complex*>cnp.PyArray_DATA(C)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * k)
+    zgemm(Aorder, Border, &m, &n, &k, &alpha, Adata, &lda, Bdata, &ldb,
+          &beta, Cdata, &m)
+    __restore_gil(gil)
+    return C
+
+cdef cnp.ndarray _sgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
+    cdef:
+        int m, n, k, lda, ldb
+        char *Aorder
+        char *Border
+    if AT == GEMM_NORMAL:
+        m = lda = cnp.PyArray_DIM(A, 1)
+        k = cnp.PyArray_DIM(A, 0)
+        Aorder = 'N'
+    else:
+        m = cnp.PyArray_DIM(A, 0)
+        k = lda = cnp.PyArray_DIM(A, 1)
+        Aorder = 'T'
+    if BT == GEMM_NORMAL:
+        n = cnp.PyArray_DIM(B, 0)
+        ldb = k
+        Border = 'N'
+    else:
+        n = cnp.PyArray_DIM(B, 1)
+        ldb = n
+        Border = 'T'
+    cdef:
+        cnp.ndarray C = _empty_matrix(n, m, cnp.NPY_FLOAT32)
+        float alpha = 1.0
+        float beta = 0.0
+        float *Adata = <float*>cnp.PyArray_DATA(A)
+        float *Bdata = <float*>cnp.PyArray_DATA(B)
+        float *Cdata = <float*>cnp.PyArray_DATA(C)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * k)
+    sgemm(Aorder, Border, &m, &n, &k, &alpha, Adata, &lda, Bdata, &ldb,
+          &beta, Cdata, &m)
+    __restore_gil(gil)
+    return C
+
+cdef cnp.ndarray _cgemm(cnp.ndarray A, int AT, cnp.ndarray B, int BT):
+    cdef:
+        int m, n, k, lda, ldb
+        char *Aorder
+        char *Border
+    if AT == GEMM_NORMAL:
+        m = lda = cnp.PyArray_DIM(A, 1)
+        k = cnp.PyArray_DIM(A, 0)
+        Aorder = 'N'
+    else:
+        m = cnp.PyArray_DIM(A, 0)
+        k = lda = cnp.PyArray_DIM(A, 1)
+        Aorder = 'C' if AT == GEMM_ADJOINT else 'T'
+    if BT == GEMM_NORMAL:
+        n = cnp.PyArray_DIM(B, 0)
+        ldb = k
+        Border = 'N'
+    else:
+        n = cnp.PyArray_DIM(B, 1)
+        ldb = n
+        Border = 'C' if BT == GEMM_ADJOINT else 'T'
+    cdef:
+        cnp.ndarray C = _empty_matrix(n, m, cnp.NPY_COMPLEX64)
+        float complex alpha = 1.0
+        float complex beta = 0.0
+        float complex *Adata = <float complex*>cnp.PyArray_DATA(A)
+        float complex *Bdata = <float complex*>cnp.PyArray_DATA(B)
+        float complex *Cdata = <float complex*>cnp.PyArray_DATA(C)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * k)
+    cgemm(Aorder, Border, &m, &n, &k, &alpha, Adata, &lda, Bdata, &ldb,
+          &beta, Cdata, &m)
+    __restore_gil(gil)
     return C
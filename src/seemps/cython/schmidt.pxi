@@ -25,11 +25,12 @@ cdef double __update_in_canonical_form_right(
         Py_ssize_t b = PyArray_DIM(A, 2)
         #
         # Split tensor
-        tuple svd = __svd(_as_2tensor(A, a * i, b))
+        tuple svd = __svd_for_strategy(_as_2tensor(A, a * i, b), truncation)
         #
         # Truncate Schmidt decomposition
         cnp.ndarray s = <cnp.ndarray>PyTuple_GET_ITEM(svd, 1)
-        double err = sqrt(truncation._truncate(s, truncation))
+        double err = sqrt(truncation._truncate(s, truncation,
+                                               <double><object>PyTuple_GET_ITEM(svd, 3)))
         Py_ssize_t D = PyArray_SIZE(s)
         #
         # Build new state tensors
@@ -37,7 +38,7 @@ cdef double __update_in_canonical_form_right(
         cnp.ndarray V = _resize_matrix(<cnp.ndarray>PyTuple_GET_ITEM(svd, 2), D, -1)
     state_set(state, site, _as_3tensor(U, a, i, D))
     site += 1
-    state_set(state, site, __contract_last_and_first(_as_2tensor(s, D, 1) * V,
+    state_set(state, site, __contract_last_and_first(_as_2tensor(__singular_values_for(s, V), D, 1) * V,
                                                      state_get(state, site)))
     return err
 
@@ -66,11 +67,12 @@ cdef double __update_in_canonical_form_left(
         Py_ssize_t a = PyArray_DIM(A, 0)
         Py_ssize_t i = PyArray_DIM(A, 1)
         Py_ssize_t b = PyArray_DIM(A, 2)
-        tuple svd = __svd(_as_2tensor(A, a, i * b))
+        tuple svd = __svd_for_strategy(_as_2tensor(A, a, i * b), truncation)
         #
         # Truncate Schmidt decomposition
         cnp.ndarray s = <cnp.ndarray>PyTuple_GET_ITEM(svd, 1)
-        double err = sqrt(truncation._truncate(s, truncation))
+        double err = sqrt(truncation._truncate(s, truncation,
+                                               <double><object>PyTuple_GET_ITEM(svd, 3)))
         Py_ssize_t D = PyArray_SIZE(s)
         #
         # Build new state tensors
@@ -78,7 +80,8 @@ cdef double __update_in_canonical_form_left(
         cnp.ndarray V = _resize_matrix(<cnp.ndarray>PyTuple_GET_ITEM(svd, 2), D, -1)
     state_set(state, site, _as_3tensor(V, D, i, b))
     site -= 1
-    state_set(state, site, __contract_last_and_first(state_get(state, site), U * s))
+    state_set(state, site, __contract_last_and_first(state_get(state, site),
+                                                    U * __singular_values_for(s, U)))
     return err
 
 def _update_in_canonical_form_left(state, A, site, truncation) -> tuple[int, float]:
@@ -124,6 +127,9 @@ def _left_orth_2site(object AA, Strategy strategy) -> tuple[np.ndarray, np.ndarr
     """Split a tensor AA[a,b,c,d] into B[a,b,r] and C[r,c,d] such
     that 'B' is a left-isometry, truncating the size 'r' according
     to the given 'strategy'. Tensor 'AA' may be overwritten."""
+    if PyArray_Check(AA) == 0:
+        # Other tensor types, such as block-sparse ones, split themselves
+        return AA.left_orth_2site(strategy)
     cdef:
         cnp.ndarray A = <cnp.ndarray>AA
         Py_ssize_t a = PyArray_DIM(A, 0)
@@ -132,17 +138,18 @@ def _left_orth_2site(object AA, Strategy strategy) -> tuple[np.ndarray, np.ndarr
         Py_ssize_t b = PyArray_DIM(A, 3)
         #
         # Split tensor
-        svd = __svd(_as_2tensor(A, a*d1, d2*b))
+        svd = __svd_for_strategy(_as_2tensor(A, a*d1, d2*b), strategy)
         cnp.ndarray U = <cnp.ndarray>PyTuple_GET_ITEM(svd, 0)
         cnp.ndarray V = <cnp.ndarray>PyTuple_GET_ITEM(svd, 2)
         cnp.ndarray s = <cnp.ndarray>PyTuple_GET_ITEM(svd, 1)
         #
         # Truncate tensor
-        double err = strategy._truncate(s, strategy)
+        double err = strategy._truncate(s, strategy, <double><object>PyTuple_GET_ITEM(svd, 3))
         Py_ssize_t D = PyArray_SIZE(s)
     return (
         _as_3tensor(_resize_matrix(U, -1, D), a, d1, D),
-        _as_3tensor(_as_2tensor(s, D, 1) * _resize_matrix(V, D, -1), D, d2, b),
+        _as_3tensor(_as_2tensor(__singular_values_for(s, V), D, 1) * _resize_matrix(V, D, -1),
+                    D, d2, b),
         sqrt(err),
     )
 
@@ -151,6 +158,9 @@ def _right_orth_2site(object AA, Strategy strategy) -> tuple[np.ndarray, np.ndar
     """Split a tensor AA[a,b,c,d] into B[a,b,r] and C[r,c,d] such
     that 'C' is a right-isometry, truncating the size 'r' according
     to the given 'strategy'. Tensor 'AA' may be overwritten."""
+    if PyArray_Check(AA) == 0:
+        # Other tensor types, such as block-sparse ones, split themselves
+        return AA.right_orth_2site(strategy)
     cdef:
         cnp.ndarray A = <cnp.ndarray>AA
         Py_ssize_t a = PyArray_DIM(A, 0)
@@ -159,16 +169,16 @@ def _right_orth_2site(object AA, Strategy strategy) -> tuple[np.ndarray, np.ndar
         Py_ssize_t b = PyArray_DIM(A, 3)
         #
         # Split tensor A into triplet (U, S, V)
-        svd = __svd(_as_2tensor(A, a*d1, d2*b))
+        svd = __svd_for_strategy(_as_2tensor(A, a*d1, d2*b), strategy)
         cnp.ndarray U = <cnp.ndarray>PyTuple_GET_ITEM(svd, 0)
         cnp.ndarray V = <cnp.ndarray>PyTuple_GET_ITEM(svd, 2)
         cnp.ndarray s = <cnp.ndarray>PyTuple_GET_ITEM(svd, 1)
         #
         # Truncate tensor
-        double err = strategy._truncate(s, strategy)
+        double err = strategy._truncate(s, strategy, <double><object>PyTuple_GET_ITEM(svd, 3))
         Py_ssize_t D = PyArray_SIZE(s)
     return (
-        _as_3tensor(_resize_matrix(U, -1, D) * s, a, d1, D),
+        _as_3tensor(_resize_matrix(U, -1, D) * __singular_values_for(s, U), a, d1, D),
         _as_3tensor(_resize_matrix(V, D, -1), D, d2, b),
         sqrt(err),
     )
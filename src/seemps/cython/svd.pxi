@@ -1,4 +1,6 @@
-from scipy.linalg.cython_lapack cimport dgesvd, zgesvd, dgesdd, zgesdd
+from scipy.linalg.cython_lapack cimport (
+    sgesvd, dgesvd, cgesvd, zgesvd, sgesdd, dgesdd, cgesdd, zgesdd
+)
 from scipy.linalg import LinAlgError
 
 """
@@ -12,13 +14,17 @@ Hence, we can write
    A[n,m] = VT[n,r] s[r] U[r,m]
 
 and the VT and U matrices are actually the usual U and VT from Numpy.
+
+Single precision matrices are decomposed with the single precision drivers,
+but the singular values are always returned as float64 vectors, as expected
+by the truncation routines.
 """
 
 def _destructive_svd(cnp.ndarray A) -> tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray]:
     if (cnp.PyArray_Check(A) == 0 or
         cnp.PyArray_NDIM(A) != 2):
         raise ValueError("Invalid argument to SVD")
-    return __svd(A)
+    return __svd(__cast_to_precision(A, PRECISION_DOUBLE))
 
 cdef bint __use_gesdd = 1
 
@@ -31,7 +37,102 @@ def _select_svd_driver(name: str):
     else:
         raise Exception(f"Invalid LAPACK SVD driver name: {name}")
 
-# TODO: Allow selecting other drivers
+"""
+Randomized SVD (Halko, Martinsson and Tropp, SIAM Rev. 53, 217 (2011)).
+
+When the Strategy limits the bond dimension to a rank 'k' that is much
+smaller than min(m, n), we estimate the range of A[n,m] with a Gaussian
+test matrix Ω[m,k+p], refine it with 'q' power iterations and only
+compute the SVD of the small projection Q^H A. Because Q has orthonormal
+columns, the weight that is lost is exactly |A|^2 - |Q^H A|^2, which we
+report to the truncation routines.
+"""
+
+cdef:
+    int __rsvd_oversampling = 10
+    int __rsvd_power_iterations = 2
+    double __rsvd_max_rank_fraction = 0.25
+
+cdef object __rsvd_rng = np.random.default_rng(0x5EE3B5)
+cdef object _qr = np.linalg.qr
+cdef object _vdot = np.vdot
+
+def _configure_randomized_svd(int oversampling = 10,
+                              int power_iterations = 2,
+                              double max_rank_fraction = 0.25):
+    """Configure the randomized SVD driver used when truncating tensors.
+
+    Parameters
+    ----------
+    oversampling : int, default = 10
+        Number of random vectors used on top of the requested rank.
+    power_iterations : int, default = 2
+        Number of power iterations to refine the estimated range.
+    max_rank_fraction : float, default = 0.25
+        The randomized driver is used only when the requested rank plus
+        oversampling is below this fraction of the smallest matrix
+        dimension. Zero disables the randomized driver.
+    """
+    global __rsvd_oversampling, __rsvd_power_iterations, __rsvd_max_rank_fraction
+    if oversampling < 0 or power_iterations < 0 or max_rank_fraction < 0:
+        raise ValueError("Invalid arguments to _configure_randomized_svd")
+    __rsvd_oversampling = oversampling
+    __rsvd_power_iterations = power_iterations
+    __rsvd_max_rank_fraction = max_rank_fraction
+
+def _randomized_svd(cnp.ndarray A, int rank) -> tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray, float]:
+    """Approximate SVD of `A` with `rank` plus oversampling singular values.
+
+    Returns a tuple `(U, s, V, discarded)`, where `discarded` is the squared
+    norm of the singular values that were not computed."""
+    if (cnp.PyArray_Check(A) == 0 or
+        cnp.PyArray_NDIM(A) != 2 or
+        rank <= 0):
+        raise ValueError("Invalid argument to randomized SVD")
+    return __randomized_svd(A, rank)
+
+cdef tuple __randomized_svd(cnp.ndarray A, Py_ssize_t rank):
+    cdef:
+        Py_ssize_t rows = cnp.PyArray_DIM(A, 0)
+        Py_ssize_t cols = cnp.PyArray_DIM(A, 1)
+        Py_ssize_t k = min(rank + __rsvd_oversampling, min(rows, cols))
+        int i
+        double norm2, kept
+        cnp.ndarray Q, B, s
+        tuple svd
+    A = <cnp.ndarray>cnp.PyArray_GETCONTIGUOUS(A)
+    norm2 = _vdot(A, A).real
+    Q = _qr(__gemm(A, GEMM_NORMAL,
+                   __rsvd_rng.standard_normal(
+                       (cols, k),
+                       dtype=np.float32 if __is_single(cnp.PyArray_TYPE(A)) else np.float64),
+                   GEMM_NORMAL))[0]
+    for i in range(__rsvd_power_iterations):
+        Q = _qr(__gemm(A, GEMM_ADJOINT, Q, GEMM_NORMAL))[0]
+        Q = _qr(__gemm(A, GEMM_NORMAL, Q, GEMM_NORMAL))[0]
+    B = __gemm(Q, GEMM_ADJOINT, A, GEMM_NORMAL)
+    svd = __svd(B)
+    s = <cnp.ndarray>cpython.PyTuple_GET_ITEM(svd, 1)
+    kept = _norm(<cnp.float64_t*>cnp.PyArray_DATA(s), cnp.PyArray_SIZE(s))
+    return (__gemm(Q, GEMM_NORMAL, <cnp.ndarray>cpython.PyTuple_GET_ITEM(svd, 0), GEMM_NORMAL),
+            s,
+            <cnp.ndarray>cpython.PyTuple_GET_ITEM(svd, 2),
+            max(norm2 - kept * kept, 0.0))
+
+cdef tuple __svd_for_strategy(cnp.ndarray A, Strategy strategy):
+    """Compute the SVD of `A` that will be truncated with `strategy`,
+    returning `(U, s, V, discarded)`. Uses the randomized driver when the
+    maximum bond dimension is far below the rank of the matrix, and the
+    floating point precision requested by the strategy."""
+    A = __cast_to_precision(A, strategy.precision)
+    cdef:
+        Py_ssize_t r = min(cnp.PyArray_DIM(A, 0), cnp.PyArray_DIM(A, 1))
+        Py_ssize_t k = <Py_ssize_t>strategy.max_bond_dimension + __rsvd_oversampling
+    if (strategy.method != TRUNCATION_DO_NOT_TRUNCATE and
+        k <= __rsvd_max_rank_fraction * r):
+        return __randomized_svd(A, strategy.max_bond_dimension)
+    return __svd(A) + (0.0,)
+
 cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
     global __use_gesdd
     cdef:
@@ -40,8 +141,10 @@ cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
         int r = min(m, n)
         int type = cnp.PyArray_TYPE(A)
         int err
-        cnp.ndarray U, VT
-        cnp.ndarray s = _empty_vector(r, cnp.NPY_DOUBLE)
+        cnp.ndarray U, VT, s
+    if (type != cnp.NPY_DOUBLE and type != cnp.NPY_COMPLEX128 and
+        type != cnp.NPY_FLOAT32 and type != cnp.NPY_COMPLEX64):
+        return __svd(<cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_DOUBLE))
     A = <cnp.ndarray>cnp.PyArray_GETCONTIGUOUS(A)
     if r == n:
         VT = _empty_matrix(n, r, type)
@@ -50,6 +153,7 @@ cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
         U = _empty_matrix(r, m, type)
         VT = A
     if type == cnp.NPY_DOUBLE:
+        s = _empty_vector(r, cnp.NPY_DOUBLE)
         if __use_gesdd:
             err = __dgesdd(<double*>cnp.PyArray_DATA(A),
                            <double*>cnp.PyArray_DATA(U),
@@ -61,6 +165,7 @@ cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
                            <double*>cnp.PyArray_DATA(s),
                            <double*>cnp.PyArray_DATA(VT), m, n, r)
     elif type == cnp.NPY_COMPLEX128:
+        s = _empty_vector(r, cnp.NPY_DOUBLE)
         if __use_gesdd:
             err = __zgesdd(<double complex*>cnp.PyArray_DATA(A),
                            <double complex*>cnp.PyArray_DATA(U),
@@ -71,10 +176,32 @@ cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
                            <double complex*>cnp.PyArray_DATA(U),
                            <double*>cnp.PyArray_DATA(s),
                            <double complex*>cnp.PyArray_DATA(VT), m, n, r)
-    elif type == cnp.NPY_COMPLEX64:
-        return __svd(<cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_COMPLEX128))
+    elif type == cnp.NPY_FLOAT32:
+        s = _empty_vector(r, cnp.NPY_FLOAT32)
+        if __use_gesdd:
+            err = __sgesdd(<float*>cnp.PyArray_DATA(A),
+                           <float*>cnp.PyArray_DATA(U),
+                           <float*>cnp.PyArray_DATA(s),
+                           <float*>cnp.PyArray_DATA(VT), m, n, r)
+        else:
+            err = __sgesvd(<float*>cnp.PyArray_DATA(A),
+                           <float*>cnp.PyArray_DATA(U),
+                           <float*>cnp.PyArray_DATA(s),
+                           <float*>cnp.PyArray_DATA(VT), m, n, r)
+        s = <cnp.ndarray>cnp.PyArray_Cast(s, cnp.NPY_DOUBLE)
     else:
-        return __svd(<cnp.ndarray>cnp.PyArray_Cast(A, cnp.NPY_DOUBLE))
+        s = _empty_vector(r, cnp.NPY_FLOAT32)
+        if __use_gesdd:
+            err = __cgesdd(<float complex*>cnp.PyArray_DATA(A),
+                           <float complex*>cnp.PyArray_DATA(U),
+                           <float*>cnp.PyArray_DATA(s),
+                           <float complex*>cnp.PyArray_DATA(VT), m, n, r)
+        else:
+            err = __cgesvd(<float complex*>cnp.PyArray_DATA(A),
+                           <float complex*>cnp.PyArray_DATA(U),
+                           <float*>cnp.PyArray_DATA(s),
+                           <float complex*>cnp.PyArray_DATA(VT), m, n, r)
+        s = <cnp.ndarray>cnp.PyArray_Cast(s, cnp.NPY_DOUBLE)
     if err == 0:
         return VT, s, U
     elif err < 0:
@@ -82,6 +209,13 @@ cdef tuple[cnp.ndarray, cnp.ndarray, cnp.ndarray] __svd(cnp.ndarray A):
     else:
         raise LinAlgError("SVD did not converge")
 
+cdef cnp.ndarray __singular_values_for(cnp.ndarray s, cnp.ndarray U):
+    """Return the float64 singular values `s` in the precision of the
+    isometry `U`, so that `U * s` does not promote single precision tensors."""
+    if __is_single(cnp.PyArray_TYPE(U)):
+        return <cnp.ndarray>cnp.PyArray_Cast(s, cnp.NPY_FLOAT32)
+    return s
+
 
 """
 cdef void dgesvd(
@@ -106,9 +240,12 @@ cdef int __dgesvd(double *A, double *U, double *s, double *VT,
     lwork = int(work_temp)
     cdef:
         cnp.ndarray work = _empty_vector(lwork, cnp.NPY_DOUBLE)
+        double *work_data = <double*>cnp.PyArray_DATA(work)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
     dgesvd(jobu, jobvt,
            &m, &n, A, &m, s, U, &m, VT, &r,
-           <double*>cnp.PyArray_DATA(work), &lwork, &info)
+           work_data, &lwork, &info)
+    __restore_gil(gil)
     return info
 
 """
@@ -137,11 +274,15 @@ cdef int __zgesvd(double complex*A, double complex*U, double *s, double complex*
     lwork = int(work_temp.real)
     cdef:
         cnp.ndarray work = _empty_vector(lwork, cnp.NPY_COMPLEX128)
+        double complex *work_data = <double complex*>cnp.PyArray_DATA(work)
+        double *rwork_data = <double*>cnp.PyArray_DATA(rwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
     zgesvd(jobu, jobvt,
            &m, &n, A, &m, s, U, &m, VT, &r,
-           <double complex*>cnp.PyArray_DATA(work), &lwork,
-           <double*>cnp.PyArray_DATA(rwork),
+           work_data, &lwork,
+           rwork_data,
            &info)
+    __restore_gil(gil)
     return info
 
 """
@@ -168,10 +309,14 @@ cdef int __dgesdd(double *A, double *U, double *s, double *VT,
     lwork = int(work_temp)
     cdef:
         cnp.ndarray work = _empty_vector(lwork, cnp.NPY_DOUBLE)
+        double *work_data = <double*>cnp.PyArray_DATA(work)
+        int *iwork_data = <int*>cnp.PyArray_DATA(iwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
     dgesdd(jobz,
            &m, &n, A, &m, s, U, &m, VT, &r,
-           <double*>cnp.PyArray_DATA(work), &lwork,
-           <int*>cnp.PyArray_DATA(iwork), &info)
+           work_data, &lwork,
+           iwork_data, &info)
+    __restore_gil(gil)
     return info
 
 """
@@ -207,10 +352,132 @@ cdef int __zgesdd(double complex*A, double complex*U, double *s, double complex*
     lwork = int(work_temp.real)
     cdef:
         cnp.ndarray work = _empty_vector(lwork, cnp.NPY_COMPLEX128)
+        double complex *work_data = <double complex*>cnp.PyArray_DATA(work)
+        double *rwork_data = <double*>cnp.PyArray_DATA(rwork)
+        int *iwork_data = <int*>cnp.PyArray_DATA(iwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
     zgesdd(jobz,
            &m, &n, A, &m, s, U, &m, VT, &r,
-           <double complex*>cnp.PyArray_DATA(work), &lwork,
-           <double*>cnp.PyArray_DATA(rwork),
+           work_data, &lwork,
+           rwork_data,
+           iwork_data,
+           &info)
+    __restore_gil(gil)
+    return info
+
+cdef int __sgesvd(float *A, float *U, float *s, float *VT,
+                  int m, int n, int r) noexcept:
+    cdef:
+        int lwork, info
+        char *jobu = 'O' if A == U else 'S'
+        char *jobvt = 'O' if A == VT else 'S'
+        float work_temp
+    lwork = -1
+    sgesvd(jobu, jobvt,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           &work_temp, &lwork, &info)
+    if info != 0:
+        return info
+    lwork = int(work_temp)
+    cdef:
+        cnp.ndarray work = _empty_vector(lwork, cnp.NPY_FLOAT32)
+        float *work_data = <float*>cnp.PyArray_DATA(work)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
+    sgesvd(jobu, jobvt,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           work_data, &lwork, &info)
+    __restore_gil(gil)
+    return info
+
+cdef int __cgesvd(float complex*A, float complex*U, float *s, float complex*VT,
+                  int m, int n, int r) noexcept:
+    cdef:
+        int lwork, info
+        char *jobu = 'O' if A == U else 'S'
+        char *jobvt = 'O' if A == VT else 'S'
+        float complex work_temp
+        cnp.ndarray rwork = _empty_vector(5 * r, cnp.NPY_FLOAT32)
+    lwork = -1
+    cgesvd(jobu, jobvt,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           &work_temp, &lwork, <float*>cnp.PyArray_DATA(rwork),
+           &info)
+    if info != 0:
+        return info
+    lwork = int(work_temp.real)
+    cdef:
+        cnp.ndarray work = _empty_vector(lwork, cnp.NPY_COMPLEX64)
+        float complex *work_data = <float complex*>cnp.PyArray_DATA(work)
+        float *rwork_data = <float*>cnp.PyArray_DATA(rwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
+    cgesvd(jobu, jobvt,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           work_data, &lwork,
+           rwork_data,
+           &info)
+    __restore_gil(gil)
+    return info
+
+cdef int __sgesdd(float *A, float *U, float *s, float *VT,
+                  int m, int n, int r) noexcept:
+    cdef:
+        int lwork, info
+        char *jobz = 'O'
+        float work_temp
+        cnp.ndarray iwork = _empty_vector(8 * r, cnp.NPY_INT)
+    lwork = -1
+    sgesdd(jobz,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           &work_temp, &lwork,
+           <int*>cnp.PyArray_DATA(iwork), &info)
+    if info != 0:
+        return info
+    lwork = int(work_temp)
+    cdef:
+        cnp.ndarray work = _empty_vector(lwork, cnp.NPY_FLOAT32)
+        float *work_data = <float*>cnp.PyArray_DATA(work)
+        int *iwork_data = <int*>cnp.PyArray_DATA(iwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
+    sgesdd(jobz,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           work_data, &lwork,
+           iwork_data, &info)
+    __restore_gil(gil)
+    return info
+
+cdef int __cgesdd(float complex*A, float complex*U, float *s, float complex*VT,
+                  int m, int n, int r) noexcept:
+    cdef:
+        int lwork, info
+        char *jobz
+        float complex work_temp
+        int lrwork = r * max(5*r+7, 2*max(m,n)+2*r+1)
+        cnp.ndarray rwork = _empty_vector(lrwork, cnp.NPY_FLOAT32)
+        cnp.ndarray iwork = _empty_vector(8 * r, cnp.NPY_INT)
+    lwork = -1
+    if A == U or A == VT:
+        jobz = 'O'
+    else:
+        jobz = 'S'
+    cgesdd(jobz,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           &work_temp, &lwork, <float*>cnp.PyArray_DATA(rwork),
            <int*>cnp.PyArray_DATA(iwork),
            &info)
+    if info != 0:
+        return info
+    lwork = int(work_temp.real)
+    cdef:
+        cnp.ndarray work = _empty_vector(lwork, cnp.NPY_COMPLEX64)
+        float complex *work_data = <float complex*>cnp.PyArray_DATA(work)
+        float *rwork_data = <float*>cnp.PyArray_DATA(rwork)
+        int *iwork_data = <int*>cnp.PyArray_DATA(iwork)
+        PyThreadState *gil = __release_gil(<Py_ssize_t>m * n * r)
+    cgesdd(jobz,
+           &m, &n, A, &m, s, U, &m, VT, &r,
+           work_data, &lwork,
+           rwork_data,
+           iwork_data,
+           &info)
+    __restore_gil(gil)
     return info
@@ -15,6 +15,11 @@ cdef enum SimplificationCEnum:
     SIMPLIFICATION_VARIATIONAL_EXACT_GUESS = 3
     SIMPLIFICATION_LAST_CODE = 3
 
+cdef enum PrecisionCEnum:
+    PRECISION_DOUBLE = 0
+    PRECISION_SINGLE = 1
+    PRECISION_LAST_CODE = 1
+
 cdef enum GemmFlags:
     GEMM_NORMAL = 0
     GEMM_TRANSPOSE = 1
@@ -60,6 +65,21 @@ class Simplification:
     VARIATIONAL = SIMPLIFICATION_VARIATIONAL
     VARIATIONAL_EXACT_GUESS = SIMPLIFICATION_VARIATIONAL_EXACT_GUESS
 
+class Precision:
+    """Floating point precision of the tensors created when splitting
+    and truncating tensor networks.
+
+    Attributes
+    ----------
+    DOUBLE
+        Tensors are promoted to `float64` or `complex128`.
+    SINGLE
+        Tensors are kept or cast to `float32` or `complex64`, halving the
+        memory and roughly doubling the speed of the linear algebra.
+    """
+    DOUBLE = PRECISION_DOUBLE
+    SINGLE = PRECISION_SINGLE
+
 DEFAULT_TOLERANCE = float(np.finfo(np.float64).eps)
 """Relative or absolute tolerance in various algorithms"""
 
@@ -82,6 +102,9 @@ cdef class Strategy:
         Whether to normalize the tensor network after simplification.
     max_sweeps : int
         Maximum number of sweeps for the variational simplification methods. Default is 16.
+    precision : int
+        Precision of the tensors produced by the algorithms. Defaults to
+        `Precision.DOUBLE`.
     """
     cdef int method
     cdef double tolerance
@@ -90,7 +113,8 @@ cdef class Strategy:
     cdef int max_sweeps
     cdef bint normalize
     cdef int simplify
-    cdef double (*_truncate)(cnp.ndarray s, Strategy)
+    cdef int precision
+    cdef double (*_truncate)(cnp.ndarray s, Strategy, double)
 
     def __init__(self,
                  method: int = TRUNCATION_RELATIVE_NORM_SQUARED_ERROR,
@@ -99,7 +123,8 @@ cdef class Strategy:
                  max_bond_dimension: int = MAX_BOND_DIMENSION,
                  normalize: bool = False,
                  simplify: int = SIMPLIFICATION_VARIATIONAL,
-                 max_sweeps: int = 16):
+                 max_sweeps: int = 16,
+                 precision: int = PRECISION_DOUBLE):
         if tolerance < 0 or tolerance >= 1.0:
             raise AssertionError("Invalid tolerance argument passed to Strategy")
         if tolerance == 0 and method != TRUNCATION_DO_NOT_TRUNCATE:
@@ -118,6 +143,9 @@ cdef class Strategy:
         if max_sweeps < 0:
             raise AssertionError("Negative or zero number of sweeps in Strategy")
         self.max_sweeps = max_sweeps
+        if precision < 0 or precision > PRECISION_LAST_CODE:
+            raise AssertionError("Invalid precision argument passed to Strategy")
+        self.precision = precision
         self.method = method
         if method == TRUNCATION_DO_NOT_TRUNCATE:
             self._truncate = _truncate_do_not_truncate
@@ -137,14 +165,16 @@ cdef class Strategy:
                  max_bond_dimension: int | None = None,
                  normalize: bool | None = None,
                  simplify: int | None = None,
-                 max_sweeps: int | None = None):
+                 max_sweeps: int | None = None,
+                 precision: int | None = None):
         return Strategy(method = self.method if method is None else method,
                         tolerance = self.tolerance if tolerance is None else tolerance,
                         simplification_tolerance = self.simplification_tolerance if simplification_tolerance is None else simplification_tolerance,
                         max_bond_dimension = self.max_bond_dimension if max_bond_dimension is None else max_bond_dimension,
                         normalize = self.normalize if normalize is None else normalize,
                         simplify = self.simplify if simplify is None else simplify,
-                        max_sweeps = self.max_sweeps if max_sweeps is None else max_sweeps)
+                        max_sweeps = self.max_sweeps if max_sweeps is None else max_sweeps,
+                        precision = self.precision if precision is None else precision)
 
     def get_method(self) -> int:
         return self.method
@@ -170,6 +200,9 @@ cdef class Strategy:
     def get_simplify_flag(self) -> bool:
         return False if self.simplify == 0 else True
 
+    def get_precision(self) -> int:
+        return self.precision
+
     def __str__(self) -> str:
         if self.method == TRUNCATION_DO_NOT_TRUNCATE:
             method="None"
@@ -191,9 +224,11 @@ cdef class Strategy:
             simplification_method="Variational (exact guess)"
         else:
             raise ValueError("Invalid simplification method found in Strategy")
+        precision = "Single" if self.precision == PRECISION_SINGLE else "Double"
         return f"Strategy(method={method}, tolerance={self.tolerance:5g}, " \
                f"max_bond_dimension={self.max_bond_dimension}, normalize={self.normalize}, " \
-               f"simplify={simplification_method}, simplification_tolerance={self.simplification_tolerance:5g}, max_sweeps={self.max_sweeps})"
+               f"simplify={simplification_method}, simplification_tolerance={self.simplification_tolerance:5g}, max_sweeps={self.max_sweeps}, " \
+               f"precision={precision})"
 
 DEFAULT_STRATEGY = Strategy(method = TRUNCATION_RELATIVE_NORM_SQUARED_ERROR,
                             simplify = SIMPLIFICATION_VARIATIONAL,
@@ -219,14 +254,21 @@ NO_TRUNCATION = DEFAULT_STRATEGY.replace(method = TRUNCATION_DO_NOT_TRUNCATE,
                                          simplify = SIMPLIFICATION_DO_NOT_SIMPLIFY)
 """:class:`Strategy` object that does not truncate nor simplify the tensor network."""
 
-cdef double _truncate_do_not_truncate(cnp.ndarray s, Strategy strategy):
-    return 0.0
+cdef double _truncate_do_not_truncate(cnp.ndarray s, Strategy strategy,
+                                      double discarded):
+    return discarded
 
 cdef cnp.ndarray _make_empty_float64_vector(Py_ssize_t N):
     cdef cnp.npy_intp[1] dims = [N]
     return cnp.PyArray_EMPTY(1, &dims[0], cnp.NPY_FLOAT64, 0)
 
-cdef cnp.ndarray _errors_buffer = _make_empty_float64_vector(1024)
+#
+# Cumulative errors are computed in a stack buffer when the vector is small,
+# and in a temporary array otherwise. We avoid module-level buffers so that
+# truncations can run concurrently from different threads.
+#
+cdef enum:
+    _ERRORS_STACK_SIZE = 1024
 
 cdef cnp.float64_t _norm(cnp.float64_t *data, Py_ssize_t N) noexcept nogil:
     cdef:
@@ -248,22 +290,25 @@ cdef void _normalize(cnp.float64_t *data, Py_ssize_t N) noexcept nogil:
 cdef void _resize_vector_in_place(cnp.ndarray s, Py_ssize_t N):
    PyArray_DIMS(s)[0] = N
 
-cdef double _truncate_relative_norm_squared_error(cnp.ndarray s, Strategy strategy):
-    global _errors_buffer
+cdef double _truncate_relative_norm_squared_error(cnp.ndarray s, Strategy strategy,
+                                                 double discarded):
     cdef:
         Py_ssize_t i, final_size, N = s.size
         double max_error, new_norm, final_error
-        double total = 0.0
-        cnp.float64_t *errors
+        double total = discarded
+        cnp.float64_t errors_stack[_ERRORS_STACK_SIZE]
+        cnp.float64_t *errors = errors_stack
+        cnp.ndarray errors_buffer
         cnp.float64_t *s_start = (<cnp.float64_t*>PyArray_DATA(s))
         cnp.float64_t *data = &s_start[N-1]
-    if cnp.PyArray_SIZE(_errors_buffer) <= N:
-        _errors_buffer = _make_empty_float64_vector(2 * N)
-    errors = <cnp.float64_t*>PyArray_DATA(_errors_buffer)
+    if N >= _ERRORS_STACK_SIZE:
+        errors_buffer = _make_empty_float64_vector(N + 1)
+        errors = <cnp.float64_t*>PyArray_DATA(errors_buffer)
     #
     # Compute the cumulative sum of the reduced density matrix eigen values
     # in reversed order. Thus errors[i] is the error we make when we drop
-    # i singular values.
+    # i singular values, on top of the weight that was `discarded` before
+    # the vector `s` was computed (e.g. by a randomized SVD).
     #
     for i in range(N):
         errors[i] = total
@@ -277,6 +322,9 @@ cdef double _truncate_relative_norm_squared_error(cnp.ndarray s, Strategy strate
         if errors[i] > max_error:
             i -= 1
             break
+    # If the `discarded` weight alone exceeds the tolerance, we keep everything
+    if i < 0:
+        i = 0
     final_size = min(N - i, strategy.max_bond_dimension)
     max_error = errors[N - final_size]
     if False: #strategy.normalize:
@@ -286,7 +334,8 @@ cdef double _truncate_relative_norm_squared_error(cnp.ndarray s, Strategy strate
     PyArray_DIMS(s)[0] = final_size
     return max_error
 
-cdef double _truncate_relative_singular_value(cnp.ndarray s, Strategy strategy):
+cdef double _truncate_relative_singular_value(cnp.ndarray s, Strategy strategy,
+                                              double discarded):
     cdef:
         cnp.float64_t *data = <cnp.float64_t*>PyArray_DATA(s)
         double max_error = strategy.tolerance * data[0]
@@ -296,7 +345,7 @@ cdef double _truncate_relative_singular_value(cnp.ndarray s, Strategy strategy):
         if data[i] <= max_error:
             final_size = i
             break
-    max_error = 0.0
+    max_error = discarded
     for i in range(final_size, N):
         max_error += data[i] * data[i]
     if False: #strategy.normalize:
@@ -306,7 +355,8 @@ cdef double _truncate_relative_singular_value(cnp.ndarray s, Strategy strategy):
     PyArray_DIMS(s)[0] = final_size
     return max_error
 
-cdef double _truncate_absolute_singular_value(cnp.ndarray s, Strategy strategy):
+cdef double _truncate_absolute_singular_value(cnp.ndarray s, Strategy strategy,
+                                              double discarded):
     cdef:
         cnp.float64_t *data = <cnp.float64_t*>PyArray_DATA(s)
         double max_error = strategy.tolerance
@@ -316,7 +366,7 @@ cdef double _truncate_absolute_singular_value(cnp.ndarray s, Strategy strategy):
         if data[i] <= max_error:
             final_size = i
             break
-    max_error = 0.0
+    max_error = discarded
     for i in range(final_size, N):
         max_error += data[i] * data[i]
     if False: #strategy.normalize:
@@ -326,8 +376,14 @@ cdef double _truncate_absolute_singular_value(cnp.ndarray s, Strategy strategy):
     PyArray_DIMS(s)[0] = final_size
     return max_error
 
-def destructively_truncate_vector(s, Strategy strategy) -> float:
+def destructively_truncate_vector(s, Strategy strategy, double discarded = 0.0) -> float:
+    """Truncate the vector of singular values `s` in place, according to
+    `strategy`, and return the squared norm of the dropped values.
+
+    `discarded` is the squared norm of singular values that were already
+    dropped when computing `s`, as reported by :func:`_randomized_svd`.
+    It is included both in the output and in the relative error criteria."""
     assert (cnp.PyArray_Check(s) and
             cnp.PyArray_TYPE(<cnp.ndarray>s) == cnp.NPY_FLOAT64 or
             cnp.PyArray_NDIM(<cnp.ndarray>s) == 1)
-    return strategy._truncate(<cnp.ndarray>s, strategy)
+    return strategy._truncate(<cnp.ndarray>s, strategy, discarded)
@@ -14,13 +14,6 @@ from seemps.evolution.common import ode_solver, ODECallback, TimeSpan
 
 
 class TDVPForm(QuadraticForm):
-    def one_site_Hamiltonian(self, i: int) -> OneSiteDMRGOperator:
-        return OneSiteDMRGOperator(  # pyright: ignore[reportCallIssue]
-            self.left_env[i],  # pyright: ignore[reportArgumentType]
-            self.H[i],  # pyright: ignore[reportArgumentType]
-            self.right_env[i],  # pyright: ignore[reportArgumentType]
-        )
-
     def two_site_Hamiltonian(self, i: int) -> DMRGMatrixOperator:
         assert i == self.site
         return DMRGMatrixOperator(  # pyright: ignore[reportCallIssue]
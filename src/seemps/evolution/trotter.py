@@ -4,7 +4,7 @@ from ..typing import Unitary, to_dense_operator
 import scipy.linalg
 from ..hamiltonians import NNHamiltonian  # type: ignore
 from ..state import Strategy, DEFAULT_STRATEGY, MPS, CanonicalMPS
-from ..cython import _contract_nrjl_ijk_klm
+from ..cython import _cast_to_precision, _contract_nrjl_ijk_klm
 
 
 class PairwiseUnitaries:
@@ -30,7 +30,12 @@ class PairwiseUnitaries:
 
     def __init__(self, H: NNHamiltonian, dt: float, strategy: Strategy):
         self.U = [
-            scipy.linalg.expm(to_dense_operator((-1j * dt) * H.interaction_term(k)))
+            _cast_to_precision(
+                scipy.linalg.expm(
+                    to_dense_operator((-1j * dt) * H.interaction_term(k))
+                ),
+                strategy,
+            )
             for k in range(H.size - 1)
         ]
         self.strategy = strategy
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from .typing import Operator, Weight, Vector, to_dense_operator
+from .typing import Operator, Weight, Vector, Matrix, to_dense_operator
 import numpy as np
 from .state.environments import (
     _begin_environment,
@@ -76,6 +76,55 @@ def all_expectation1(state: MPS, O: list[Operator] | Operator) -> Vector:
     return state.all_expectation1(O)
 
 
+def all_expectation2(state: MPS, O: Operator, Q: Operator) -> Matrix:
+    """Matrix of expectation values :math:`C_{ij} = \\langle\\psi|O_i Q_j|\\psi\\rangle`
+    for all pairs of sites of the MPS, computed in a single sweep with
+    :math:`O(N^2)` contractions.
+
+    Parameters
+    ----------
+    state : MPS
+        State :math:`\\psi` onto which the expectation values are computed.
+    O, Q : Operator
+        Local observables.
+
+    Returns
+    -------
+    Matrix
+        Numpy array of expectation values. The diagonal contains the
+        expectation values of the product `O @ Q` on each site.
+    """
+    return state.all_expectation2(O, Q)
+
+
+def all_connected_expectation2(state: MPS, O: Operator, Q: Operator) -> Matrix:
+    """Matrix of connected correlations
+    :math:`C_{ij} = \\langle O_i Q_j\\rangle - \\langle O_i\\rangle\\langle Q_j\\rangle`
+    for all pairs of sites of the MPS.
+
+    Parameters
+    ----------
+    state : MPS
+        State :math:`\\psi` onto which the correlations are computed.
+    O, Q : Operator
+        Local observables.
+
+    Returns
+    -------
+    Matrix
+        Numpy array of connected correlations, with
+        :math:`\\langle (OQ)_i\\rangle - \\langle O_i\\rangle\\langle Q_i\\rangle`
+        on the diagonal.
+
+    See also
+    --------
+    :func:`all_expectation2`
+    """
+    return state.all_expectation2(O, Q) - np.outer(
+        state.all_expectation1(O), state.all_expectation1(Q)
+    )
+
+
 def product_expectation(state: MPS, operator_list: list[Operator]) -> Weight:
     """Expectation value of a product of local operators
     :math:`\\langle\\psi|O_0 O_1 \\cdots O_{N-1}|\\psi\\rangle`.
@@ -108,7 +157,9 @@ def mpo_expectation(state: MPS, operator: MPO) -> Weight:
 
 
 __all__ = [
+    "all_connected_expectation2",
     "all_expectation1",
+    "all_expectation2",
     "expectation1",
     "expectation2",
     "mpo_expectation",
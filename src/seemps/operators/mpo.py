@@ -3,7 +3,7 @@ from collections.abc import Sequence
 from typing import overload
 import warnings
 import numpy as np
-from ..cython import _contract_last_and_first
+from ..cython import _contract_last_and_first, _left_orth_2site
 from ..tools import InvalidOperation
 from ..typing import (
     Tensor4,
@@ -13,7 +13,15 @@ from ..typing import (
     Operator,
     to_dense_operator,
 )
-from ..state import DEFAULT_STRATEGY, MPS, CanonicalMPS, MPSSum, Strategy, TensorArray
+from ..state import (
+    DEFAULT_STRATEGY,
+    NO_TRUNCATION,
+    MPS,
+    CanonicalMPS,
+    MPSSum,
+    Strategy,
+    TensorArray,
+)
 from ..state.environments import (
     scprod,
     begin_mpo_environment,
@@ -45,6 +53,61 @@ def _mpo_multiply_tensor(A: Tensor4, B: Tensor3):
     ).reshape(c * a, i, d * b)
 
 
+def _zipup(mpo: Sequence[Tensor4], state: MPS, strategy: Strategy) -> CanonicalMPS:
+    """Contract the tensors of an MPO with a state in a single sweep,
+    truncating each bond of the product as soon as it is created (zip-up
+    algorithm), so that the bond dimension `D*W` only appears locally."""
+    # The truncations are more accurate when the part of the state that
+    # is not yet contracted is in right-canonical form
+    if not isinstance(state, CanonicalMPS) or state.center != 0:
+        state = CanonicalMPS(state, center=0, strategy=NO_TRUNCATION)
+    truncation = strategy.replace(normalize=False)
+    last = state.size - 1
+    tensors = []
+    error = 0.0
+    C = np.ones((1, 1))
+    for i, (O, A) in enumerate(zip(mpo, state)):
+        # C[r,x], P[x,i,y] -> T[r,i,y]
+        T = np.tensordot(C, _mpo_multiply_tensor(O, A), (1, 0))
+        if i == last:
+            tensors.append(T)
+        else:
+            B, C, err = _left_orth_2site(T[:, :, :, np.newaxis], truncation)
+            tensors.append(B)
+            C = C[:, :, 0]
+            error += err
+    output = CanonicalMPS(
+        tensors, center=last, is_canonical=True, error=state.error() + error
+    )
+    if strategy.get_normalize_flag():
+        output.normalize_inplace()
+    return output
+
+
+MAX_FUSED_BOND_DIMENSION: int = 64
+"""Largest bond dimension of the operators that :meth:`MPOList.apply` fuses
+into one for the variational fit."""
+
+
+def _fused_groups(mpos: Sequence[MPO]) -> list[Sequence[Tensor4]]:
+    """Split a sequence of MPOs into runs of consecutive operators whose
+    product has bond dimensions below `MAX_FUSED_BOND_DIMENSION`, returning
+    the tensors of each product."""
+    groups: list[list[MPO]] = []
+    bonds: list[int] = []
+    for mpo in mpos:
+        new_bonds = [O.shape[-1] for O in mpo]
+        if groups:
+            joint_bonds = [a * b for a, b in zip(bonds, new_bonds)]
+            if max(joint_bonds) <= MAX_FUSED_BOND_DIMENSION:
+                groups[-1].append(mpo)
+                bonds = joint_bonds
+                continue
+        groups.append([mpo])
+        bonds = new_bonds
+    return [g[0] if len(g) == 1 else MPOList(g).join() for g in groups]
+
+
 class MPO(TensorArray):
     """Matrix Product Operator class.
 
@@ -216,6 +279,8 @@ class MPO(TensorArray):
         state: MPS,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
+        guess: MPS | None = None,
     ) -> MPS: ...
 
     @overload
@@ -224,6 +289,8 @@ class MPO(TensorArray):
         state: MPSSum,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
+        guess: MPS | None = None,
     ) -> MPS: ...
 
     def apply(
@@ -231,6 +298,8 @@ class MPO(TensorArray):
         state: MPS | MPSSum,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
+        guess: MPS | None = None,
     ) -> MPS | MPSSum:
         """Implement multiplication `A @ state` between a matrix-product operator
         `A` and a matrix-product state `state`.
@@ -244,6 +313,19 @@ class MPO(TensorArray):
         simplify : bool, optional
             Whether to simplify the state after the contraction.
             Defaults to `strategy.get_simplify_flag()`
+        method : str, default = "product"
+            With "product", contract each tensor of the MPO with the state,
+            producing bond dimensions `D*W` that are simplified afterwards.
+            With "fit", optimize the output variationally against the
+            environments of the MPO and the state (see
+            :func:`~seemps.state.simplification.simplify_mpo_product`), so
+            that the product is never built. With "zipup", contract and
+            truncate the product site by site in a single sweep; if
+            `simplify` is true, the result is then polished with the
+            variational fit.
+        guess : MPS, optional
+            Initial guess for the "fit" method, such as the result of a
+            previous application.
 
         Returns
         -------
@@ -255,6 +337,30 @@ class MPO(TensorArray):
             strategy = self.strategy
         if simplify is None:
             simplify = strategy.get_simplify_flag()
+        if method == "fit":
+            if not isinstance(state, (MPS, MPSSum)):
+                raise TypeError(f"Cannot multiply MPO with {state}")
+            assert self.size == state.size
+            return simplify_mpo_product(self, state, strategy, guess=guess)
+        if method == "zipup":
+            if isinstance(state, MPSSum):
+                assert self.size == state.size
+                state = MPSSum(
+                    state.weights, [_zipup(self, s, strategy) for s in state.states]
+                )
+                return simplify_mps(state, strategy=strategy) if simplify else state
+            if not isinstance(state, MPS):
+                raise TypeError(f"Cannot multiply MPO with {state}")
+            assert self.size == state.size
+            output = _zipup(self, state, strategy)
+            if simplify:
+                # The zip-up leaves the center at the end of the chain
+                output = simplify_mpo_product(
+                    self, state, strategy, direction=-1, guess=output
+                )
+            return output
+        if method != "product":
+            raise Exception(f'Unknown MPO.apply method "{method}"')
         if isinstance(state, MPSSum):
             assert self.size == state.size
             for i, (w, mps) in enumerate(zip(state.weights, state.states)):
@@ -547,6 +653,7 @@ class MPOList(object):
         state: MPS,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
     ) -> MPS: ...
 
     @overload
@@ -555,6 +662,7 @@ class MPOList(object):
         state: MPSSum,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
     ) -> MPS | MPSSum: ...
 
     # TODO: Describe how `strategy` and simplify act as compared to
@@ -564,6 +672,7 @@ class MPOList(object):
         state: MPS | MPSSum,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
     ) -> MPS | MPSSum:
         """Implement multiplication `A @ state` between a matrix-product operator
         `A` and a matrix-product state `state`.
@@ -577,6 +686,12 @@ class MPOList(object):
         simplify : bool, optional
             Whether to simplify the state after the contraction.
             Defaults to `strategy.get_simplify_flag()`
+        method : str, default = "product"
+            Method with which each operator is applied, as in
+            :meth:`MPO.apply`. With "fit", consecutive operators are fused
+            into products with bond dimension up to `MAX_FUSED_BOND_DIMENSION`
+            and each product is fitted variationally in one pass, so that
+            the intermediate states are never formed.
 
         Returns
         -------
@@ -588,9 +703,16 @@ class MPOList(object):
         if simplify is None:
             simplify = strategy.get_simplify_flag()
 
+        if method == "fit":
+            if not isinstance(state, (MPS, MPSSum)):
+                raise TypeError(f"Cannot multiply MPOList with {state}")
+            assert self.size == state.size
+            for tensors in _fused_groups(self.mpos):
+                state = simplify_mpo_product(tensors, state, strategy)
+            return state
         for mpo in self.mpos:
             # log(f'Total error before applying MPOList {b.error()}')
-            state = mpo.apply(state)
+            state = mpo.apply(state, method=method)
         if simplify:
             state = simplify_mps(state, strategy=strategy)
         return state
@@ -702,5 +824,5 @@ class MPOList(object):
         return MPOList([o.reverse() for o in self.mpos], self.strategy)
 
 
-from ..state.simplification import simplify_mps  # noqa: E402
+from ..state.simplification import simplify_mps, simplify_mpo_product  # noqa: E402
 from .mposum import MPOSum  # noqa: E402
@@ -6,6 +6,7 @@ from ..typing import Weight, DenseOperator, Tensor4
 from ..state import DEFAULT_STRATEGY, MPS, MPSSum, Strategy
 from .mpo import MPO, MPOList
 from ..state import simplify_mps
+from ..state.simplification import simplify_mpo_sum_product
 
 
 class MPOSum(object):
@@ -163,16 +164,54 @@ class MPOSum(object):
         state: MPS | MPSSum,
         strategy: Strategy | None = None,
         simplify: bool | None = None,
+        method: str = "product",
+        guess: MPS | None = None,
     ) -> MPS | MPSSum:
         """Implement multiplication A @ state between an MPOSum 'A' and
-        a Matrix Product State 'state'."""
-        output = MPSSum(
-            [1] * len(self.weights),
-            [w * O.apply(state) for w, O in zip(self.weights, self.mpos)],
-        )
+        a Matrix Product State 'state'.
+
+        Parameters
+        ----------
+        state : MPS | MPSSum
+            Transformed state.
+        strategy : Strategy, optional
+            Truncation strategy, defaults to the one of the MPOSum.
+        simplify : bool, optional
+            Whether to simplify the state after the contraction.
+            Defaults to `strategy.get_simplify_flag()`
+        method : str, default = "product"
+            With "fit", the linear combination of the products is fitted
+            variationally with one set of environments per term (see
+            :func:`~seemps.state.simplification.simplify_mpo_sum_product`),
+            without forming the products themselves. Otherwise, each term
+            is applied with this method (see :meth:`MPO.apply`) and the
+            outcomes are added.
+        guess : MPS, optional
+            Initial guess for the "fit" method.
+
+        Returns
+        -------
+        MPS | MPSSum
+            The result of the contraction.
+        """
         # TODO: Is this really needed?
         if strategy is None:
             strategy = self.strategy
+        if method == "fit":
+            if not isinstance(state, (MPS, MPSSum)):
+                raise TypeError(f"Cannot multiply MPOSum with {state}")
+            assert self.size == state.size
+            operators = [O.join() if isinstance(O, MPOList) else O for O in self.mpos]
+            return simplify_mpo_sum_product(
+                operators, self.weights, state, strategy, guess=guess
+            )
+        output = MPSSum(
+            [1] * len(self.weights),
+            [
+                w * O.apply(state, method=method)
+                for w, O in zip(self.weights, self.mpos)
+            ],
+        )
         if simplify is None:
             simplify = strategy.get_simplify_flag()
         if simplify:
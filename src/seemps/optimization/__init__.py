@@ -1,5 +1,6 @@
 from .descent import gradient_descent, OptimizeResults
 from .dmrg import dmrg
+from .eigensolvers import davidson, lanczos
 from .arnoldi import arnoldi_eigh
 from .power import power_method
 
@@ -7,6 +8,8 @@ __all__ = [
     "OptimizeResults",
     "gradient_descent",
     "dmrg",
+    "davidson",
+    "lanczos",
     "arnoldi_eigh",
     "power_method",
 ]
@@ -1,20 +1,33 @@
 from __future__ import annotations
 from typing import Callable
 import numpy as np
+import scipy.linalg
 import scipy.sparse.linalg
 from ..tools import make_logger
-from ..typing import Tensor4
+from ..typing import Tensor3, Tensor4, Weight
 from ..state import DEFAULT_STRATEGY, MPS, CanonicalMPS, Strategy, random_mps
-from ..cython import _contract_last_and_first
+from ..cython import (
+    _cast_to_precision,
+    _contract_last_and_first,
+    _left_orth_2site,
+    _right_orth_2site,
+)
 from ..state.environments import (
     MPOEnvironment,
     begin_mpo_environment,
     update_left_mpo_environment,
+    update_left_mpo_squared_environment,
     update_right_mpo_environment,
 )
 from ..operators import MPO
 from ..hamiltonians import NNHamiltonian
+from ..symmetry import (
+    BlockSparseTensor,
+    canonical_symmetric_mps,
+    tensordot as bs_tensordot,
+)
 from .descent import OptimizeResults
+from .eigensolvers import davidson, lanczos
 from numpy import tensordot
 
 
@@ -89,6 +102,106 @@ class DMRGMatrixOperator(scipy.sparse.linalg.LinearOperator):
         r_e = np.trace(self.R, axis1=0, axis2=2)
         return np.dot(l_c, np.dot(w_ce, r_e))
 
+    def diagonal(self) -> np.ndarray:
+        """Diagonal of the operator, as a vector."""
+        return np.einsum(
+            "aca,ciijjh,ehe->aije", self.L, self.H12, self.R, optimize=True
+        ).reshape(-1)
+
+
+class TwoSiteDMRGOperator(scipy.sparse.linalg.LinearOperator):
+    """Two-site DMRG Hamiltonian that applies the environments and the two
+    MPO tensors one after another, without forming their six-leg product.
+
+    The tensors are absorbed starting from the left or from the right
+    environment, whichever takes fewer operations for the given dimensions.
+    For local dimensions `d > 2` this saves memory and operations with
+    respect to :class:`DMRGMatrixOperator`.
+    """
+
+    L: np.ndarray
+    H1: np.ndarray
+    H2: np.ndarray
+    R: np.ndarray
+    v_shape: tuple[int, int, int, int]
+    from_left: bool
+
+    def __init__(self, L: np.ndarray, H1: np.ndarray, H2: np.ndarray, R: np.ndarray):
+        self.L = L
+        self.H1 = H1
+        self.H2 = H2
+        self.R = R
+        _, _, b = L.shape
+        _, _, k, _ = H1.shape
+        _, _, l, _ = H2.shape
+        _, _, f = R.shape
+        self.v_shape = (b, k, l, f)
+        left, right = self.costs(L, H1, H2, R)
+        self.from_left = left <= right
+        super().__init__(
+            shape=(b * k * l * f, b * k * l * f),  # type: ignore # pyright: ignore[reportCallIssue]
+            dtype=np.result_type(L, H1, H2, R),  # type: ignore # pyright: ignore[reportCallIssue]
+        )
+
+    @staticmethod
+    def costs(
+        L: np.ndarray, H1: np.ndarray, H2: np.ndarray, R: np.ndarray
+    ) -> tuple[int, int]:
+        """Number of operations of a product, when the tensors are absorbed
+        starting from the left and from the right environment."""
+        a, c, b = L.shape
+        _, i, k, g = H1.shape
+        _, j, l, h = H2.shape
+        e, _, f = R.shape
+        left = (
+            a * c * b * k * l * f
+            + a * l * f * c * k * i * g
+            + a * f * i * g * l * j * h
+            + a * i * j * f * h * e
+        )
+        right = (
+            b * k * l * f * h * e
+            + b * k * e * l * h * g * j
+            + b * e * j * k * g * c * i
+            + b * e * j * i * c * a
+        )
+        return left, right
+
+    def _matvec(self, v: np.ndarray) -> np.ndarray:
+        v = v.reshape(self.v_shape)
+        if self.from_left:
+            # acb,bklf->acklf->alfig->afijh->aije
+            aux = tensordot(self.L, v, (2, 0))
+            aux = tensordot(aux, self.H1, ((1, 2), (0, 2)))
+            aux = tensordot(aux, self.H2, ((4, 1), (0, 2)))
+            return tensordot(aux, self.R, ((1, 4), (2, 1))).reshape(-1)
+        # bklf,ehf->bkleh->bkegj->bejci->ejia
+        aux = tensordot(v, self.R, (3, 2))
+        aux = tensordot(aux, self.H2, ((2, 4), (2, 3)))
+        aux = tensordot(aux, self.H1, ((1, 3), (2, 3)))
+        aux = tensordot(aux, self.L, ((0, 3), (2, 1)))
+        return aux.transpose(3, 2, 1, 0).reshape(-1)
+
+    def _rmatvec(self, v: np.ndarray) -> np.ndarray:
+        v = v.reshape(self.L.shape[0], self.H1.shape[1], self.H2.shape[1], -1)
+        aux = tensordot(v, self.L.conj(), (0, 0))
+        aux = tensordot(aux, self.H1.conj(), ((0, 3), (1, 0)))
+        aux = tensordot(aux, self.H2.conj(), ((0, 4), (1, 0)))
+        return tensordot(aux, self.R.conj(), ((0, 4), (0, 1))).reshape(-1)
+
+    def trace(self) -> complex:
+        l_c = np.trace(self.L, axis1=0, axis2=2)
+        w1_cg = np.trace(self.H1, axis1=1, axis2=2)
+        w2_gh = np.trace(self.H2, axis1=1, axis2=2)
+        r_h = np.trace(self.R, axis1=0, axis2=2)
+        return np.dot(l_c, np.dot(w1_cg, np.dot(w2_gh, r_h)))
+
+    def diagonal(self) -> np.ndarray:
+        """Diagonal of the operator, as a vector."""
+        return np.einsum(
+            "aca,ciig,gjjh,ehe->aije", self.L, self.H1, self.H2, self.R, optimize=True
+        ).reshape(-1)
+
 
 class OneSiteDMRGOperator(scipy.sparse.linalg.LinearOperator):
     L: np.ndarray
@@ -105,7 +218,7 @@ class OneSiteDMRGOperator(scipy.sparse.linalg.LinearOperator):
         _, _, k, _ = H.shape
         self.v_shape = (b, k, f)
 
-        super().__init__(dtype=L.dtype, shape=(b * k * f, b * k * f))  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
+        super().__init__(dtype=np.result_type(L, H, R), shape=(b * k * f, b * k * f))  # type: ignore[call-arg] # pyright: ignore[reportCallIssue]
 
     def _matvec(self, v: np.ndarray) -> np.ndarray:
         v = v.reshape(self.v_shape)
@@ -134,6 +247,40 @@ class OneSiteDMRGOperator(scipy.sparse.linalg.LinearOperator):
         r_e = np.trace(self.R, axis1=0, axis2=2)
         return np.dot(l_c, np.dot(w_ce, r_e))
 
+    def diagonal(self) -> np.ndarray:
+        """Diagonal of the operator, as a vector."""
+        return np.einsum(
+            "aca,ciie,fef->aif", self.L, self.H_mpo, self.R, optimize=True
+        ).reshape(-1)
+
+
+def _lowest_eigenpair(
+    Op: scipy.sparse.linalg.LinearOperator,
+    v: np.ndarray,
+    tol: float,
+    eigensolver: str,
+    max_subspace: int,
+    diagonal: np.ndarray | None = None,
+) -> tuple[float, np.ndarray]:
+    """Lowest eigenvalue and eigenvector of `Op`, starting from `v`."""
+    n = Op.shape[0]
+    if n <= 16:
+        # ARPACK cannot handle very small problems
+        evals, evecs = scipy.linalg.eigh(Op @ np.eye(n, dtype=Op.dtype))
+        return evals[0], evecs[:, 0]
+    # No solver converges below the precision of the tensors
+    tol = max(tol, float(np.finfo(v.dtype).eps))
+    match eigensolver:
+        case "arpack":
+            eval, evec = scipy.sparse.linalg.eigsh(Op, 1, which="SA", v0=v, tol=tol)
+            return eval[0], evec[:, 0]
+        case "davidson":
+            return davidson(Op, v, diagonal, tol, max_subspace)
+        case "lanczos":
+            return lanczos(Op, v, tol, max_subspace)
+        case _:
+            raise Exception(f'Unknown eigensolver "{eigensolver}"')
+
 
 class QuadraticForm:
     H: MPO
@@ -153,8 +300,9 @@ class QuadraticForm:
             raise Exception(
                 "In QuadraticForm, MPO and MPS do not have matching dimensions"
             )
-        left_env = [begin_mpo_environment()] * size
-        right_env = left_env.copy()
+        first, last = self._begin_environments()
+        left_env = [first] * size
+        right_env = [last] * size
         env = right_env[-1]
         for i in range(size - 1, start, -1):
             right_env[i - 1] = env = update_right_mpo_environment(
@@ -167,24 +315,68 @@ class QuadraticForm:
             )
         self.left_env = left_env
         self.right_env = right_env
-        self.site = start
+        self.site = min(start, size - 2)
+
+    def _begin_environments(self) -> tuple[MPOEnvironment, MPOEnvironment]:
+        """Environments at the left and right boundaries of the network."""
+        return begin_mpo_environment(), begin_mpo_environment()
 
-    def two_site_Hamiltonian(self, i: int) -> DMRGMatrixOperator:
+    def two_site_Hamiltonian(self, i: int) -> DMRGMatrixOperator | TwoSiteDMRGOperator:
         assert i == self.site
-        return DMRGMatrixOperator(  # pyright: ignore[reportCallIssue]
-            self.left_env[i],  # type: ignore # pyright: ignore[reportArgumentType]
-            _contract_last_and_first(self.H[i], self.H[i + 1]),  # type: ignore # pyright: ignore[reportArgumentType]
-            self.right_env[i + 1],  # type: ignore # pyright: ignore[reportArgumentType]
+        L, R = self.left_env[i], self.right_env[i + 1]
+        H1, H2 = self.H[i], self.H[i + 1]
+        #
+        # Contracting with H12 = H1 * H2 costs O(d^4) per application in the
+        # physical dimension 'd', while absorbing H1 and H2 one after another
+        # costs O(2 d^3). We only build H12 when it is not more expensive,
+        # as happens for qubits, because it saves one contraction.
+        #
+        a, c, b = L.shape
+        _, p, k, _ = H1.shape
+        _, q, l, h = H2.shape
+        e, _, f = R.shape
+        H12_cost = (
+            a * c * b * k * l * f
+            + a * f * c * k * l * p * q * h
+            + a * p * q * f * h * e
+        )
+        if H12_cost <= min(TwoSiteDMRGOperator.costs(L, H1, H2, R)):  # type: ignore
+            return DMRGMatrixOperator(  # pyright: ignore[reportCallIssue]
+                L,  # type: ignore # pyright: ignore[reportArgumentType]
+                _contract_last_and_first(H1, H2),  # type: ignore # pyright: ignore[reportArgumentType]
+                R,  # type: ignore # pyright: ignore[reportArgumentType]
+            )
+        return TwoSiteDMRGOperator(L, H1, H2, R)  # type: ignore
+
+    def one_site_Hamiltonian(self, i: int) -> OneSiteDMRGOperator:
+        return OneSiteDMRGOperator(  # pyright: ignore[reportCallIssue]
+            self.left_env[i],  # pyright: ignore[reportArgumentType]
+            self.H[i],  # pyright: ignore[reportArgumentType]
+            self.right_env[i],  # pyright: ignore[reportArgumentType]
         )
 
-    def diagonalize(self, i: int, tol: float) -> tuple[float, Tensor4]:
+    def diagonalize(
+        self, i: int, tol: float, eigensolver: str = "arpack", max_subspace: int = 20
+    ) -> tuple[float, Tensor4]:
         Op = self.two_site_Hamiltonian(i)
         v = _contract_last_and_first(self.state[i], self.state[i + 1])
         v /= np.linalg.norm(v.reshape(-1))
-        eval, evec = scipy.sparse.linalg.eigsh(
-            Op, 1, which="SA", v0=v.reshape(-1), tol=tol
+        diagonal = Op.diagonal() if eigensolver == "davidson" else None
+        eval, evec = _lowest_eigenpair(
+            Op, v.reshape(-1), tol, eigensolver, max_subspace, diagonal
         )
-        return eval[0], evec.reshape(v.shape)
+        return eval, evec.reshape(v.shape)
+
+    def diagonalize_one_site(
+        self, i: int, tol: float, eigensolver: str = "arpack", max_subspace: int = 20
+    ) -> tuple[float, Tensor3]:
+        Op = self.one_site_Hamiltonian(i)
+        v = self.state[i] / np.linalg.norm(self.state[i].reshape(-1))
+        diagonal = Op.diagonal() if eigensolver == "davidson" else None
+        eval, evec = _lowest_eigenpair(
+            Op, v.reshape(-1), tol, eigensolver, max_subspace, diagonal
+        )
+        return eval, evec.reshape(v.shape)
 
     def solve(
         self,
@@ -217,6 +409,232 @@ class QuadraticForm:
             )
             self.site = i - 1
 
+    def update_1site_right(
+        self, A: Tensor3, i: int, strategy: Strategy, mixing: float = 0.0
+    ) -> None:
+        """Replace the center `i` of the state with `A` and move the center to
+        `i+1`, expanding the bond with the perturbation `mixing * H @ A`
+        before it is truncated (subspace expansion of DMRG3S)."""
+        B = self.state[i + 1]
+        if mixing:
+            # P[a,k,e,b] = L[a,c,a'] W[c,k,k',e] A[a',k',b]
+            P = tensordot(self.left_env[i], A, (2, 0))
+            P = tensordot(P, self.H[i], ([1, 2], [0, 2])).transpose(0, 2, 3, 1)
+            P = P.reshape(P.shape[0], P.shape[1], -1)
+            A = np.concatenate([A, mixing * P], axis=2)
+            B = np.concatenate(
+                [B, np.zeros((P.shape[2],) + B.shape[1:], dtype=B.dtype)], axis=0
+            )
+        U, C, error = _left_orth_2site(A[:, :, :, np.newaxis], strategy)
+        self.state[i] = U
+        self.state[i + 1] = tensordot(C[:, :, 0], B, (1, 0))
+        self.state.center = i + 1
+        self.state.update_error(error)
+        self.left_env[i + 1] = update_left_mpo_environment(
+            self.left_env[i], self.state[i], self.H[i], self.state[i]
+        )
+        self.site = min(i + 1, self.size - 2)
+
+    def update_1site_left(
+        self, A: Tensor3, i: int, strategy: Strategy, mixing: float = 0.0
+    ) -> None:
+        """Replace the center `i` of the state with `A` and move the center to
+        `i-1`, expanding the bond as in :meth:`update_1site_right`."""
+        B = self.state[i - 1]
+        if mixing:
+            # P[c,a,k,d] = W[c,k,k',e] A[a,k',b] R[d,e,b]
+            P = tensordot(A, self.right_env[i], (2, 2))
+            P = tensordot(P, self.H[i], ([1, 3], [2, 3])).transpose(2, 0, 3, 1)
+            P = P.reshape(-1, P.shape[2], P.shape[3])
+            A = np.concatenate([A, mixing * P], axis=0)
+            B = np.concatenate(
+                [B, np.zeros(B.shape[:2] + (P.shape[0],), dtype=B.dtype)], axis=2
+            )
+        C, V, error = _right_orth_2site(A[np.newaxis, :, :, :], strategy)
+        self.state[i] = V
+        self.state[i - 1] = tensordot(B, C[0, :, :], (2, 0))
+        self.state.center = i - 1
+        self.state.update_error(error)
+        self.right_env[i - 1] = update_right_mpo_environment(
+            self.right_env[i], self.state[i], self.H[i], self.state[i]
+        )
+        self.site = i - 1
+
+    def _begin_squared_environment(self) -> Tensor4:
+        """Left boundary of the environments with two copies of the MPO."""
+        return np.ones((1, 1, 1, 1))
+
+    def _two_site_vector(self, Op: scipy.sparse.linalg.LinearOperator) -> np.ndarray:
+        """Vector of the current two-site tensor, in the space where `Op` acts."""
+        i = self.site
+        return _contract_last_and_first(self.state[i], self.state[i + 1]).reshape(-1)
+
+    def energy_and_variance(self, variance: str = "environment") -> tuple[float, float]:
+        """Expected value of the energy and its variance in the current state.
+
+        Parameters
+        ----------
+        variance : str, default = "environment"
+            How to compute the variance. "environment" contracts the state with
+            two copies of the MPO, without building :math:`H\\psi`. "two-site"
+            only uses the effective Hamiltonian of the current pair of sites,
+            which gives a cheap lower bound of the variance. "full" computes
+            the norm of the MPS :math:`H\\psi`, whose bond dimension is that of
+            the state times that of the MPO.
+
+        Returns
+        -------
+        tuple[float, float]
+            Energy and variance, normalized by the norm of the state.
+        """
+        norm2 = np.linalg.norm(self.state[self.state.center]) ** 2
+        match variance:
+            case "environment":
+                left = self._begin_environments()[0]
+                rho = self._begin_squared_environment()
+                for A, O in zip(self.state, self.H):
+                    left = update_left_mpo_environment(left, A, O, A)
+                    rho = update_left_mpo_squared_environment(rho, A, O, O, A)
+                energy = _environment_sum(left).real
+                H2 = _environment_sum(rho).real
+            case "two-site":
+                Op = self.two_site_Hamiltonian(self.site)
+                v = self._two_site_vector(Op)
+                Hv = Op @ v
+                energy = np.vdot(v, Hv).real
+                H2 = np.vdot(Hv, Hv).real
+            case "full":
+                energy = self.H.expectation(self.state).real
+                H2 = (self.H @ self.state).norm_squared()
+            case _:
+                raise Exception(f'Unknown variance method "{variance}"')
+        energy, H2 = float(energy) / norm2, float(H2) / norm2
+        return energy, abs(H2 - energy * energy)
+
+
+class SymmetricDMRGOperator(scipy.sparse.linalg.LinearOperator):
+    """Two-site DMRG Hamiltonian acting on :class:`BlockSparseTensor` states.
+
+    The operator acts on the vector of allowed blocks of the two-site tensor
+    (see :meth:`BlockSparseTensor.to_block_vector`), so that the eigensolver
+    only works in the sector of states with the charge of `AB`.
+    """
+
+    L: BlockSparseTensor
+    W1: BlockSparseTensor
+    W2: BlockSparseTensor
+    R: BlockSparseTensor
+    template: BlockSparseTensor
+
+    def __init__(
+        self,
+        L: BlockSparseTensor,
+        W1: BlockSparseTensor,
+        W2: BlockSparseTensor,
+        R: BlockSparseTensor,
+        AB: BlockSparseTensor,
+    ):
+        self.L = L
+        self.W1 = W1
+        self.W2 = W2
+        self.R = R
+        self.template = AB
+        self.layout = AB.block_layout()
+        n = sum(int(np.prod(shape)) for _, shape in self.layout)
+        super().__init__(
+            shape=(n, n),  # type: ignore # pyright: ignore[reportCallIssue]
+            dtype=np.result_type(L.dtype, W1.dtype, W2.dtype, R.dtype, AB.dtype),  # type: ignore # pyright: ignore[reportCallIssue]
+        )
+
+    def _matvec(self, v: np.ndarray) -> np.ndarray:
+        v = self.template.from_block_vector(v.reshape(-1), self.layout)
+        aux = bs_tensordot(self.L, v, (2, 0))
+        aux = bs_tensordot(aux, self.W1, ([1, 2], [0, 2]))
+        aux = bs_tensordot(aux, self.W2, ([4, 1], [0, 2]))
+        aux = bs_tensordot(aux, self.R, ([1, 4], [2, 1]))
+        return aux.to_block_vector(self.layout)
+
+    def to_tensor(self, v: np.ndarray) -> BlockSparseTensor:
+        """Convert a vector of blocks back into a two-site tensor."""
+        return self.template.from_block_vector(v.reshape(-1), self.layout)
+
+
+def _unit_environment(legs: list) -> BlockSparseTensor:
+    """Boundary environment with one-dimensional legs and a unit element."""
+    key = tuple(int(leg.charges[0]) for leg in legs)
+    return BlockSparseTensor(
+        legs, {key: np.ones((1,) * len(legs), dtype=np.float32)}, legs[0].symmetry
+    )
+
+
+class SymmetricQuadraticForm(QuadraticForm):
+    """Quadratic form for an MPO and a :class:`CanonicalMPS` with
+    :class:`BlockSparseTensor` tensors, whose optimization preserves the
+    charge of the state."""
+
+    def _begin_environments(self) -> tuple[MPOEnvironment, MPOEnvironment]:
+        A, O = self.state[0], self.H[0]
+        left = _unit_environment([A.legs[0], O.legs[0].dual(), A.legs[0].dual()])
+        A, O = self.state[-1], self.H[-1]
+        right = _unit_environment([A.legs[-1], O.legs[-1].dual(), A.legs[-1].dual()])
+        return left, right  # type: ignore
+
+    def two_site_Hamiltonian(self, i: int) -> SymmetricDMRGOperator:  # type: ignore
+        assert i == self.site
+        return SymmetricDMRGOperator(
+            self.left_env[i],  # type: ignore
+            self.H[i],  # type: ignore
+            self.H[i + 1],  # type: ignore
+            self.right_env[i + 1],  # type: ignore
+            bs_tensordot(self.state[i], self.state[i + 1], (2, 0)),  # type: ignore
+        )
+
+    def diagonalize(
+        self, i: int, tol: float, eigensolver: str = "arpack", max_subspace: int = 20
+    ) -> tuple[float, Tensor4]:
+        Op = self.two_site_Hamiltonian(i)
+        v = Op.template.to_block_vector(Op.layout)
+        v /= np.linalg.norm(v)
+        eval, evec = _lowest_eigenpair(Op, v, tol, eigensolver, max_subspace)
+        return eval, Op.to_tensor(evec)  # type: ignore
+
+    def solve(
+        self,
+        i: int,
+        b: Tensor4,
+        atol: float = 0,
+        rtol: float = 1e-5,
+        solver: Callable = scipy.sparse.linalg.bicgstab,
+    ) -> tuple[Tensor4, int, float]:
+        Op = self.two_site_Hamiltonian(i)
+        b_v = b.to_block_vector(Op.layout)  # type: ignore
+        x, info = solver(
+            Op, b_v, Op.template.to_block_vector(Op.layout), atol=atol, rtol=rtol
+        )
+        res = np.linalg.norm(Op @ x - b_v)
+        return Op.to_tensor(x), info, float(res)  # type: ignore
+
+    def _begin_squared_environment(self) -> BlockSparseTensor:  # type: ignore
+        A, O = self.state[0], self.H[0]
+        return _unit_environment(
+            [A.legs[0], O.legs[0].dual(), O.legs[0].dual(), A.legs[0].dual()]
+        )
+
+    def _two_site_vector(self, Op: SymmetricDMRGOperator) -> np.ndarray:  # type: ignore
+        return Op.template.to_block_vector(Op.layout)
+
+    def energy_and_variance(self, variance: str = "environment") -> tuple[float, float]:
+        if variance == "full":
+            raise Exception("Full variance is not implemented for block-sparse MPO")
+        return super().energy_and_variance(variance)
+
+
+def _environment_sum(A: np.ndarray | BlockSparseTensor) -> Weight:
+    """Sum of the elements of a boundary environment."""
+    if isinstance(A, BlockSparseTensor):
+        return sum((block.sum() for block in A.blocks.values()), 0.0)
+    return A.sum()
+
 
 def dmrg(
     H: MPO | NNHamiltonian,
@@ -227,9 +645,16 @@ def dmrg(
     tol_eigs: float | None = None,
     strategy: Strategy = DEFAULT_STRATEGY,
     callback: Callable | None = None,
+    eigensolver: str = "arpack",
+    max_subspace: int = 20,
+    variance: str = "environment",
+    sites: int = 2,
+    mixing: float = 1e-3,
+    mixing_decay: float = 0.5,
 ) -> OptimizeResults:
     """Compute the ground state of a Hamiltonian represented as MPO using the
-    two-site DMRG algorithm.
+    two-site DMRG algorithm, or its single-site variant with subspace
+    expansion (DMRG3S).
 
     Parameters
     ----------
@@ -237,7 +662,9 @@ def dmrg(
         The Hermitian operator that is to be diagonalized. It may be also a
         nearest-neighbor Hamiltonian that is implicitly converted to MPO.
     guess : MPS | None
-        An initial guess for the ground state.
+        An initial guess for the ground state. If `H` is made of
+        :class:`~seemps.symmetry.BlockSparseTensor` tensors, the guess is
+        required and the optimization stays in the sector of its charge.
     maxiter : int
         Maximum number of steps of the DMRG. Each step is a sweep that runs
         over every pair of neighborin sites. Defaults to 20.
@@ -246,13 +673,37 @@ def dmrg(
     tol_up : float, default = `tol`
         If energy fluctuates up below this tolerance, continue the optimization.
     tol_eigs : float | None, default = `tol`
-        Tolerance of Scipy's eigsh() solver, used internally. Zero means use
-        machine precision.
+        Tolerance of the local eigensolver. Zero means use machine precision.
     strategy : Strategy
         Truncation strategy to keep bond dimensions in check. Defaults to
-        `DEFAULT_STRATEGY`, which is very strict.
+        `DEFAULT_STRATEGY`, which is very strict. Its precision also
+        determines whether the Hamiltonian and the state are converted to
+        single precision.
     callback : Callable[[MPS, OptimizeResults], Any] | None
         A callable called after each iteration (defaults to None).
+    eigensolver : str, default = "arpack"
+        Solver for the local eigenvalue problems: "arpack" for Scipy's eigsh(),
+        "davidson" for :func:`~seemps.optimization.davidson` or "lanczos" for
+        :func:`~seemps.optimization.lanczos`. The last two start with a loose
+        tolerance that tightens to `tol_eigs` as the energy converges.
+    max_subspace : int, default = 20
+        Maximum size of the search space of the "davidson" and "lanczos"
+        solvers.
+    variance : str, default = "environment"
+        How to compute the variance of the energy after each sweep:
+        "environment" contracts the state with two copies of the MPO,
+        "two-site" only estimates it from the last pair of sites that was
+        optimized, and "full" computes :math:`H\\psi` as an MPS, which is
+        the most expensive option.
+    sites : int, default = 2
+        Number of sites that are optimized together. With `sites=1` the local
+        problems are `d` times smaller, and the bond dimensions grow through
+        a subspace expansion, which enlarges each bond with the
+        perturbation `mixing * H @ A` before truncating it.
+    mixing : float, default = 1e-3
+        Mixing factor of the subspace expansion in the first sweep.
+    mixing_decay : float, default = 0.5
+        Factor by which `mixing` is multiplied after each sweep.
 
     Returns
     -------
@@ -269,27 +720,55 @@ def dmrg(
     """
     if maxiter < 1:
         raise Exception("maxiter cannot be zero or negative")
+    if sites not in (1, 2):
+        raise Exception("DMRG only optimizes one or two sites at a time")
+    if eigensolver not in ("arpack", "davidson", "lanczos"):
+        raise Exception(f'Unknown eigensolver "{eigensolver}"')
     if isinstance(H, NNHamiltonian):
         H = H.to_mpo()
+    symmetric = isinstance(H[0], BlockSparseTensor)
+    if symmetric and sites == 1:
+        raise ValueError("Single-site DMRG does not support block-sparse MPO")
     if guess is None:
-        guess = random_mps(H.dimensions(), D=2)
+        if symmetric:
+            raise ValueError("DMRG with block-sparse MPO requires a guess state")
+        guess = random_mps(H.physical_dimensions(), D=2)
     if tol_up is None:
         tol_up = abs(tol)
     if tol_eigs is None:
         tol_eigs = tol
+    # `variance` is reused below for the values of the variance
+    variance_method = variance
+    if eigensolver == "arpack":
+        local_tol = tol_eigs
+    else:
+        # Early sweeps do not need accurate eigenvectors
+        local_tol = max(tol_eigs, 1e-4)
 
     logger = make_logger()
     logger(f"DMRG initiated with maxiter={maxiter}, relative tolerance={tol}")
-    if not isinstance(guess, CanonicalMPS):
-        guess = CanonicalMPS(guess, center=0)
+    if symmetric:
+        if not isinstance(guess, CanonicalMPS):
+            guess = canonical_symmetric_mps(guess, center=0, strategy=strategy)
+        form = SymmetricQuadraticForm
+    else:
+        if not isinstance(guess, CanonicalMPS):
+            guess = CanonicalMPS(guess, center=0)
+        H = MPO([_cast_to_precision(A, strategy) for A in H], H.strategy)
+        guess = CanonicalMPS(
+            [_cast_to_precision(A, strategy) for A in guess],
+            center=guess.center,
+            is_canonical=True,
+            error=guess.error(),
+        )
+        form = QuadraticForm
     if guess.center == 0:
         direction = +1
-        QF = QuadraticForm(H, guess, start=0)
+        QF = form(H, guess, start=0)
     else:
         direction = -1
-        QF = QuadraticForm(H, guess, start=H.size - 2)
-    energy = H.expectation(QF.state).real
-    variance = abs(H.apply(QF.state).norm_squared() - energy * energy)
+        QF = form(H, guess, start=H.size - sites)
+    energy, variance = QF.energy_and_variance(variance_method)
     results = OptimizeResults(
         state=QF.state.copy(),
         energy=energy,
@@ -306,23 +785,37 @@ def dmrg(
     strategy = strategy.replace(normalize=True)
     step: int = 0
     for step in range(maxiter):
-        if direction > 0:
+        if sites == 1:
+            alpha = mixing * mixing_decay**step
+            if direction > 0:
+                for i in range(0, H.size - 1):
+                    E, A = QF.diagonalize_one_site(
+                        i, local_tol, eigensolver, max_subspace
+                    )
+                    QF.update_1site_right(A, i, strategy, alpha)
+                    logger(f"-> site={i}, eigenvalue={E}")
+            else:
+                for i in range(H.size - 1, 0, -1):
+                    E, A = QF.diagonalize_one_site(
+                        i, local_tol, eigensolver, max_subspace
+                    )
+                    QF.update_1site_left(A, i, strategy, alpha)
+                    logger(f"<- site={i}, eigenvalue={E}")
+        elif direction > 0:
             for i in range(0, H.size - 1):
-                E, AB = QF.diagonalize(i, tol=tol_eigs)
+                E, AB = QF.diagonalize(i, local_tol, eigensolver, max_subspace)
                 QF.update_2site_right(AB, i, strategy)
                 logger(f"-> site={i}, eigenvalue={E}")
         else:
             for i in range(H.size - 2, -1, -1):
-                E, AB = QF.diagonalize(i, tol=tol_eigs)
+                E, AB = QF.diagonalize(i, local_tol, eigensolver, max_subspace)
                 QF.update_2site_left(AB, i, strategy)
                 logger(f"<- site={i}, eigenvalue={E}")
 
         # In principle, E is the exact eigenvalue. However, we have
         # truncated the eigenvector, which means that the computation of
         # the residual cannot use that value
-        energy = H.expectation(QF.state).real
-        H_state = H @ QF.state
-        variance = abs(H_state.norm_squared() - energy * energy)
+        energy, variance = QF.energy_and_variance(variance_method)
 
         results.trajectory.append(E)
         results.variances.append(variance)
@@ -333,15 +826,23 @@ def dmrg(
             callback(QF.state, results)
 
         energy_change = E - last_E
-        if energy_change > abs(tol_up * E):
+        # With a loose local tolerance, the energy may stagnate before the
+        # ground state is reached
+        accurate = local_tol <= tol_eigs
+        if accurate and energy_change > abs(tol_up * E):
             results.message = f"Energy fluctuation above tolerance {tol_up}"
             results.converged = True
             break
-        if -abs(tol * E) <= energy_change <= 0:
+        if accurate and -abs(tol * E) <= energy_change <= 0:
             results.message = f"Energy decrease slower than tolerance {tol}"
             results.converged = True
             break
         direction = -direction
+        if eigensolver != "arpack":
+            if abs(energy_change) <= abs(tol * E):
+                local_tol = tol_eigs
+            else:
+                local_tol = max(tol_eigs, min(local_tol, abs(energy_change)))
         last_E = E
     logger(
         f"DMRG finished with {step + 1} iterations:\nmessage = {results.message}\nconverged = {results.converged}"
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import numpy as np
+import scipy.linalg  # type: ignore
+from numpy.typing import NDArray
+from scipy.sparse.linalg import LinearOperator  # type: ignore
+
+
+def _orthogonalize(v: NDArray, V: NDArray) -> NDArray:
+    """Remove from `v` its projection onto the orthonormal rows of `V`,
+    repeating the projection once for numerical stability."""
+    if V.shape[0]:
+        v = v - V.T @ (V.conj() @ v)
+        v = v - V.T @ (V.conj() @ v)
+    return v
+
+
+def davidson(
+    A: LinearOperator,
+    v0: NDArray,
+    diagonal: NDArray | None = None,
+    tol: float = 1e-10,
+    max_subspace: int = 20,
+    maxiter: int = 200,
+) -> tuple[float, NDArray]:
+    """Lowest eigenvalue and eigenvector of a Hermitian operator, computed with
+    the Davidson method.
+
+    The search space starts from the vector `v0` and grows with corrections
+    preconditioned by the diagonal of the operator. When it reaches
+    `max_subspace` vectors, it restarts with the two lowest Ritz vectors.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        Hermitian operator.
+    v0 : NDArray
+        Initial guess for the eigenvector.
+    diagonal : NDArray | None, default = None
+        Diagonal of `A`, used to precondition the corrections. If None, the
+        corrections are the residuals, as in the Lanczos method.
+    tol : float, default = 1e-10
+        Tolerance in the norm of the residual :math:`\\Vert{Av-\\lambda v}\\Vert`,
+        relative to :math:`\\max(1,\\vert\\lambda\\vert)`.
+    max_subspace : int, default = 20
+        Maximum number of vectors in the search space.
+    maxiter : int, default = 200
+        Maximum number of products with `A`.
+
+    Returns
+    -------
+    float
+        Lowest eigenvalue.
+    NDArray
+        Normalized eigenvector.
+    """
+    n = v0.size
+    max_subspace = max(2, min(max_subspace, n))
+    dtype = np.result_type(A.dtype, v0.dtype, np.float64)
+    V = np.zeros((max_subspace, n), dtype=dtype)
+    AV = np.zeros((max_subspace, n), dtype=dtype)
+    eps = np.finfo(dtype).eps
+    v = v0.reshape(-1).astype(dtype)
+    x, theta = v, np.inf
+    k = 0
+    for _ in range(maxiter):
+        v = _orthogonalize(v, V[:k])
+        norm_v = np.linalg.norm(v)
+        if norm_v <= eps * np.sqrt(n):
+            # The search space is invariant under A
+            break
+        V[k] = v / norm_v
+        AV[k] = A @ V[k]
+        k += 1
+        H = V[:k].conj() @ AV[:k].T
+        theta_k, y = scipy.linalg.eigh(0.5 * (H + H.T.conj()))
+        theta = theta_k[0]
+        x = y[:, 0] @ V[:k]
+        Ax = y[:, 0] @ AV[:k]
+        r = Ax - theta * x
+        if np.linalg.norm(r) <= tol * max(1.0, abs(theta)):
+            break
+        if k == max_subspace:
+            # Thick restart with the two lowest Ritz vectors
+            V[:2], AV[:2] = y[:, :2].T @ V[:k], y[:, :2].T @ AV[:k]
+            k = 2
+        if diagonal is None:
+            v = r
+        else:
+            denominator = diagonal - theta
+            denominator[np.abs(denominator) < 1e-8] = 1e-8
+            v = r / denominator
+    return float(theta), x / np.linalg.norm(x)
+
+
+def lanczos(
+    A: LinearOperator,
+    v0: NDArray,
+    tol: float = 1e-10,
+    max_subspace: int = 20,
+    maxiter: int = 200,
+) -> tuple[float, NDArray]:
+    """Lowest eigenvalue and eigenvector of a Hermitian operator, computed with
+    the Lanczos method.
+
+    The Krylov basis is fully reorthogonalized and, when it reaches
+    `max_subspace` vectors, the method restarts from the current Ritz vector.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        Hermitian operator.
+    v0 : NDArray
+        Initial guess for the eigenvector.
+    tol : float, default = 1e-10
+        Tolerance in the norm of the residual :math:`\\Vert{Av-\\lambda v}\\Vert`,
+        relative to :math:`\\max(1,\\vert\\lambda\\vert)`.
+    max_subspace : int, default = 20
+        Maximum dimension of the Krylov subspace.
+    maxiter : int, default = 200
+        Maximum number of products with `A`.
+
+    Returns
+    -------
+    float
+        Lowest eigenvalue.
+    NDArray
+        Normalized eigenvector.
+    """
+    n = v0.size
+    max_subspace = max(2, min(max_subspace, n))
+    dtype = np.result_type(A.dtype, v0.dtype, np.float64)
+    eps = np.finfo(dtype).eps
+    x = v0.reshape(-1).astype(dtype)
+    x = x / np.linalg.norm(x)
+    theta = np.inf
+    products = 0
+    while products < maxiter:
+        V = np.zeros((max_subspace, n), dtype=dtype)
+        alpha = np.zeros(max_subspace)
+        beta = np.zeros(max_subspace)
+        V[0] = x
+        converged = False
+        for k in range(max_subspace):
+            w = A @ V[k]
+            products += 1
+            alpha[k] = np.vdot(V[k], w).real
+            w = _orthogonalize(w, V[: k + 1])
+            beta[k] = np.linalg.norm(w)
+            theta_k, y = scipy.linalg.eigh_tridiagonal(alpha[: k + 1], beta[:k])
+            theta = theta_k[0]
+            x = y[:, 0] @ V[: k + 1]
+            # The residual of the Ritz vector is beta[k] * |y[k, 0]|
+            if beta[k] * abs(y[k, 0]) <= tol * max(1.0, abs(theta)) or beta[
+                k
+            ] <= eps * np.sqrt(n):
+                converged = True
+                break
+            if k + 1 < max_subspace:
+                V[k + 1] = w / beta[k]
+            if products >= maxiter:
+                break
+        x = x / np.linalg.norm(x)
+        if converged:
+            break
+    return float(theta), x
+
+
+__all__ = ["davidson", "lanczos"]
@@ -3,6 +3,7 @@ from ..cython import (
     Strategy,
     Truncation,
     Simplification,
+    Precision,
     DEFAULT_STRATEGY,
     DEFAULT_TOLERANCE,
     NO_TRUNCATION,
@@ -32,6 +33,7 @@ __all__ = [
     "Strategy",
     "Truncation",
     "Simplification",
+    "Precision",
     "DEFAULT_STRATEGY",
     "DEFAULT_TOLERANCE",
     "NO_TRUNCATION",
@@ -1,12 +1,16 @@
 from __future__ import annotations
+from collections.abc import Sequence
 import numpy as np
-from ..typing import Tensor3, Tensor4, DenseOperator
+from ..typing import Weight, Tensor3, Tensor4, DenseOperator, MPOEnvironment
 from ..state import MPS
 from ..cython import _contract_last_and_first
 from ..state.environments import (
     _begin_environment,
     _update_right_environment,
     _update_left_environment,
+    begin_mpo_environment,
+    update_left_mpo_environment,
+    update_right_mpo_environment,
 )
 
 
@@ -141,3 +145,342 @@ class AntilinearForm:
             self.bra[prev], self.ket[prev], self.R[prev]
         )
         self.center = nxt
+
+
+MAX_JOINED_DIMENSION: int = 32
+"""Largest bond dimension of the block-diagonal tensors in which
+:class:`AntilinearFormSum` joins the tensors of its states."""
+
+
+def _join_blocks(tensors: Sequence[Tensor3]) -> list[tuple[slice, slice, Tensor3]]:
+    """Join consecutive tensors into block-diagonal ones with bond dimensions
+    up to `MAX_JOINED_DIMENSION`, returning the joined tensors and the ranges
+    of their left and right bonds. Small tensors are thus multiplied together,
+    at the cost of some products of zeros."""
+    groups: list[list[Tensor3]] = [[]]
+    for A in tensors:
+        group = groups[-1]
+        if group and (
+            sum(B.shape[0] for B in group) + A.shape[0] > MAX_JOINED_DIMENSION
+            or sum(B.shape[2] for B in group) + A.shape[2] > MAX_JOINED_DIMENSION
+        ):
+            group = []
+            groups.append(group)
+        group.append(A)
+    output = []
+    left = right = 0
+    for group in groups:
+        a = sum(A.shape[0] for A in group)
+        b = sum(A.shape[2] for A in group)
+        if len(group) == 1:
+            joined = group[0]
+        else:
+            joined = np.zeros((a, group[0].shape[1], b), dtype=np.result_type(*group))
+            i = j = 0
+            for A in group:
+                joined[i : i + A.shape[0], :, j : j + A.shape[2]] = A
+                i += A.shape[0]
+                j += A.shape[2]
+        output.append((slice(left, left + a), slice(right, right + b), joined))
+        left += a
+        right += b
+    return output
+
+
+def _concatenate(tensors: list[Tensor3], axis: int) -> Tensor3:
+    return tensors[0] if len(tensors) == 1 else np.concatenate(tensors, axis=axis)
+
+
+class AntilinearFormSum:
+    """Representation of a linear combination of scalar products
+    :math:`\\sum_k w_k\\langle\\xi|\\psi_k\\rangle` with capabilities for
+    differentiation.
+
+    This class implements the same interface as :class:`AntilinearForm`, but
+    it processes all terms at once. The environments of the different
+    :math:`\\psi_k` are stored side by side along the index of the ket, as
+    `L[a,(k,b)]` and `R[(k,b),a]`, with the weights absorbed into the left
+    boundary. The contractions with the bra, as well as the sum over terms in
+    :meth:`tensor1site` and :meth:`tensor2site`, then become single matrix
+    products. Only the products of the environments with the tensors of the
+    states remain separate, and the tensors of small states are joined in
+    block-diagonal tensors to reduce their number.
+
+    Parameters
+    ----------
+    bra : MPS
+        MPS state :math:`\\xi` that is optimized.
+    kets : Sequence[MPS]
+        MPS states :math:`\\psi_k` in the linear combination.
+    weights : Sequence[Weight]
+        Weights :math:`w_k` of the states.
+    center: int, default = 0
+        Position at which the `L` tensor is precomputed.
+    """
+
+    bra: MPS
+    kets: list[MPS]
+    size: int
+    R: list[DenseOperator]
+    L: list[DenseOperator]
+    center: int
+
+    def __init__(
+        self,
+        bra: MPS,
+        kets: Sequence[MPS],
+        weights: Sequence[Weight],
+        center: int = 0,
+    ):
+        size = bra.size
+        assert all(ket.size == size for ket in kets)
+        self.bra = bra
+        self.kets = list(kets)
+        self.size = size
+        self._blocks = [
+            _join_blocks([ket[i] for ket in self.kets]) for i in range(size)
+        ]
+        ρ = np.asarray(weights).reshape(1, -1)
+        self.L = [ρ] * size
+        ρ = np.ones((len(self.kets), 1))
+        self.R = [ρ] * size
+        # Products of the environments with the kets, which do not depend on
+        # the bra and are shared by `tensor2site()` and the updates
+        self._left_products: list[Tensor3 | None] = [None] * size
+        self._right_products: list[Tensor3 | None] = [None] * size
+        self.center = center = center % size
+        for i in range(size - 1, center, -1):
+            self.R[i - 1] = self._update_right_environment(i)
+        for i in range(0, center):
+            self.L[i + 1] = self._update_left_environment(i)
+
+    def _ket_times_left(self, site: int) -> Tensor3:
+        """Contract `L` with the kets at `site`, as `T[a,i,(k,b)]`."""
+        T = self._left_products[site]
+        if T is None:
+            L = self.L[site]
+            a = L.shape[0]
+            T = self._left_products[site] = _concatenate(
+                [
+                    (L[:, rows] @ A.reshape(A.shape[0], -1)).reshape(a, *A.shape[1:])
+                    for rows, _, A in self._blocks[site]
+                ],
+                axis=2,
+            )
+        return T
+
+    def _ket_times_right(self, site: int) -> Tensor3:
+        """Contract the kets at `site` with `R`, as `T[(k,b),i,a]`."""
+        T = self._right_products[site]
+        if T is None:
+            R = self.R[site]
+            a = R.shape[1]
+            T = self._right_products[site] = _concatenate(
+                [
+                    (A.reshape(-1, A.shape[2]) @ R[columns]).reshape(*A.shape[:2], a)
+                    for _, columns, A in self._blocks[site]
+                ],
+                axis=0,
+            )
+        return T
+
+    def _update_left_environment(self, site: int) -> DenseOperator:
+        A = self.bra[site]
+        a, i, b = A.shape
+        T = self._ket_times_left(site)
+        return A.reshape(a * i, b).T.conj() @ T.reshape(a * i, -1)
+
+    def _update_right_environment(self, site: int) -> DenseOperator:
+        A = self.bra[site]
+        a, i, b = A.shape
+        T = self._ket_times_right(site)
+        return T.reshape(-1, i * b) @ A.reshape(a, i * b).T.conj()
+
+    def tensor1site(self) -> Tensor3:
+        """Return the tensor representing the AntilinearFormSum at the
+        `self.center` site."""
+        center = self.center
+        return _contract_last_and_first(self._ket_times_left(center), self.R[center])
+
+    def tensor2site(self, direction: int) -> Tensor4:
+        """Return the tensor that represents the AntilinearFormSum using
+        'center' and another site.
+
+        Parameters
+        ----------
+        direction : {+1, -1}
+            If positive, the tensor acts on `self.center` and `self.center+1`
+            Otherwise on `self.center` and `self.center-1`.
+
+        Returns
+        -------
+        Tensor4
+            Four-legged tensor representing the antilinear form.
+        """
+        if direction > 0:
+            i = self.center
+            j = i + 1
+        else:
+            j = self.center
+            i = j - 1
+        # The sum over terms is the contraction of the (k,b) index
+        return _contract_last_and_first(
+            self._ket_times_left(i), self._ket_times_right(j)
+        )
+
+    def update(self, direction: int) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center + direction`.
+
+        Parameters
+        ----------
+        direction : { +1 , -1 }
+        """
+        if direction > 0:
+            self.update_right()
+        else:
+            self.update_left()
+
+    def update_right(self) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center + 1`."""
+        prev = self.center
+        nxt = prev + 1
+        assert nxt < self.size
+        self.L[nxt] = self._update_left_environment(prev)
+        self._left_products[nxt] = None
+        self.center = nxt
+
+    def update_left(self) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center - 1`."""
+        prev = self.center
+        nxt = prev - 1
+        assert nxt >= 0
+        self.R[nxt] = self._update_right_environment(prev)
+        self._right_products[nxt] = None
+        self.center = nxt
+
+
+class MPOAntilinearForm:
+    """Representation of a scalar product :math:`\\langle\\xi|O|\\psi\\rangle`
+    with capabilities for differentiation.
+
+    This class implements the same interface as :class:`AntilinearForm`,
+    but the environments contract the MPO with the state, so that the
+    product :math:`O\\psi` is never constructed.
+
+    Parameters
+    ----------
+    bra : MPS
+        MPS state :math:`\\xi` that is optimized.
+    operator : Sequence[Tensor4]
+        Tensors of the matrix-product operator :math:`O`.
+    ket : MPS
+        MPS state :math:`\\psi` on which the operator acts.
+    center: int, default = 0
+        Position at which the `L` tensor is precomputed.
+    """
+
+    bra: MPS
+    operator: Sequence[Tensor4]
+    ket: MPS
+    size: int
+    R: list[MPOEnvironment]
+    L: list[MPOEnvironment]
+    center: int
+
+    def __init__(
+        self, bra: MPS, operator: Sequence[Tensor4], ket: MPS, center: int = 0
+    ):
+        assert bra.size == ket.size == len(operator)
+        size = bra.size
+        center = center % size
+        ρ = begin_mpo_environment()
+        R = [ρ] * size
+        for i in range(size - 1, center, -1):
+            R[i - 1] = ρ = update_right_mpo_environment(ρ, bra[i], operator[i], ket[i])
+
+        ρ = begin_mpo_environment()
+        L = [ρ] * size
+        for i in range(0, center):
+            L[i + 1] = ρ = update_left_mpo_environment(ρ, bra[i], operator[i], ket[i])
+
+        self.bra = bra
+        self.operator = operator
+        self.ket = ket
+        self.size = size
+        self.R = R
+        self.L = L
+        self.center = center
+
+    def tensor1site(self) -> Tensor3:
+        """Return the tensor representing the form at the `self.center` site."""
+        center = self.center
+        # acb,bkd,cike,fed->aif
+        aux = np.tensordot(self.L[center], self.ket[center], (2, 0))
+        aux = np.tensordot(aux, self.operator[center], ([1, 2], [0, 2]))
+        return np.tensordot(aux, self.R[center], ([1, 3], [2, 1]))
+
+    def tensor2site(self, direction: int) -> Tensor4:
+        """Return the tensor that represents the form using 'center'
+        and another site.
+
+        Parameters
+        ----------
+        direction : {+1, -1}
+            If positive, the tensor acts on `self.center` and `self.center+1`
+            Otherwise on `self.center` and `self.center-1`.
+
+        Returns
+        -------
+        Tensor4
+            Four-legged tensor representing the antilinear form.
+        """
+        if direction > 0:
+            i = self.center
+            j = i + 1
+        else:
+            j = self.center
+            i = j - 1
+        # acb,bkx,cikg,xlf,gjlh,ehf->aije
+        aux = np.tensordot(self.L[i], self.ket[i], (2, 0))
+        aux = np.tensordot(aux, self.operator[i], ([1, 2], [0, 2]))
+        aux = np.tensordot(aux, self.ket[j], (1, 0))
+        aux = np.tensordot(aux, self.operator[j], ([2, 3], [0, 2]))
+        return np.tensordot(aux, self.R[j], ([2, 4], [2, 1]))
+
+    def update(self, direction: int) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center + direction`.
+
+        Parameters
+        ----------
+        direction : { +1 , -1 }
+        """
+        if direction > 0:
+            self.update_right()
+        else:
+            self.update_left()
+
+    def update_right(self) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center + 1`."""
+        prev = self.center
+        nxt = prev + 1
+        assert nxt < self.size
+        self.L[nxt] = update_left_mpo_environment(
+            self.L[prev], self.bra[prev], self.operator[prev], self.ket[prev]
+        )
+        self.center = nxt
+
+    def update_left(self) -> None:
+        """Notify that the `bra` state has been changed, and that we move to
+        `self.center - 1`."""
+        prev = self.center
+        nxt = prev - 1
+        assert nxt >= 0
+        self.R[nxt] = update_right_mpo_environment(
+            self.R[prev], self.bra[prev], self.operator[prev], self.ket[prev]
+        )
+        self.center = nxt
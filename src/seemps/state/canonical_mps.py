@@ -12,6 +12,8 @@ from ..cython import (
     _recanonicalize,
 )
 from .schmidt import (
+    SVD_LAPACK_DRIVER,
+    _scipy_svd,
     _vector2mps,
     _schmidt_weights,
     _left_orth_2site,
@@ -25,6 +27,27 @@ from .environments import (
 from .mps import MPS
 
 
+def _entanglement_entropy(s: Vector) -> float:
+    """Von Neumann entropy, in bits, of a vector of Schmidt weights."""
+    return -np.sum(s * np.log2(s))
+
+
+def _Renyi_entropy(s: Vector, alpha: float) -> float:
+    """Renyi entropy of a vector of Schmidt weights."""
+    if alpha < 0:
+        raise ValueError("Invalid Renyi entropy power")
+    if alpha == 0:
+        alpha = 1e-9
+    elif alpha == 1:
+        alpha = 1 - 1e-9
+    return np.log(np.sum(s**alpha)) / (1 - alpha)
+
+
+def _normalized_squares(s: Vector) -> Vector:
+    s = s * s
+    return s / np.sum(s)
+
+
 class CanonicalMPS(MPS):
     """Canonical MPS class.
 
@@ -52,6 +75,15 @@ class CanonicalMPS(MPS):
     center: int
     strategy: Strategy
     _error: float  # inherited, but Pyright wants us to confirm the type
+    #
+    # Optional cache of environments (see `cache_environments()`). Entries
+    # `_left_cache[k]` are valid for `center < k <= _left_limit` and
+    # entries `_right_cache[k]` for `_right_limit <= k < center`.
+    #
+    _left_cache: list[Environment | None] | None = None
+    _right_cache: list[Environment | None] | None = None
+    _left_limit: int = 0
+    _right_limit: int = 0
 
     #
     # This class contains all the matrices and vectors that form
@@ -148,9 +180,60 @@ class CanonicalMPS(MPS):
         # TODO: Find out why NumPy thinks np.vdot is of type bool
         return np.vdot(A, A).real  # pyright: ignore[reportReturnType]
 
+    def cache_environments(self, enable: bool = True) -> CanonicalMPS:
+        """Enable or disable the cache of environments of this state.
+
+        When enabled, :meth:`left_environment` and :meth:`right_environment`
+        remember the environments that they compute, so that repeated local
+        measurements, such as :meth:`expectation1` on all sites, extend
+        previous environments by one site instead of recomputing them. The
+        methods that modify the state, such as :meth:`update_2site_right`,
+        :meth:`recenter` or `state[i] = A`, forget only the environments
+        that depend on the modified tensors. Changes made directly to the
+        list of tensors are not detected.
+
+        Parameters
+        ----------
+        enable : bool, default = True
+            Whether to use the cache.
+
+        Returns
+        -------
+        CanonicalMPS
+            This same object.
+        """
+        if enable:
+            self._left_cache = [None] * (self.size + 1)
+            self._right_cache = [None] * self.size
+        else:
+            self._left_cache = self._right_cache = None
+        self._left_limit = self.center
+        self._right_limit = self.center
+        return self
+
+    def _invalidate_environments(self, start: int, end: int) -> None:
+        """Forget the cached environments that depend on the tensors from
+        `start` to `end`, both included."""
+        if self._left_cache is not None:
+            self._left_limit = min(self._left_limit, start)
+            self._right_limit = max(self._right_limit, end)
+
     def left_environment(self, site: int) -> Environment:
         """Optimized version of :py:meth:`~seemps.state.MPS.left_environment`"""
         start = min(site, self.center)
+        cache = self._left_cache
+        if cache is not None and site > start:
+            # Continue from the last valid environment
+            n = min(site, self._left_limit)
+            if n > start:
+                start, ρ = n, cache[n]
+            else:
+                ρ = _begin_environment(self[start].shape[0])
+            for n in range(start, site):
+                A = self._data[n]
+                cache[n + 1] = ρ = _update_left_environment(A, A, ρ)
+            self._left_limit = max(self._left_limit, site)
+            return ρ  # type: ignore
         ρ = _begin_environment(self[start].shape[0])
         for A in self._data[start:site]:
             ρ = _update_left_environment(A, A, ρ)
@@ -159,6 +242,19 @@ class CanonicalMPS(MPS):
     def right_environment(self, site: int) -> Environment:
         """Optimized version of :py:meth:`~seemps.state.MPS.right_environment`"""
         start = max(site, self.center)
+        cache = self._right_cache
+        if cache is not None and site < start:
+            # Continue from the last valid environment
+            n = max(site, self._right_limit)
+            if n < start:
+                start, ρ = n, cache[n]
+            else:
+                ρ = _begin_environment(self[start].shape[-1])
+            for n in range(start, site, -1):
+                A = self._data[n]
+                cache[n - 1] = ρ = _update_right_environment(A, A, ρ)
+            self._right_limit = min(self._right_limit, site)
+            return ρ  # type: ignore
         ρ = _begin_environment(self[start].shape[-1])
         for A in self._data[start:site:-1]:
             ρ = _update_right_environment(A, A, ρ)
@@ -177,13 +273,32 @@ class CanonicalMPS(MPS):
         -------
         numbers: np.ndarray
             Vector of non-negative Schmidt weights.
+
+        Notes
+        -----
+        If the cache of environments is enabled (see
+        :meth:`cache_environments`), the weights away from `self.center` are
+        the eigenvalues of an environment, which avoids moving the center
+        but has an absolute precision of about `1e-16`.
         """
         if site is None:
             site = self.center
         else:
             site = self._interpret_center(site)
         if site != self.center:
-            return self.copy().recenter(site).Schmidt_weights()
+            if self._left_cache is None:
+                return self.copy().recenter(site).Schmidt_weights()
+            # The tensors on the other side of the cut are in canonical form,
+            # so the environment is the reduced density matrix of the bond.
+            if site > self.center:
+                ρ = self.left_environment(site + 1)
+            else:
+                ρ = self.right_environment(site)
+            s = np.linalg.eigvalsh(ρ)[::-1]
+            # Drop the zero eigenvalues of rank-deficient bonds, as well as
+            # those that `recenter()` would truncate with this strategy.
+            s = s[s > self.strategy.get_tolerance() * np.sum(s)]
+            return s / np.sum(s)
         # TODO: this is for [0, self.center] (self.center, self.size)
         # bipartitions, but we can also optimizze [0, self.center) [self.center, self.size)
         return _schmidt_weights(self._data[site])
@@ -203,8 +318,7 @@ class CanonicalMPS(MPS):
         float
             Von Neumann entropy of bipartition.
         """
-        s = self.Schmidt_weights(site)
-        return -np.sum(s * np.log2(s))
+        return _entanglement_entropy(self.Schmidt_weights(site))
 
     def Renyi_entropy(self, site: int | None = None, alpha: float = 2.0) -> float:
         """Compute the Renyi entropy of the MPS for a bipartition
@@ -223,15 +337,73 @@ class CanonicalMPS(MPS):
         float
             Von Neumann entropy of bipartition.
         """
-        s = self.Schmidt_weights(site)
-        if alpha < 0:
-            raise ValueError("Invalid Renyi entropy power")
-        if alpha == 0:
-            alpha = 1e-9
-        elif alpha == 1:
-            alpha = 1 - 1e-9
-        S = np.log(np.sum(s**alpha)) / (1 - alpha)
-        return S
+        return _Renyi_entropy(self.Schmidt_weights(site), alpha)
+
+    def Schmidt_spectra(self) -> list[Vector]:
+        """Return the Schmidt weights for the bipartitions around all sites.
+
+        The spectra are computed with one sweep from `self.center` towards
+        each end of the chain, with one singular value decomposition per
+        site, without modifying the state.
+
+        Returns
+        -------
+        list[Vector]
+            List with the vectors `self.Schmidt_weights(site)` for all sites,
+            that is, for the bipartitions `[0, site]` and `(site, self.size)`.
+        """
+        spectra: list[Vector] = [np.ones(1)] * self.size
+        center = self.center
+        # Sweep to the right, with the bipartition at the right of C
+        C = self._data[center]
+        for site in range(center, self.size - 1):
+            a, i, b = C.shape
+            U, s, V = _scipy_svd(
+                C.reshape(a * i, b),
+                full_matrices=False,
+                check_finite=False,
+                lapack_driver=SVD_LAPACK_DRIVER,
+            )
+            spectra[site] = _normalized_squares(s)
+            C = np.tensordot(s[:, np.newaxis] * V, self._data[site + 1], (1, 0))
+        spectra[self.size - 1] = _schmidt_weights(C)
+        # Sweep to the left, with the bipartition at the left of C
+        C = self._data[center]
+        for site in range(center, 0, -1):
+            a, i, b = C.shape
+            U, s, V = _scipy_svd(
+                C.reshape(a, i * b),
+                full_matrices=False,
+                check_finite=False,
+                lapack_driver=SVD_LAPACK_DRIVER,
+            )
+            spectra[site - 1] = _normalized_squares(s)
+            C = np.tensordot(self._data[site - 1], U * s, (2, 0))
+        return spectra
+
+    def entanglement_profile(self, alpha: float = 2.0) -> tuple[Vector, Vector]:
+        """Compute the entanglement entropies for the bipartitions around
+        all sites, using the spectra from :meth:`Schmidt_spectra`.
+
+        Parameters
+        ----------
+        alpha : float, default = 2
+            Power of the Renyi entropies.
+
+        Returns
+        -------
+        Vector
+            Von Neumann entropies, as computed by
+            `self.entanglement_entropy(site)` for all sites.
+        Vector
+            Renyi entropies, as computed by `self.Renyi_entropy(site, alpha)`
+            for all sites.
+        """
+        spectra = self.Schmidt_spectra()
+        return (
+            np.array([_entanglement_entropy(s) for s in spectra]),
+            np.array([_Renyi_entropy(s, alpha) for s in spectra]),
+        )
 
     def update_canonical(
         self, A: Tensor3, direction: int, truncation: Strategy
@@ -254,6 +426,9 @@ class CanonicalMPS(MPS):
         float
             The truncation error of this update.
         """
+        self._invalidate_environments(
+            max(self.center - 1, 0), min(self.center + 1, self.size - 1)
+        )
         if direction > 0:
             self.center, error = _update_in_canonical_form_right(
                 self._data, A, self.center, truncation
@@ -283,6 +458,7 @@ class CanonicalMPS(MPS):
             bond dimensions
         """
         self._data[site], self._data[site + 1], error = _left_orth_2site(AA, strategy)
+        self._invalidate_environments(site, site + 1)
         self.center = site + 1
         self._error += error
 
@@ -304,6 +480,7 @@ class CanonicalMPS(MPS):
             bond dimensions
         """
         self._data[site], self._data[site + 1], error = _right_orth_2site(AA, strategy)
+        self._invalidate_environments(site, site + 1)
         self.center = site
         self._error += error
 
@@ -344,6 +521,9 @@ class CanonicalMPS(MPS):
                 newcenter,
                 self.strategy if strategy is None else strategy,
             )
+            self._invalidate_environments(
+                min(oldcenter, newcenter), max(oldcenter, newcenter)
+            )
             self.center = newcenter
         return self
 
@@ -354,8 +534,18 @@ class CanonicalMPS(MPS):
         N = np.linalg.norm(A.reshape(-1))
         if N:
             self._data[n] = A / N
+            self._invalidate_environments(n, n)
         return self
 
+    def __setitem__(self, k, value):
+        super().__setitem__(k, value)
+        if isinstance(k, slice):
+            self._invalidate_environments(0, self.size - 1)
+        else:
+            k = self._interpret_center(k)
+            self._invalidate_environments(k, k)
+        return value
+
     def __copy__(self):
         """Return a shallow copy of the CanonicalMPS, preserving the tensors."""
         return type(self)(
@@ -7,18 +7,25 @@ from ..cython import (
     _update_right_environment,
     _end_environment,
     _join_environments,
+    _update_left_mpo_environment,
+    _update_right_mpo_environment,
     scprod,
     vdot,
 )
 
 
 def begin_mpo_environment() -> MPOEnvironment:
-    return np.ones((1, 1, 1), dtype=np.float64)
+    # Stored in single precision, so that it does not promote the type of
+    # the MPS and MPO tensors it is contracted with.
+    return np.ones((1, 1, 1), dtype=np.float32)
 
 
 def update_left_mpo_environment(
     rho: MPOEnvironment, A: Tensor3, O: Tensor4, B: Tensor3
 ) -> MPOEnvironment:
+    if isinstance(A, np.ndarray):
+        return _update_left_mpo_environment(rho, A, O, B)
+    # Other tensor types, such as block-sparse ones, rely on NumPy's dispatch
     # output = opt_einsum.contract("acb,ajd,cjie,bif->def", rho, A, O, B)
     # bif,acb->ifac
     aux = np.tensordot(B, rho, (0, 2))
@@ -32,6 +39,9 @@ def update_left_mpo_environment(
 def update_right_mpo_environment(
     rho: MPOEnvironment, A: Tensor3, O: Tensor4, B: Tensor3
 ) -> MPOEnvironment:
+    if isinstance(A, np.ndarray):
+        return _update_right_mpo_environment(rho, A, O, B)
+    # Other tensor types, such as block-sparse ones, rely on NumPy's dispatch
     # output = opt_einsum.contract("def,ajd,cjie,bif->acb", rho, A, O, B)
     # ajd,def->ajef
     aux = np.tensordot(np.conj(A), rho, (2, 0))
@@ -42,6 +52,23 @@ def update_right_mpo_environment(
     return aux
 
 
+def update_left_mpo_squared_environment(
+    rho: Tensor4, A: Tensor3, O1: Tensor4, O2: Tensor4, B: Tensor3
+) -> Tensor4:
+    """Update the left environment of :math:`\\langle{A}|O_1 O_2|B\\rangle`,
+    an MPS-MPO-MPO-MPS contraction."""
+    # output = opt_einsum.contract("acdb,aje,cjkf,dkig,bih->efgh", rho, A, O1, O2, B)
+    # bih,acdb->ihacd
+    aux = np.tensordot(B, rho, (0, 3))
+    # ihacd,dkig->hackg
+    aux = np.tensordot(aux, O2, ([0, 4], [2, 0]))
+    # hackg,cjkf->hagjf
+    aux = np.tensordot(aux, O1, ([2, 3], [0, 2]))
+    # hagjf,aje->hgfe
+    aux = np.tensordot(aux, np.conj(A), ([1, 3], [0, 1]))
+    return aux.transpose(3, 2, 1, 0)
+
+
 def end_mpo_environment(ρ: MPOEnvironment) -> Weight:
     """Extract the scalar product from the last environment."""
     return ρ[0, 0, 0]
@@ -62,6 +89,7 @@ __all__ = [
     "begin_mpo_environment",
     "update_left_mpo_environment",
     "update_right_mpo_environment",
+    "update_left_mpo_squared_environment",
     "end_mpo_environment",
     "join_mpo_environments",
 ]
@@ -9,6 +9,7 @@ from ..typing import (
     Environment,
     Weight,
     Vector,
+    Matrix,
     VectorLike,
     to_dense_operator,
     Operator,
@@ -349,6 +350,65 @@ class MPS(array.TensorArray):
             ρL = _update_left_environment(A, A, ρL)
         return np.array(output)
 
+    def all_expectation2(self, Opi: Operator, Opj: Operator) -> Matrix:
+        """Matrix of expectation values :math:`\\langle\\psi|O_i Q_j|\\psi\\rangle`
+        for all pairs of sites.
+
+        The environments with one operator inserted are propagated along the
+        chain, so that the whole matrix costs :math:`O(N^2)` contractions,
+        instead of the :math:`O(N^3)` of calling :meth:`expectation2` for
+        each pair.
+
+        Parameters
+        ----------
+        Opi, Opj : Operator
+            Local observables `O` and `Q`.
+
+        Returns
+        -------
+        Matrix
+            Numpy array `C[i,j]` with the expectation value of `O` on the
+            `i`-th site and `Q` on the `j`-th site. The diagonal contains
+            the expectation values of the product `O @ Q`, as
+            :meth:`expectation2` does when `i == j`.
+        """
+        O = to_dense_operator(Opi)
+        Q = to_dense_operator(Opj)
+        L = self.size
+        ρ = _begin_environment()
+        allρR: list[Environment] = [ρ] * L
+        for i in range(L - 1, 0, -1):
+            A = self[i]
+            ρ = _update_right_environment(A, A, ρ)
+            allρR[i - 1] = ρ
+
+        OA = [np.matmul(O, A) for A in self._data]
+        QA = [np.matmul(Q, A) for A in self._data]
+        output: list[list[Weight]] = [[0.0] * L for _ in range(L)]
+        ρL = _begin_environment()
+        for i in range(L):
+            A = self[i]
+            OQρL = _update_left_environment(A, np.matmul(O @ Q, A), ρL)
+            output[i][i] = _join_environments(OQρL, allρR[i])
+            # Environments with O or Q on the i-th site, which are
+            # completed with Q or O on every site j > i
+            OρL = _update_left_environment(A, OA[i], ρL)
+            QρL = _update_left_environment(A, QA[i], ρL)
+            for j in range(i + 1, L):
+                B = self[j]
+                ρR = allρR[j]
+                output[i][j] = _join_environments(
+                    _update_left_environment(B, QA[j], OρL), ρR
+                )
+                output[j][i] = _join_environments(
+                    _update_left_environment(B, OA[j], QρL), ρR
+                )
+                if j + 1 < L:
+                    OρL = _update_left_environment(B, B, OρL)
+                    QρL = _update_left_environment(B, B, QρL)
+            ρL = _update_left_environment(A, A, ρL)
+        return np.array(output)
+
     def left_environment(self, site: int) -> Environment:
         """Environment matrix for systems to the left of `site`."""
         ρ = _begin_environment()
@@ -2,12 +2,30 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import NDArray
 from ..tools import DEFAULT_RNG
+from ..typing import Environment
+from .environments import _begin_environment, _update_right_environment
 from .mps import MPS
 from .canonical_mps import CanonicalMPS
 
 
+def _right_environments(mps: MPS) -> list[Environment | None]:
+    """Right environments of all sites, with `None` standing for the identity
+    when the tensors to the right of a site are in canonical form."""
+    L = mps.size
+    output: list[Environment | None] = [None] * L
+    start = mps.center if isinstance(mps, CanonicalMPS) else L - 1
+    ρ = _begin_environment(mps[start].shape[-1])
+    for n in range(start, 0, -1):
+        A = mps[n]
+        output[n - 1] = ρ = _update_right_environment(A, A, ρ)
+    return output
+
+
 def sample_mps(
-    mps: MPS, size: int = 1, rng: np.random.Generator = DEFAULT_RNG
+    mps: MPS,
+    size: int = 1,
+    rng: np.random.Generator = DEFAULT_RNG,
+    chunk_size: int | None = None,
 ) -> NDArray:
     """Generate configurations by sampling a matrix-product state.
 
@@ -24,14 +42,24 @@ def sample_mps(
     generates instances of the integers :math:`i_k` in a method that reproduces
     the same distribution.
 
+    The configurations are drawn site by site from the conditional
+    probabilities :math:`p(i_k|i_1\\ldots i_{k-1})`, advancing all samples
+    together with matrix products. The state need not be normalized nor in
+    canonical form: the norms of the right parts of the chain are computed
+    once, and they are trivial for the sites to the right of the center of a
+    :class:`CanonicalMPS`.
+
     Parameters
     ----------
     mps : MPS
-        Normalized matrix product state.
+        Matrix product state.
     size : int
         Number of samples to generate, defaults to 1.
     rng : Generator, default=DEFAULT_RNG
         Random number generator. Provide a seeded one for reproducibility.
+    chunk_size : int, optional
+        Maximum number of samples that are processed together, to bound the
+        memory. Defaults to `size`.
 
     Returns
     -------
@@ -39,27 +67,30 @@ def sample_mps(
         A list of configurations sampled according to the above distribution,
         each represented by a Numpy vector.
     """
-    if not isinstance(mps, CanonicalMPS):
-        mps = CanonicalMPS(mps, center=0)
     L = mps.size
     output = np.empty((size, L), dtype=int)
-    for state in output:
-        if mps.center == L - 1:
-            i = 0
-            for n, A in enumerate(reversed(mps)):
-                A = A[:, :, i]
-                p = np.cumsum(np.abs(A.reshape(-1)) ** 2)
-                z = np.searchsorted(p, p[-1] * rng.random())
-                i = z // A.shape[1]
-                state[n] = z % A.shape[1]
-        else:
-            if mps.center != 0:
-                mps = CanonicalMPS(mps, center=0)
-            i = 0
-            for n, A in enumerate(mps):
-                A = A[i, :, :]
-                p = np.cumsum(np.abs(A.reshape(-1)) ** 2)
-                z = np.searchsorted(p, p[-1] * rng.random())
-                i = z // A.shape[0]
-                state[n] = z % A.shape[0]
+    if chunk_size is None or chunk_size <= 0:
+        chunk_size = max(size, 1)
+    environments = _right_environments(mps)
+    for start in range(0, size, chunk_size):
+        samples = output[start : start + chunk_size]
+        n_samples = samples.shape[0]
+        # Vectors v[s,b] of the left part of the chain for each sample
+        v = np.ones((n_samples, 1))
+        for n, (A, ρ) in enumerate(zip(mps, environments)):
+            a, d, b = A.shape
+            w = (v @ A.reshape(a, d * b)).reshape(n_samples, d, b)
+            if ρ is None:
+                p = np.sum((w * w.conj()).real, axis=2)
+            else:
+                wρ = (w.reshape(-1, b) @ ρ).reshape(w.shape)
+                p = np.sum((wρ * w.conj()).real, axis=2)
+            # Inverse of the cumulative distribution of each sample
+            p = np.cumsum(np.maximum(p, 0.0), axis=1)
+            threshold = p[:, -1] * rng.random(n_samples)
+            i = np.minimum(np.sum(p <= threshold[:, np.newaxis], axis=1), d - 1)
+            samples[:, n] = i
+            v = w[np.arange(n_samples), i, :]
+            norm = np.linalg.norm(v, axis=1, keepdims=True)
+            v /= np.where(norm > 0, norm, 1.0)
     return output
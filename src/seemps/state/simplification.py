@@ -1,7 +1,8 @@
 from __future__ import annotations
+from collections.abc import Iterable, Sequence
 from math import sqrt
 import numpy as np
-from ..tools import make_logger
+from ..tools import Logger, make_logger
 from . import (
     DEFAULT_TOLERANCE,
     MAX_BOND_DIMENSION,
@@ -12,8 +13,10 @@ from . import (
     Strategy,
     Truncation,
 )
-from ..typing import Weight
-from .antilinear import AntilinearForm
+from ..typing import Weight, Tensor4
+from .antilinear import AntilinearForm, AntilinearFormSum, MPOAntilinearForm
+from .environments import update_left_mpo_squared_environment
+from .factories import random_mps
 
 # TODO: We have to rationalize all this about directions. The user should
 # not really care about it and we can guess the direction from the canonical
@@ -29,6 +32,103 @@ SIMPLIFICATION_STRATEGY = Strategy(
 )
 
 
+def _weighted_sum(
+    weights: Sequence[Weight], tensors: Iterable[np.ndarray]
+) -> np.ndarray:
+    """Compute `sum(w * t for w, t in zip(weights, tensors))`, accumulating the
+    terms in place on the first one. The tensors must be new arrays."""
+    output: np.ndarray | None = None
+    for w, t in zip(weights, tensors):
+        if w != 1:
+            t = w * t
+        if output is None:
+            output = t
+        elif np.can_cast(t.dtype, output.dtype, "same_kind"):
+            output += t
+        else:
+            output = output + t
+    assert output is not None
+    return output
+
+
+def _fit_sweeps(
+    mps: CanonicalMPS,
+    weights: Sequence[Weight],
+    forms: Sequence[AntilinearForm | AntilinearFormSum | MPOAntilinearForm],
+    norm_state_sqr: float,
+    strategy: Strategy,
+    direction: int,
+    logger: Logger,
+) -> tuple[float, float]:
+    """Sweep over `mps`, maximizing its overlap with the state that
+    `sum(w * f for w, f in zip(weights, forms))` represents, until the error
+    falls below the simplification tolerance of `strategy`. Returns the
+    relative error and the norm squared of `mps`."""
+    size = mps.size
+    simplification_tolerance = strategy.get_simplification_tolerance()
+    err = 2.0
+    norm_mps_sqr = 0.0
+    for sweep in range(max(1, strategy.get_max_sweeps())):
+        if direction > 0:
+            for n in range(0, size - 1):
+                mps.update_2site_right(
+                    _weighted_sum(weights, (f.tensor2site(direction) for f in forms)),
+                    n,
+                    strategy,
+                )
+                for f in forms:
+                    f.update_right()
+            last_tensor = mps[size - 1]
+        else:
+            for n in reversed(range(0, size - 1)):
+                mps.update_2site_left(
+                    _weighted_sum(weights, (f.tensor2site(direction) for f in forms)),
+                    n,
+                    strategy,
+                )
+                for f in forms:
+                    f.update_left()
+            last_tensor = mps[0]
+        #
+        # We estimate the error
+        #
+        norm_mps_sqr = np.vdot(last_tensor, last_tensor).real
+        mps_state_scprod = np.vdot(
+            last_tensor,
+            _weighted_sum(weights, (f.tensor1site() for f in forms)),
+        )
+        old_err = err
+        err = 2 * abs(1.0 - mps_state_scprod.real / sqrt(norm_mps_sqr * norm_state_sqr))
+        if logger:
+            logger(
+                f"sweep={sweep}, rel.err.={err:6g}, old err.={old_err:6g}, |mps|={norm_mps_sqr**0.5:6g}, tol={simplification_tolerance:6g}",
+            )
+        if err < simplification_tolerance or err > old_err:
+            logger("Stopping, as tolerance reached")
+            break
+        direction = -direction
+    return err, norm_mps_sqr
+
+
+def _finish_fit(
+    mps: CanonicalMPS,
+    state_error: float,
+    err: float,
+    norm_mps_sqr: float,
+    normalize: bool,
+    logger: Logger,
+) -> CanonicalMPS:
+    """Normalize the outcome of :func:`_fit_sweeps` and record its error."""
+    total_error_bound = state_error + sqrt(err)
+    if normalize and norm_mps_sqr:
+        factor = sqrt(norm_mps_sqr)
+        mps[mps.center] = mps[mps.center] / factor
+        total_error_bound /= factor
+    mps._error = total_error_bound
+    logger.close()
+    return mps
+
+
 def simplify(
     state: MPS | MPSSum,
     strategy: Strategy = SIMPLIFICATION_STRATEGY,
@@ -59,7 +159,6 @@ def simplify(
 
     # Prepare initial guess
     normalize = strategy.get_normalize_flag()
-    size = state.size
     start = 0 if direction > 0 else -1
     logger = make_logger(2)
 
@@ -101,47 +200,15 @@ def simplify(
     if not (norm_state_sqr := state.norm_squared()):
         return CanonicalMPS(state.zero_state(), is_canonical=True)
     form = AntilinearForm(mps, state, center=start)
-    err = 2.0
     if logger:
         logger(
             f"SIMPLIFY state with |state|={norm_state_sqr**0.5} for "
             + f"{strategy.get_max_sweeps()} sweeps, with tolerance {simplification_tolerance}.\nStrategy: {strategy}",
         )
-    norm_mps_sqr = 0.0
-    for sweep in range(max(1, strategy.get_max_sweeps())):
-        if direction > 0:
-            for n in range(0, size - 1):
-                mps.update_2site_right(form.tensor2site(direction), n, strategy)
-                form.update_right()
-            last_tensor = mps[size - 1]
-        else:
-            for n in reversed(range(0, size - 1)):
-                mps.update_2site_left(form.tensor2site(direction), n, strategy)
-                form.update_left()
-            last_tensor = mps[0]
-        #
-        # We estimate the error
-        #
-        norm_mps_sqr = np.vdot(last_tensor, last_tensor).real
-        mps_state_scprod = np.vdot(last_tensor, form.tensor1site())
-        old_err = err
-        err = 2 * abs(1.0 - mps_state_scprod.real / sqrt(norm_mps_sqr * norm_state_sqr))
-        if logger:
-            logger(
-                f"sweep={sweep}, rel.err.={err:6g}, old err.={old_err:6g}, |mps|={norm_mps_sqr**0.5:6g}, tol={simplification_tolerance:6g}",
-            )
-        if err < simplification_tolerance or err > old_err:
-            logger("Stopping, as tolerance reached")
-            break
-        direction = -direction
-    total_error_bound = state._error + sqrt(err)
-    if normalize and norm_mps_sqr:
-        factor = sqrt(norm_mps_sqr)
-        last_tensor /= factor  # pyright: ignore[reportPossiblyUnboundVariable]
-        total_error_bound /= factor
-    mps._error = total_error_bound
-    logger.close()
-    return mps
+    err, norm_mps_sqr = _fit_sweeps(
+        mps, [1.0], [form], norm_state_sqr, strategy, direction, logger
+    )
+    return _finish_fit(mps, state.error(), err, norm_mps_sqr, normalize, logger)
 
 
 # TODO: We have to rationalize all this about directions. The user should
@@ -219,9 +286,8 @@ def simplify_mps_sum(
     )
     simplification_tolerance = strategy.get_simplification_tolerance()
 
-    size = mps.size
     weights, states = sum_state.weights, sum_state.states
-    forms = [AntilinearForm(mps, si, center=start) for si in states]
+    form = AntilinearFormSum(mps, states, weights, center=start)
     if logger:
         logger(
             f"COMBINE state with |state|={norm_state_sqr**0.5:5e} for {strategy.get_max_sweeps():5e}"
@@ -229,55 +295,152 @@ def simplify_mps_sum(
             + f"\nWeights: {weights}",
         )
 
-    err = 2.0
-    norm_mps_sqr = 0.0
-    for sweep in range(max(1, strategy.get_max_sweeps())):
-        if direction > 0:
-            for n in range(0, size - 1):
-                mps.update_2site_right(
-                    sum(w * f.tensor2site(direction) for w, f in zip(weights, forms)),  # type: ignore # pyright: ignore[reportArgumentType]
-                    n,
-                    strategy,
-                )
-                for f in forms:
-                    f.update_right()
-            last_tensor = mps[size - 1]
+    err, norm_mps_sqr = _fit_sweeps(
+        mps, [1.0], [form], norm_state_sqr, strategy, direction, logger
+    )
+    return _finish_fit(mps, sum_state.error(), err, norm_mps_sqr, normalize, logger)
+
+
+def _mpo_product_norm_squared(
+    weights: Sequence[Weight],
+    operators: Sequence[Sequence[Tensor4]],
+    states: Sequence[MPS],
+) -> float:
+    """Norm squared of :math:`\\sum_i w_i O_i\\psi_i`, computed from the
+    expectation values of :math:`O_i^\\dagger O_j`."""
+    adjoints = [[np.conj(O).transpose(0, 2, 1, 3) for O in Oi] for Oi in operators]
+    total = 0.0
+    for i, (wi, Oi, bra) in enumerate(zip(weights, adjoints, states)):
+        for j, (wj, Oj, ket) in enumerate(zip(weights, operators, states)):
+            if j < i:
+                continue
+            rho = np.ones((1, 1, 1, 1))
+            for A, Oa, Ob, B in zip(bra, Oi, Oj, ket):
+                rho = update_left_mpo_squared_environment(rho, A, Oa, Ob, B)
+            # Terms with j > i also stand for their complex conjugates
+            value = np.conj(wi) * wj * rho[0, 0, 0, 0]
+            total += value.real if i == j else 2 * value.real
+    return abs(float(total))
+
+
+def simplify_mpo_product(
+    operator: Sequence[Tensor4],
+    state: MPS | MPSSum,
+    strategy: Strategy = SIMPLIFICATION_STRATEGY,
+    direction: int = +1,
+    guess: MPS | None = None,
+) -> CanonicalMPS:
+    """Approximate the product of a matrix-product operator and a state by an
+    MPS, fitting it variationally without constructing the product.
+
+    The optimization contracts the MPS with environments of the operator and
+    the state, so that the intermediate bond dimension `D*W` of the exact
+    product never appears.
+
+    Parameters
+    ----------
+    operator : Sequence[Tensor4]
+        Tensors of the matrix-product operator, such as an :class:`MPO`.
+    state : MPS | MPSSum
+        State on which the operator acts.
+    strategy : Strategy
+        Truncation strategy. Defaults to `SIMPLIFICATION_STRATEGY`.
+    direction : { +1, -1 }
+        Initial direction for the sweeping algorithm.
+    guess : MPS, optional
+        A guess for the new state, such as the outcome of a previous
+        application. Defaults to `state` if the operator preserves the
+        physical dimensions, or to a random state otherwise.
+
+    Returns
+    -------
+    CanonicalMPS
+        Approximation :math:`\\xi` to the product.
+    """
+    return simplify_mpo_sum_product(
+        [operator], [1.0], state, strategy, direction, guess
+    )
+
+
+def simplify_mpo_sum_product(
+    operators: Sequence[Sequence[Tensor4]],
+    weights: Sequence[Weight],
+    state: MPS | MPSSum,
+    strategy: Strategy = SIMPLIFICATION_STRATEGY,
+    direction: int = +1,
+    guess: MPS | None = None,
+) -> CanonicalMPS:
+    """Approximate :math:`\\sum_k w_k O_k\\psi` by an MPS, fitting it
+    variationally with one set of environments per term, without constructing
+    any of the products :math:`O_k\\psi`.
+
+    Parameters
+    ----------
+    operators : Sequence[Sequence[Tensor4]]
+        Tensors of each matrix-product operator :math:`O_k`.
+    weights : Sequence[Weight]
+        Weights :math:`w_k` of the operators.
+    state : MPS | MPSSum
+        State :math:`\\psi` on which the operators act.
+    strategy : Strategy
+        Truncation strategy. Defaults to `SIMPLIFICATION_STRATEGY`.
+    direction : { +1, -1 }
+        Initial direction for the sweeping algorithm.
+    guess : MPS, optional
+        A guess for the new state, as in :func:`simplify_mpo_product`.
+
+    Returns
+    -------
+    CanonicalMPS
+        Approximation :math:`\\xi` to the linear combination.
+    """
+    if isinstance(state, MPSSum):
+        state.delete_zero_components()
+        state_weights, states = state.weights, state.states
+    else:
+        state_weights, states = [1.0], [state]
+    terms = [
+        (w * v, O, s)
+        for w, O in zip(weights, operators)
+        for v, s in zip(state_weights, states)
+    ]
+    term_weights = [w for w, _, _ in terms]
+    term_operators = [O for _, O, _ in terms]
+    term_states = [s for _, _, s in terms]
+    logger = make_logger(2)
+    norm_state_sqr = _mpo_product_norm_squared(
+        term_weights, term_operators, term_states
+    )
+    if not norm_state_sqr:
+        if logger:
+            logger("MPO product with |state|=0. Returning zero state.")
+            logger.close()
+        return CanonicalMPS(states[0].zero_state(), is_canonical=True)
+
+    normalize = strategy.get_normalize_flag()
+    start = 0 if direction > 0 else -1
+    if guess is None:
+        dimensions = [O.shape[1] for O in operators[0]]
+        if dimensions == states[0].physical_dimensions():
+            guess = states[0]
         else:
-            for n in reversed(range(0, size - 1)):
-                mps.update_2site_left(
-                    sum(w * f.tensor2site(direction) for w, f in zip(weights, forms)),  # type: ignore # pyright: ignore[reportArgumentType]
-                    n,
-                    strategy,
-                )
-                for f in forms:
-                    f.update_left()
-            last_tensor = mps[0]
-        #
-        # We estimate the error
-        #
-        norm_mps_sqr = np.vdot(last_tensor, last_tensor).real
-        mps_state_scprod = np.vdot(
-            last_tensor,
-            sum(w * f.tensor1site() for w, f in zip(weights, forms)),
+            guess = random_mps(dimensions, D=max(states[0].bond_dimensions()))
+    mps = CanonicalMPS(guess, center=start, normalize=False, strategy=strategy)
+    forms = [
+        MPOAntilinearForm(mps, O, s, center=start)
+        for O, s in zip(term_operators, term_states)
+    ]
+    if logger:
+        logger(
+            f"MPO PRODUCT with |state|={norm_state_sqr**0.5:5e} and {len(terms)} "
+            + f"terms for {strategy.get_max_sweeps()} sweeps, with tolerance "
+            + f"{strategy.get_simplification_tolerance()}.\nStrategy: {strategy}",
         )
-        old_err = err
-        err = 2 * abs(1.0 - mps_state_scprod.real / sqrt(norm_mps_sqr * norm_state_sqr))
-        if logger:
-            logger(
-                f"sweep={sweep}, rel.err.={err:6g}, old err.={old_err:6g}, |mps|={norm_mps_sqr**0.5:6g}, tol={simplification_tolerance:6g}",
-            )
-        if err < simplification_tolerance or err > old_err:
-            logger("Stopping, as tolerance reached")
-            break
-        direction = -direction
-    total_error_bound = sum_state.error() + sqrt(err)
-    if normalize and norm_mps_sqr:
-        factor = sqrt(norm_mps_sqr)
-        last_tensor /= factor  # pyright: ignore[reportPossiblyUnboundVariable]
-        total_error_bound /= factor
-    mps._error = total_error_bound
-    logger.close()
-    return mps
+    err, norm_mps_sqr = _fit_sweeps(
+        mps, term_weights, forms, norm_state_sqr, strategy, direction, logger
+    )
+    error = sum(abs(w) * s.error() for w, s in zip(term_weights, term_states))
+    return _finish_fit(mps, error, err, norm_mps_sqr, normalize, logger)
 
 
 def combine(
@@ -293,4 +456,9 @@ def combine(
 
 simplify_mps = simplify
 
-__all__ = ["simplify", "simplify_mps"]
+__all__ = [
+    "simplify",
+    "simplify_mpo_product",
+    "simplify_mpo_sum_product",
+    "simplify_mps",
+]
@@ -0,0 +1,22 @@
+from .mps import (
+    canonical_symmetric_mps,
+    random_symmetric_mps,
+    symmetric_mpo,
+    symmetric_mps,
+    to_dense_mps,
+)
+from .tensor import U1, Z2, BlockSparseTensor, Leg, Symmetry, tensordot
+
+__all__ = [
+    "U1",
+    "Z2",
+    "BlockSparseTensor",
+    "Leg",
+    "Symmetry",
+    "canonical_symmetric_mps",
+    "random_symmetric_mps",
+    "symmetric_mpo",
+    "symmetric_mps",
+    "tensordot",
+    "to_dense_mps",
+]
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from ..cython import DEFAULT_STRATEGY, Strategy
+from ..operators import MPO
+from ..state import MPS, CanonicalMPS
+from ..tools import DEFAULT_RNG
+from .tensor import U1, BlockSparseTensor, Leg, Symmetry, _split
+
+PhysicalCharges = Sequence[int] | Sequence[Sequence[int]]
+
+
+def _physical_charges(charges: PhysicalCharges, size: int) -> list[Sequence[int]]:
+    """Charges of the physical legs of each site, given either for all
+    sites or site by site."""
+    if len(charges) and isinstance(charges[0], (int, np.integer)):
+        return [charges] * size  # type: ignore
+    if len(charges) != size:
+        raise ValueError("Physical charges do not match the size of the network")
+    return list(charges)  # type: ignore
+
+
+def _bond_charges(
+    A: np.ndarray, qL: np.ndarray, q: np.ndarray, symmetry: Symmetry, tolerance: float
+) -> np.ndarray:
+    """Deduce the charges of the last index of `A[a,...,b]` from the charges
+    `qL` of its first index and the charges `q[...]` that its middle indices
+    add to the state."""
+    A = A.reshape(A.shape[0], -1, A.shape[-1])
+    charges = np.zeros(A.shape[-1], dtype=np.int64)
+    threshold = tolerance * np.max(np.abs(A), initial=0.0)
+    for b in range(A.shape[-1]):
+        a, i = np.nonzero(np.abs(A[:, :, b]) > threshold)
+        values = np.unique([symmetry.fuse(int(x)) for x in qL[a] + q[i]])
+        if values.size > 1:
+            raise ValueError("Tensor network does not conserve the charge")
+        if values.size:
+            charges[b] = values[0]
+    return charges
+
+
+def symmetric_mps(
+    state: MPS,
+    charges: PhysicalCharges,
+    symmetry: Symmetry = U1,
+    tolerance: float = 1e-14,
+) -> MPS:
+    """Convert an MPS with a definite charge into one with block-sparse tensors.
+
+    The charges of the bond indices are deduced from the charges of the
+    physical indices, starting with a zero charge on the left boundary.
+
+    Parameters
+    ----------
+    state : MPS
+        Matrix product state with dense tensors.
+    charges : Sequence[int] | Sequence[Sequence[int]]
+        Charges of the physical basis states, either one list for all sites
+        or one list for each site.
+    symmetry : Symmetry, default = U1
+        Group that the charges belong to.
+    tolerance : float, default = 1e-14
+        Relative size of the tensor elements that are considered zero.
+
+    Returns
+    -------
+    MPS
+        An MPS (or :class:`CanonicalMPS` if `state` was in canonical form) with
+        :class:`BlockSparseTensor` tensors.
+
+    Raises
+    ------
+    ValueError
+        If the state is a superposition of different charges.
+    """
+    physical = _physical_charges(charges, state.size)
+    qL = np.zeros(1, dtype=np.int64)
+    left = Leg(qL, +1, symmetry)
+    tensors = []
+    for A, q in zip(state, physical):
+        q = np.asarray(q, dtype=np.int64)
+        qR = _bond_charges(A, qL, q, symmetry, tolerance)
+        right = Leg(qR, -1, symmetry)
+        tensors.append(
+            BlockSparseTensor.from_dense(
+                A, [left, Leg(q, +1, symmetry), right], symmetry, np.sqrt(tolerance)
+            )
+        )
+        left, qL = right.dual(), qR
+    if isinstance(state, CanonicalMPS):
+        return CanonicalMPS(
+            tensors, center=state.center, is_canonical=True, error=state.error()
+        )
+    return MPS(tensors, error=state.error())
+
+
+def symmetric_mpo(
+    H: MPO,
+    charges: PhysicalCharges,
+    symmetry: Symmetry = U1,
+    tolerance: float = 1e-14,
+) -> MPO:
+    """Convert an MPO that conserves a charge into one with block-sparse tensors.
+
+    Parameters
+    ----------
+    H : MPO
+        Matrix product operator with dense tensors `O[a,i,j,b]`.
+    charges : Sequence[int] | Sequence[Sequence[int]]
+        Charges of the physical basis states, either one list for all sites
+        or one list for each site.
+    symmetry : Symmetry, default = U1
+        Group that the charges belong to.
+    tolerance : float, default = 1e-14
+        Relative size of the tensor elements that are considered zero.
+
+    Returns
+    -------
+    MPO
+        Operator with :class:`BlockSparseTensor` tensors.
+
+    Raises
+    ------
+    ValueError
+        If the operator does not conserve the charge.
+    """
+    physical = _physical_charges(charges, H.size)
+    qL = np.zeros(1, dtype=np.int64)
+    left = Leg(qL, +1, symmetry)
+    tensors = []
+    for O, q in zip(H, physical):
+        q = np.asarray(q, dtype=np.int64)
+        qR = _bond_charges(
+            O, qL, (q[:, np.newaxis] - q).reshape(-1), symmetry, tolerance
+        )
+        right = Leg(qR, -1, symmetry)
+        tensors.append(
+            BlockSparseTensor.from_dense(
+                O,
+                [left, Leg(q, +1, symmetry), Leg(q, -1, symmetry), right],
+                symmetry,
+                np.sqrt(tolerance),
+            )
+        )
+        left, qL = right.dual(), qR
+    if np.any(qL != 0):
+        raise ValueError("MPO does not conserve the charge")
+    return MPO(tensors, H.strategy)
+
+
+def canonical_symmetric_mps(
+    state: MPS, center: int = 0, strategy: Strategy = DEFAULT_STRATEGY
+) -> CanonicalMPS:
+    """Bring an MPS with block-sparse tensors into canonical form, dropping
+    the Schmidt vectors that `strategy` truncates."""
+    tensors = list(state)
+    L = len(tensors)
+    center = center % L
+    error = 0.0
+    for i in range(center):
+        U, V, err = _split(tensors[i], 2, strategy, True)
+        tensors[i] = U
+        tensors[i + 1] = np.tensordot(V, tensors[i + 1], (1, 0))
+        error += err
+    for i in range(L - 1, center, -1):
+        U, V, err = _split(tensors[i], 1, strategy, False)
+        tensors[i] = V
+        tensors[i - 1] = np.tensordot(tensors[i - 1], U, (2, 0))
+        error += err
+    return CanonicalMPS(tensors, center=center, is_canonical=True, error=error)
+
+
+def random_symmetric_mps(
+    charges: PhysicalCharges,
+    size: int,
+    total_charge: int,
+    D: int = 1,
+    symmetry: Symmetry = U1,
+    complex: bool = False,
+    rng: np.random.Generator = DEFAULT_RNG,
+) -> CanonicalMPS:
+    """Create a random state in canonical form with a definite charge.
+
+    Parameters
+    ----------
+    charges : Sequence[int] | Sequence[Sequence[int]]
+        Charges of the physical basis states, either one list for all sites
+        or one list for each site.
+    size : int
+        Number of sites.
+    total_charge : int
+        Charge of the state.
+    D : int, default = 1
+        Approximate bond dimension, distributed among the allowed charges.
+    symmetry : Symmetry, default = U1
+        Group that the charges belong to.
+    complex : bool, default = False
+        Whether the tensors are complex.
+    rng : np.random.Generator, default = `seemps.tools.DEFAULT_RNG`
+        Random number generator.
+
+    Returns
+    -------
+    CanonicalMPS
+        Normalized state with :class:`BlockSparseTensor` tensors.
+    """
+    physical = [
+        sorted({symmetry.fuse(int(q)) for q in site})
+        for site in _physical_charges(charges, size)
+    ]
+    #
+    # Charges of each bond that are reachable from the left boundary and
+    # from which the total charge can be reached at the right boundary.
+    #
+    forward = [{0}]
+    for q in physical:
+        forward.append({symmetry.fuse(a + b) for a in forward[-1] for b in q})
+    backward = [{symmetry.fuse(total_charge)}]
+    for q in reversed(physical):
+        backward.append({symmetry.fuse(a - b) for a in backward[-1] for b in q})
+    backward.reverse()
+    bonds = []
+    for F, B in zip(forward, backward):
+        allowed = sorted(F & B)
+        if not allowed:
+            raise ValueError(f"There are no states with charge {total_charge}")
+        m = max(1, D // len(allowed))
+        bonds.append(Leg(np.repeat(allowed, m), -1, symmetry))
+    bonds[0] = Leg([0], -1, symmetry)
+    bonds[-1] = Leg([total_charge], -1, symmetry)
+    tensors = [
+        BlockSparseTensor.random(
+            [left.dual(), Leg(site, +1, symmetry), right], symmetry, complex, rng
+        )
+        for left, site, right in zip(
+            bonds[:-1], _physical_charges(charges, size), bonds[1:]
+        )
+    ]
+    state = canonical_symmetric_mps(
+        canonical_symmetric_mps(MPS(tensors), center=-1), center=0
+    )
+    state[0] = state[0] / state[0].norm()
+    return state
+
+
+def to_dense_mps(state: MPS) -> MPS:
+    """Convert an MPS with block-sparse tensors back to dense tensors."""
+    tensors = [A.to_dense() for A in state]
+    if isinstance(state, CanonicalMPS):
+        return CanonicalMPS(
+            tensors, center=state.center, is_canonical=True, error=state.error()
+        )
+    return MPS(tensors, error=state.error())
+
+
+__all__ = [
+    "canonical_symmetric_mps",
+    "random_symmetric_mps",
+    "symmetric_mpo",
+    "symmetric_mps",
+    "to_dense_mps",
+]
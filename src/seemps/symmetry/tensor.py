@@ -0,0 +1,614 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from ..cython import (
+    DEFAULT_STRATEGY,
+    Strategy,
+    _destructive_svd,
+    destructively_truncate_vector,
+)
+from ..tools import DEFAULT_RNG
+
+BlockKey = tuple[int, ...]
+
+
+class Symmetry:
+    """Abelian symmetry group with irreducible representations labelled by
+    integer charges.
+
+    Parameters
+    ----------
+    modulus : int, default = 0
+        Zero for the group U(1), where charges are added, or `n` for the
+        cyclic group Z_n, where charges are added modulo `n`.
+    """
+
+    modulus: int
+
+    def __init__(self, modulus: int = 0):
+        if modulus < 0 or modulus == 1:
+            raise ValueError(f"Invalid modulus {modulus} for an abelian symmetry")
+        self.modulus = modulus
+
+    def fuse(self, charge: int) -> int:
+        """Reduce a sum of charges to its canonical label."""
+        return charge % self.modulus if self.modulus else charge
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Symmetry) and other.modulus == self.modulus
+
+    def __hash__(self) -> int:
+        return hash(self.modulus)
+
+    def __repr__(self) -> str:
+        return f"Z{self.modulus}" if self.modulus else "U1"
+
+
+U1 = Symmetry(0)
+"""Symmetry group U(1), such as particle number or magnetization conservation."""
+
+Z2 = Symmetry(2)
+"""Symmetry group Z_2, such as parity conservation."""
+
+
+class Leg:
+    """Index of a :class:`BlockSparseTensor` whose basis states carry charges.
+
+    Parameters
+    ----------
+    charges : Iterable[int]
+        Charge of each basis state of this index.
+    flow : { +1, -1 }, default = +1
+        Whether the charges flow into (+1) or out of (-1) the tensor.
+    symmetry : Symmetry, default = U1
+        Group that the charges belong to.
+    """
+
+    charges: NDArray[np.int64]
+    flow: int
+    symmetry: Symmetry
+    sectors: dict[int, NDArray[np.intp]]
+
+    def __init__(self, charges: Iterable[int], flow: int = +1, symmetry: Symmetry = U1):
+        if flow not in (+1, -1):
+            raise ValueError(f"Invalid flow {flow} in Leg")
+        charges = np.asarray(list(charges), dtype=np.int64)
+        if symmetry.modulus:
+            charges = charges % symmetry.modulus
+        self.charges = charges
+        self.flow = flow
+        self.symmetry = symmetry
+        self.sectors = {
+            int(q): np.flatnonzero(charges == q) for q in np.unique(charges)
+        }
+
+    @property
+    def dim(self) -> int:
+        """Total dimension of this index."""
+        return self.charges.size
+
+    def sector_dim(self, charge: int) -> int:
+        """Number of basis states with the given `charge`."""
+        indices = self.sectors.get(charge)
+        return 0 if indices is None else indices.size
+
+    def dual(self) -> Leg:
+        """Leg with the same charges and opposite flow, which can be
+        contracted with this one."""
+        output = Leg.__new__(Leg)
+        output.charges = self.charges
+        output.flow = -self.flow
+        output.symmetry = self.symmetry
+        output.sectors = self.sectors
+        return output
+
+    def same_charges(self, other: Leg) -> bool:
+        """Whether both legs have the same charges in the same order."""
+        return self.charges is other.charges or (
+            self.symmetry == other.symmetry
+            and np.array_equal(self.charges, other.charges)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Leg)
+            and self.flow == other.flow
+            and self.same_charges(other)
+        )
+
+    def __repr__(self) -> str:
+        dims = {q: len(i) for q, i in self.sectors.items()}
+        return f"Leg({dims}, flow={self.flow:+d})"
+
+
+def _allowed_keys(legs: Sequence[Leg], symmetry: Symmetry) -> Iterator[BlockKey]:
+    """Iterate over the tuples of charges, one per leg, that conserve
+    the total charge of a tensor."""
+    if not legs:
+        return
+    *first, last = legs
+    for key in itertools.product(*(leg.sectors.keys() for leg in first)):
+        total = sum(leg.flow * q for leg, q in zip(first, key))
+        q = symmetry.fuse(-last.flow * total)
+        if q in last.sectors:
+            yield key + (q,)
+
+
+class BlockSparseTensor:
+    """Tensor that conserves an abelian charge, stored as dense blocks.
+
+    Each leg of the tensor is a :class:`Leg`, whose basis states are labelled
+    by charges. The tensor is nonzero only on those blocks where the sum of
+    the charges, weighted by the flow of each leg, vanishes (modulo `n` for a
+    Z_n symmetry). Only those blocks are stored and operated upon.
+
+    The class implements NumPy's dispatch protocol for :func:`numpy.tensordot`,
+    :func:`numpy.vdot`, :func:`numpy.linalg.norm` and :func:`numpy.conj`, so
+    that it can be used in the algorithms written for dense tensors.
+
+    Parameters
+    ----------
+    legs : Sequence[Leg]
+        Indices of the tensor.
+    blocks : dict[tuple[int, ...], NDArray], optional
+        Dense blocks of the tensor, labelled by the charges of each leg.
+        Defaults to an empty tensor.
+    symmetry : Symmetry, default = U1
+        Group that the charges belong to.
+    dtype : DTypeLike, default = np.float64
+        Type of the tensor when there are no blocks.
+    """
+
+    legs: tuple[Leg, ...]
+    symmetry: Symmetry
+    blocks: dict[BlockKey, NDArray]
+
+    def __init__(
+        self,
+        legs: Sequence[Leg],
+        blocks: dict[BlockKey, NDArray] | None = None,
+        symmetry: Symmetry = U1,
+        dtype: DTypeLike = np.float64,
+    ):
+        self.legs = tuple(legs)
+        self.symmetry = symmetry
+        self.blocks = {} if blocks is None else blocks
+        self._dtype = np.dtype(dtype)
+
+    @classmethod
+    def zeros(
+        cls, legs: Sequence[Leg], symmetry: Symmetry = U1, dtype: DTypeLike = np.float64
+    ) -> BlockSparseTensor:
+        """Create a tensor with all allowed blocks set to zero."""
+        return cls(
+            legs,
+            {
+                key: np.zeros(cls._block_shape(legs, key), dtype=dtype)
+                for key in _allowed_keys(legs, symmetry)
+            },
+            symmetry,
+            dtype,
+        )
+
+    @classmethod
+    def random(
+        cls,
+        legs: Sequence[Leg],
+        symmetry: Symmetry = U1,
+        complex: bool = False,
+        rng: np.random.Generator = DEFAULT_RNG,
+    ) -> BlockSparseTensor:
+        """Create a tensor with all allowed blocks filled with Gaussian
+        random numbers."""
+        blocks = {}
+        for key in _allowed_keys(legs, symmetry):
+            shape = cls._block_shape(legs, key)
+            block = rng.normal(size=shape)
+            if complex:
+                block = block + 1j * rng.normal(size=shape)
+            blocks[key] = block
+        return cls(legs, blocks, symmetry, np.complex128 if complex else np.float64)
+
+    @classmethod
+    def from_dense(
+        cls,
+        A: NDArray,
+        legs: Sequence[Leg],
+        symmetry: Symmetry = U1,
+        tolerance: float = 1e-14,
+    ) -> BlockSparseTensor:
+        """Extract the allowed blocks of a dense tensor `A`.
+
+        Parameters
+        ----------
+        A : NDArray
+            Dense tensor with shape `(leg.dim for leg in legs)`.
+        legs : Sequence[Leg]
+            Charges and flows of the tensor indices.
+        symmetry : Symmetry, default = U1
+            Group that the charges belong to.
+        tolerance : float, default = 1e-14
+            Maximum norm, relative to the norm of `A`, of the elements
+            outside the allowed blocks.
+
+        Raises
+        ------
+        ValueError
+            If the tensor does not conserve the charges.
+        """
+        A = np.asarray(A)
+        if A.shape != tuple(leg.dim for leg in legs):
+            raise ValueError("Tensor shape does not match its legs")
+        blocks = {}
+        norm2 = 0.0
+        for key in _allowed_keys(legs, symmetry):
+            block = A[np.ix_(*(leg.sectors[q] for leg, q in zip(legs, key)))]
+            blocks[key] = block
+            norm2 += np.vdot(block, block).real
+        total = np.vdot(A, A).real
+        if total - norm2 > (tolerance**2) * total:
+            raise ValueError("Tensor does not conserve the charges of its legs")
+        return cls(legs, blocks, symmetry, A.dtype)
+
+    @staticmethod
+    def _block_shape(legs: Sequence[Leg], key: BlockKey) -> tuple[int, ...]:
+        return tuple(leg.sector_dim(q) for leg, q in zip(legs, key))
+
+    def to_dense(self) -> NDArray:
+        """Return the tensor as a dense array."""
+        A = np.zeros(self.shape, dtype=self.dtype)
+        for key, block in self.blocks.items():
+            A[np.ix_(*(leg.sectors[q] for leg, q in zip(self.legs, key)))] = block
+        return A
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Dimensions of the tensor, as if it were dense."""
+        return tuple(leg.dim for leg in self.legs)
+
+    @property
+    def ndim(self) -> int:
+        """Number of legs."""
+        return len(self.legs)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Type of the tensor elements."""
+        if self.blocks:
+            return np.result_type(*self.blocks.values())
+        return self._dtype
+
+    @property
+    def stored_size(self) -> int:
+        """Number of elements that are actually stored."""
+        return sum(block.size for block in self.blocks.values())
+
+    def copy(self) -> BlockSparseTensor:
+        return BlockSparseTensor(
+            self.legs,
+            {key: block.copy() for key, block in self.blocks.items()},
+            self.symmetry,
+            self._dtype,
+        )
+
+    def conj(self) -> BlockSparseTensor:
+        """Complex conjugate tensor, with all flows reversed."""
+        return BlockSparseTensor(
+            [leg.dual() for leg in self.legs],
+            {key: block.conj() for key, block in self.blocks.items()},
+            self.symmetry,
+            self._dtype,
+        )
+
+    def transpose(self, *axes: int) -> BlockSparseTensor:
+        """Permute the legs of the tensor, as :meth:`numpy.ndarray.transpose`."""
+        if len(axes) == 1 and not isinstance(axes[0], int):
+            axes = tuple(axes[0])  # type: ignore
+        if not axes:
+            axes = tuple(range(self.ndim - 1, -1, -1))
+        return BlockSparseTensor(
+            [self.legs[i] for i in axes],
+            {
+                tuple(key[i] for i in axes): block.transpose(axes)
+                for key, block in self.blocks.items()
+            },
+            self.symmetry,
+            self._dtype,
+        )
+
+    def norm(self) -> float:
+        """Frobenius norm of the tensor."""
+        return float(np.sqrt(sum(np.vdot(b, b).real for b in self.blocks.values())))
+
+    def block_layout(self) -> list[tuple[BlockKey, tuple[int, ...]]]:
+        """Keys and shapes of all blocks allowed by the legs of this tensor,
+        in the order used by :meth:`to_block_vector`."""
+        return [
+            (key, self._block_shape(self.legs, key))
+            for key in sorted(_allowed_keys(self.legs, self.symmetry))
+        ]
+
+    def to_block_vector(
+        self, layout: list[tuple[BlockKey, tuple[int, ...]]] | None = None
+    ) -> NDArray:
+        """Concatenate the blocks into a vector, filling missing blocks with
+        zeros, following the order of `layout` (see :meth:`block_layout`)."""
+        if layout is None:
+            layout = self.block_layout()
+        dtype = self.dtype
+        pieces = []
+        for key, shape in layout:
+            block = self.blocks.get(key)
+            if block is None:
+                pieces.append(np.zeros(int(np.prod(shape)), dtype=dtype))
+            else:
+                pieces.append(block.reshape(-1))
+        if not pieces:
+            return np.zeros(0, dtype=dtype)
+        return np.concatenate(pieces)
+
+    def from_block_vector(
+        self,
+        v: NDArray,
+        layout: list[tuple[BlockKey, tuple[int, ...]]] | None = None,
+    ) -> BlockSparseTensor:
+        """Create a tensor with the legs of this one and the blocks stored
+        in the vector `v`, inverting :meth:`to_block_vector`."""
+        if layout is None:
+            layout = self.block_layout()
+        blocks = {}
+        offset = 0
+        for key, shape in layout:
+            size = int(np.prod(shape))
+            blocks[key] = v[offset : offset + size].reshape(shape)
+            offset += size
+        return BlockSparseTensor(self.legs, blocks, self.symmetry, v.dtype)
+
+    def left_orth_2site(
+        self, strategy: Strategy = DEFAULT_STRATEGY
+    ) -> tuple[BlockSparseTensor, BlockSparseTensor, float]:
+        """Split a tensor AA[a,b,c,d] into B[a,b,r] and C[r,c,d] such that
+        'B' is a left-isometry, truncating the size 'r' according to the given
+        'strategy'. Block-sparse version of `_left_orth_2site`."""
+        return _split(self, 2, strategy, True)
+
+    def right_orth_2site(
+        self, strategy: Strategy = DEFAULT_STRATEGY
+    ) -> tuple[BlockSparseTensor, BlockSparseTensor, float]:
+        """Split a tensor AA[a,b,c,d] into B[a,b,r] and C[r,c,d] such that
+        'C' is a right-isometry, truncating the size 'r' according to the
+        given 'strategy'. Block-sparse version of `_right_orth_2site`."""
+        return _split(self, 2, strategy, False)
+
+    def _scaled(self, factor: complex) -> BlockSparseTensor:
+        return BlockSparseTensor(
+            self.legs,
+            {key: factor * block for key, block in self.blocks.items()},
+            self.symmetry,
+            self._dtype,
+        )
+
+    def __mul__(self, factor: complex) -> BlockSparseTensor:
+        if isinstance(factor, (int, float, complex, np.number)):
+            return self._scaled(factor)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, factor: complex) -> BlockSparseTensor:
+        if isinstance(factor, (int, float, complex, np.number)):
+            return self._scaled(1.0 / factor)
+        return NotImplemented
+
+    def __neg__(self) -> BlockSparseTensor:
+        return self._scaled(-1)
+
+    def __add__(self, other: BlockSparseTensor) -> BlockSparseTensor:
+        if not isinstance(other, BlockSparseTensor):
+            return NotImplemented
+        if other.legs != self.legs:
+            raise ValueError("Cannot add block-sparse tensors with different legs")
+        blocks = dict(self.blocks)
+        for key, block in other.blocks.items():
+            old = blocks.get(key)
+            blocks[key] = block if old is None else old + block
+        return BlockSparseTensor(self.legs, blocks, self.symmetry, self._dtype)
+
+    def __sub__(self, other: BlockSparseTensor) -> BlockSparseTensor:
+        if not isinstance(other, BlockSparseTensor):
+            return NotImplemented
+        return self + (-other)
+
+    def __array_function__(self, func, types, args, kwargs):
+        implementation = _ARRAY_FUNCTIONS.get(func)
+        if implementation is None:
+            return NotImplemented
+        return implementation(*args, **kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if ufunc is np.conjugate and method == "__call__" and not kwargs:
+            return inputs[0].conj()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"BlockSparseTensor(shape={self.shape}, symmetry={self.symmetry}, "
+            f"blocks={len(self.blocks)}, stored={self.stored_size})"
+        )
+
+
+def tensordot(
+    A: BlockSparseTensor,
+    B: BlockSparseTensor,
+    axes: int | tuple[int | Sequence[int], int | Sequence[int]] = 2,
+) -> BlockSparseTensor:
+    """Block-sparse version of :func:`numpy.tensordot`.
+
+    Contracted legs must have the same charges and opposite flows. Each
+    pair of compatible blocks is contracted with a dense GEMM."""
+    if isinstance(axes, int):
+        axes_A = list(range(A.ndim - axes, A.ndim))
+        axes_B = list(range(axes))
+    else:
+        axes_A = [axes[0]] if isinstance(axes[0], int) else list(axes[0])
+        axes_B = [axes[1]] if isinstance(axes[1], int) else list(axes[1])
+    axes_A = [i % A.ndim for i in axes_A]
+    axes_B = [i % B.ndim for i in axes_B]
+    if len(axes_A) != len(axes_B):
+        raise ValueError("Mismatched number of contracted legs in tensordot")
+    for i, j in zip(axes_A, axes_B):
+        legA, legB = A.legs[i], B.legs[j]
+        if legA.flow != -legB.flow or not legA.same_charges(legB):
+            raise ValueError(f"Cannot contract legs {legA} and {legB}")
+    free_A = [i for i in range(A.ndim) if i not in axes_A]
+    free_B = [i for i in range(B.ndim) if i not in axes_B]
+    #
+    # Group the blocks of B by the charges of the contracted legs, so that
+    # each block of A is multiplied only by the compatible blocks of B
+    #
+    B_blocks: dict[BlockKey, list[tuple[BlockKey, NDArray]]] = {}
+    for key, block in B.blocks.items():
+        B_blocks.setdefault(tuple(key[j] for j in axes_B), []).append(
+            (tuple(key[j] for j in free_B), block)
+        )
+    blocks: dict[BlockKey, NDArray] = {}
+    for keyA, blockA in A.blocks.items():
+        matches = B_blocks.get(tuple(keyA[i] for i in axes_A))
+        if not matches:
+            continue
+        free_keyA = tuple(keyA[i] for i in free_A)
+        for free_keyB, blockB in matches:
+            key = free_keyA + free_keyB
+            C = np.tensordot(blockA, blockB, (axes_A, axes_B))
+            old = blocks.get(key)
+            blocks[key] = C if old is None else old + C
+    return BlockSparseTensor(
+        [A.legs[i] for i in free_A] + [B.legs[j] for j in free_B],
+        blocks,
+        A.symmetry,
+        np.result_type(A.dtype, B.dtype),
+    )
+
+
+def _vdot(A: BlockSparseTensor, B: BlockSparseTensor) -> complex | float:
+    return sum(
+        (
+            np.vdot(block, B.blocks[key])
+            for key, block in A.blocks.items()
+            if key in B.blocks
+        ),
+        0.0,
+    )
+
+
+def _norm(A: BlockSparseTensor, *args, **kwargs) -> float:
+    if args or kwargs:
+        raise NotImplementedError("Only Frobenius norm of BlockSparseTensor")
+    return A.norm()
+
+
+def _transpose(A: BlockSparseTensor, axes: Sequence[int] | None = None):
+    return A.transpose() if axes is None else A.transpose(*axes)
+
+
+_ARRAY_FUNCTIONS = {
+    np.tensordot: tensordot,
+    np.vdot: _vdot,
+    np.linalg.norm: _norm,
+    np.transpose: _transpose,
+}
+
+
+def _split(
+    A: BlockSparseTensor, n: int, strategy: Strategy, left_isometry: bool
+) -> tuple[BlockSparseTensor, BlockSparseTensor, float]:
+    """Split `A` into `U` and `V`, with `U` taking the first `n` legs of `A`,
+    by a block-wise singular value decomposition. The singular values of all
+    charge sectors are truncated together with `strategy`, and are multiplied
+    onto `V` when `left_isometry` is true and onto `U` otherwise."""
+    symmetry = A.symmetry
+    row_legs, col_legs = A.legs[:n], A.legs[n:]
+    #
+    # Group the blocks into matrices, one for each charge 'Q' of the new
+    # leg, recording the offsets of the row and column blocks.
+    #
+    rows: dict[int, dict[BlockKey, int]] = {}
+    cols: dict[int, dict[BlockKey, int]] = {}
+    row_size: dict[int, int] = {}
+    col_size: dict[int, int] = {}
+    for key in A.blocks:
+        Q = symmetry.fuse(sum(leg.flow * q for leg, q in zip(row_legs, key[:n])))
+        r, c = key[:n], key[n:]
+        sector_rows = rows.setdefault(Q, {})
+        if r not in sector_rows:
+            sector_rows[r] = row_size.get(Q, 0)
+            row_size[Q] = sector_rows[r] + int(np.prod(A._block_shape(row_legs, r)))
+        sector_cols = cols.setdefault(Q, {})
+        if c not in sector_cols:
+            sector_cols[c] = col_size.get(Q, 0)
+            col_size[Q] = sector_cols[c] + int(np.prod(A._block_shape(col_legs, c)))
+    dtype = A.dtype
+    svds = {Q: np.zeros((row_size[Q], col_size[Q]), dtype=dtype) for Q in sorted(rows)}
+    for key, block in A.blocks.items():
+        Q = symmetry.fuse(sum(leg.flow * q for leg, q in zip(row_legs, key[:n])))
+        i, j = rows[Q][key[:n]], cols[Q][key[n:]]
+        block = block.reshape(int(np.prod(block.shape[:n])), -1)
+        svds[Q][i : i + block.shape[0], j : j + block.shape[1]] = block
+    for Q, M in svds.items():
+        svds[Q] = _destructive_svd(M)
+    #
+    # Truncate all singular values together, as if they came from a dense SVD
+    #
+    charges = np.concatenate(
+        [np.full(s.size, Q, dtype=np.int64) for Q, (_, s, _) in svds.items()]
+    )
+    s_all = np.concatenate([s for _, s, _ in svds.values()])
+    order = np.argsort(-s_all, kind="stable")
+    s_sorted = s_all[order]
+    err = destructively_truncate_vector(s_sorted, strategy)
+    kept = charges[order[: s_sorted.size]]
+    scale = 1.0
+    if strategy.get_normalize_flag():
+        scale = 1.0 / np.linalg.norm(s_sorted)
+    new_charges = []
+    U_blocks: dict[BlockKey, NDArray] = {}
+    V_blocks: dict[BlockKey, NDArray] = {}
+    for Q, (U, s, V) in svds.items():
+        D = int(np.count_nonzero(kept == Q))
+        if D == 0:
+            continue
+        new_charges += [Q] * D
+        U, s, V = U[:, :D], scale * s[:D], V[:D, :]
+        if left_isometry:
+            V = s.reshape(D, 1) * V
+        else:
+            U = U * s
+        for r, i in rows[Q].items():
+            shape = A._block_shape(row_legs, r)
+            m = int(np.prod(shape))
+            U_blocks[r + (Q,)] = U[i : i + m, :].reshape(shape + (D,))
+        for c, j in cols[Q].items():
+            shape = A._block_shape(col_legs, c)
+            m = int(np.prod(shape))
+            V_blocks[(Q,) + c] = V[:, j : j + m].reshape((D,) + shape)
+    new_leg = Leg(new_charges, -1, symmetry)
+    return (
+        BlockSparseTensor(row_legs + (new_leg,), U_blocks, symmetry, dtype),
+        BlockSparseTensor((new_leg.dual(),) + col_legs, V_blocks, symmetry, dtype),
+        float(np.sqrt(err)),
+    )
+
+
+__all__ = [
+    "U1",
+    "Z2",
+    "BlockSparseTensor",
+    "Leg",
+    "Symmetry",
+    "tensordot",
+]
@@ -1,6 +1,7 @@
 from . import (
     test_tools,
     test_contractions,
+    test_threads,
     test_strategy,
     test_hdf5,
     test_linear_form,
@@ -11,11 +12,13 @@ from . import (
     test_evolution,
     test_operators,
     test_analysis,
+    test_symmetry,
 )
 
 __all__ = [
     "test_tools",
     "test_contractions",
+    "test_threads",
     "test_strategy",
     "test_hdf5",
     "test_linear_form",
@@ -28,4 +31,5 @@ __all__ = [
     "test_evolution",
     "test_operators",
     "test_analysis",
+    "test_symmetry",
 ]
@@ -1,6 +1,8 @@
+import asyncio
 import numpy as np
 from abc import abstractmethod
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from numpy.typing import NDArray
 from seemps.state import MPS
 from seemps.typing import Matrix
@@ -18,8 +20,11 @@ from seemps.analysis.cross import (
     cross_dmrg,
     cross_greedy,
     CrossStrategyGreedy,
+    CrossStrategyDMRG,
+    CrossStrategyMaxvol,
+    cross_interpolation,
 )
-from seemps.analysis.cross.cross import maxvol_square, CrossResults
+from seemps.analysis.cross.cross import maxvol_square, CrossResults, CrossInterpolation
 from seemps.analysis.cross.cross_maxvol import maxvol_rectangular
 from seemps.operators import mps_as_mpo
 from .tools_analysis import reorder_tensor
@@ -138,6 +143,25 @@ class CrossTests(SeeMPSTestCase):
         cross_results: CrossResults = self.cross_method(black_box)
         self.assertSimilar(func([y_0, y_0, y_0]), cross_results.mps.to_vector())
 
+    def test_load_2d_mps_with_cache(self, n=5):
+        func, mesh, _, y = gaussian_setup_mps(2, n=n)
+        map_matrix = mps_to_mesh_matrix([n, n])
+        physical_dimensions = [2] * (2 * n)
+        black_box = BlackBoxLoadMPS(func, mesh, map_matrix, physical_dimensions)
+        cached_box = BlackBoxLoadMPS(func, mesh, map_matrix, physical_dimensions)
+        cached_box.enable_cache()
+        cross_results: CrossResults = self.cross_method(black_box)
+        cached_results: CrossResults = self.cross_method(cached_box)
+        self.assertSimilar(y, cached_results.mps.to_vector())
+        self.assertSimilar(
+            cross_results.mps.to_vector(), cached_results.mps.to_vector()
+        )
+        self.assertEqual(cached_box.evals, cached_box.cache_misses)
+        self.assertEqual(
+            cached_box.cache_hits + cached_box.cache_misses, black_box.evals
+        )
+        self.assertTrue(cached_box.evals < black_box.evals)
+
 
 class TestCrossMaxvol(CrossTests):
     def cross_method(self, function, *args, **kwdargs):
@@ -155,6 +179,146 @@ class TestCrossGreedy(CrossTests):
         return cross_greedy(function, *args, **kwdargs)
 
 
+class TestBlackBoxCache(SeeMPSTestCase):
+    def make_black_box(self, n=4):
+        func, mesh, _, _ = gaussian_setup_mps(1, n=n)
+        return BlackBoxLoadMPS(func, mesh, mps_to_mesh_matrix([n]), [2] * n)
+
+    def test_cache_is_disabled_by_default(self):
+        black_box = self.make_black_box()
+        indices = np.array([[0, 1, 0, 1], [0, 1, 0, 1]])
+        black_box[indices]
+        black_box[indices]
+        self.assertEqual(black_box.evals, 4)
+        self.assertEqual(black_box.cache_hits, 0)
+        self.assertEqual(black_box.cache_misses, 0)
+
+    def test_cache_returns_same_values(self):
+        black_box = self.make_black_box()
+        reference = self.make_black_box()
+        black_box.enable_cache()
+        indices = self.rng.integers(0, 2, size=(20, 4))
+        self.assertSimilar(black_box[indices], reference[indices])
+        self.assertEqual(black_box.cache_misses, len(np.unique(indices, axis=0)))
+        self.assertEqual(black_box.cache_hits, 20 - black_box.cache_misses)
+        self.assertSimilar(black_box[indices[::-1]], reference[indices[::-1]])
+        self.assertEqual(black_box.cache_hits, 40 - black_box.cache_misses)
+        self.assertEqual(black_box.evals, black_box.cache_misses)
+
+    def test_cache_evicts_least_recently_used(self):
+        black_box = self.make_black_box()
+        black_box.enable_cache(cache_size=2)
+        a, b, c = (
+            np.array([[0, 0, 0, 0]]),
+            np.array([[0, 0, 0, 1]]),
+            np.array([[1, 1, 1, 1]]),
+        )
+        black_box[a]
+        black_box[b]
+        black_box[a]
+        black_box[c]  # Evicts b, the least recently used point
+        self.assertEqual(black_box.cache_misses, 3)
+        black_box[a]
+        self.assertEqual(black_box.cache_misses, 3)
+        black_box[b]
+        self.assertEqual(black_box.cache_misses, 4)
+
+    def test_cache_larger_batch_than_cache_size(self):
+        black_box = self.make_black_box()
+        reference = self.make_black_box()
+        black_box.enable_cache(cache_size=3)
+        indices = self.rng.integers(0, 2, size=(30, 4))
+        self.assertSimilar(black_box[indices], reference[indices])
+
+    def test_disable_cache(self):
+        black_box = self.make_black_box().enable_cache()
+        black_box.enable_cache(cache_size=0)
+        indices = np.array([[0, 1, 0, 1], [0, 1, 0, 1]])
+        black_box[indices]
+        self.assertEqual(black_box.evals, 2)
+        with self.assertRaises(ValueError):
+            black_box.enable_cache(cache_size=-1)
+
+
+def _gaussian_1d(tensor):
+    return np.exp(-(tensor[0] ** 2))
+
+
+async def _async_gaussian_1d(tensor):
+    return _gaussian_1d(tensor)
+
+
+class TestBlackBoxParallel(SeeMPSTestCase):
+    def make_black_box(self, func=_gaussian_1d, n=6):
+        mesh = Mesh([RegularInterval(-1, 1, 2**n)])
+        return BlackBoxLoadMPS(func, mesh, mps_to_mesh_matrix([n]), [2] * n)
+
+    def test_parallel_evaluation_preserves_order(self):
+        indices = self.rng.integers(0, 2, size=(101, 6))
+        expected = self.make_black_box()[indices]
+        for executor in ["thread", "process", ThreadPoolExecutor(2)]:
+            black_box = self.make_black_box()
+            with black_box.parallel_evaluation(executor, max_workers=3):
+                self.assertSimilar(black_box[indices], expected)
+            self.assertEqual(black_box.evals, 101)
+            self.assertSimilar(black_box[indices], expected)
+
+    def test_parallel_evaluation_with_chunk_size(self):
+        indices = self.rng.integers(0, 2, size=(50, 6))
+        black_box = self.make_black_box()
+        expected = black_box[indices]
+        with black_box.parallel_evaluation("thread", chunk_size=7):
+            self.assertSimilar(black_box[indices], expected)
+            self.assertEqual(len(black_box[indices[:0]]), 0)
+
+    def test_asyncio_evaluation(self):
+        indices = self.rng.integers(0, 2, size=(40, 6))
+        expected = self.make_black_box()[indices]
+        black_box = self.make_black_box(_async_gaussian_1d)
+        with black_box.parallel_evaluation("asyncio", max_workers=4):
+            self.assertSimilar(black_box[indices], expected)
+        self.assertEqual(black_box.evals, 40)
+
+    def test_asyncio_evaluation_inside_running_event_loop(self):
+        indices = self.rng.integers(0, 2, size=(40, 6))
+        expected = self.make_black_box()[indices]
+        black_box = self.make_black_box(_async_gaussian_1d)
+
+        async def main():
+            with black_box.parallel_evaluation("asyncio", max_workers=4):
+                return black_box[indices]
+
+        self.assertSimilar(asyncio.run(main()), expected)
+        self.assertEqual(black_box.evals, 40)
+
+    def test_parallel_evaluation_with_cache(self):
+        indices = self.rng.integers(0, 2, size=(40, 6))
+        expected = self.make_black_box()[indices]
+        black_box = self.make_black_box().enable_cache()
+        with black_box.parallel_evaluation("process", max_workers=2):
+            self.assertSimilar(black_box[indices], expected)
+            self.assertSimilar(black_box[indices], expected)
+        self.assertEqual(black_box.evals, black_box.cache_misses)
+
+    def test_unknown_executor(self):
+        with self.assertRaises(Exception):
+            with self.make_black_box().parallel_evaluation("mpi"):
+                pass
+
+    def test_cross_strategy_executor(self):
+        n = 6
+        mesh = Mesh([RegularInterval(-1, 1, 2**n)])
+        y = _gaussian_1d(mesh.to_tensor().T).reshape(-1)
+        for strategy in [
+            CrossStrategyDMRG(executor="thread", max_workers=2),
+            CrossStrategyMaxvol(executor="thread", chunk_size=8),
+        ]:
+            black_box = self.make_black_box(n=n)
+            results = cross_interpolation(strategy, black_box)
+            self.assertSimilar(y, results.mps.to_vector())
+            self.assertIsNone(black_box._executor)
+
+
 class TestSkeleton(SeeMPSTestCase):
     def random_matrix(self, m=1000, n=1000, r=5):
         """Computes a m x n random matrix of rank r"""
@@ -184,3 +348,41 @@ class TestSkeleton(SeeMPSTestCase):
         I, _ = maxvol_square(A[:, J])
         A_new = A[:, J] @ np.linalg.inv(A[I, :][:, J]) @ A[I, :]
         self.assertSimilar(A, A_new)
+
+    def test_maxvol_square_warm_start(self):
+        A = self.random_matrix(m=200, n=8, r=8)
+        I, B = maxvol_square(A)
+        for initial in [I, I[::-1], self.rng.choice(200, 8, replace=False)]:
+            J, G = maxvol_square(A, max_iter=100, initial=initial)
+            self.assertSimilar(A, G @ A[J, :])
+            self.assertTrue(np.max(np.abs(G)) <= 1.05 + 1e-10)
+
+    def test_maxvol_square_singular_warm_start(self):
+        A = self.random_matrix(m=200, n=8, r=8)
+        A[:4, :] = A[0, :]
+        I, B = maxvol_square(A)
+        J, G = maxvol_square(A, initial=np.arange(8))
+        self.assertSimilar(I, J)
+        self.assertSimilar(B, G)
+
+    def test_locate_pivots(self):
+        candidates = CrossInterpolation.combine_indices(
+            np.array([[0, 1], [1, 1]]), np.arange(3).reshape(-1, 1)
+        )
+        pivots = np.array([[1, 1, 2], [0, 1, 0], [1, 1, 1]])
+        self.assertSimilar(
+            CrossInterpolation.locate_pivots(pivots, candidates, 2), [5, 0]
+        )
+        self.assertIsNone(CrossInterpolation.locate_pivots(pivots, candidates, 4))
+        pivots[1, 0] = 2
+        self.assertIsNone(CrossInterpolation.locate_pivots(pivots, candidates, 2))
+
+    def test_cross_without_reusing_pivots(self):
+        func, mesh, _, y = gaussian_setup_mps(2, n=5)
+        black_box = BlackBoxLoadMPS(func, mesh, mps_to_mesh_matrix([5, 5]), [2] * 10)
+        for strategy in [
+            CrossStrategyDMRG(reuse_pivots=False),
+            CrossStrategyMaxvol(reuse_pivots=False),
+        ]:
+            results = cross_interpolation(strategy, black_box)
+            self.assertSimilar(y, results.mps.to_vector())
@@ -0,0 +1,70 @@
+import numpy as np
+from seemps.state import random_uniform_mps
+from seemps.analysis.evaluation import (
+    evaluate_mps,
+    evaluate_mps_prefixes,
+    evaluate_mps_stream,
+    evaluate_mesh_stream,
+    iterate_mesh_indices,
+    random_mps_indices,
+)
+from seemps.analysis.mesh import Mesh, RegularInterval, mps_to_mesh_matrix
+from ..tools import SeeMPSTestCase
+
+
+class TestPrefixEvaluation(SeeMPSTestCase):
+    def test_prefixes_match_evaluate_mps(self):
+        for complex in [False, True]:
+            mps = random_uniform_mps(3, 6, D=5, complex=complex, rng=self.rng)
+            indices = random_mps_indices([3] * 6, 500, rng=self.rng)
+            self.assertSimilar(
+                evaluate_mps_prefixes(mps, indices), evaluate_mps(mps, indices)
+            )
+
+    def test_prefixes_with_repeated_rows_and_chunks(self):
+        mps = random_uniform_mps(2, 8, D=4, rng=self.rng)
+        indices = random_mps_indices([2] * 8, 50, rng=self.rng)
+        indices = np.vstack([indices, indices[::-1], indices[:7]])
+        expected = evaluate_mps(mps, indices)
+        for chunk_size in [None, 1, 7, 1000]:
+            self.assertSimilar(
+                evaluate_mps_prefixes(mps, indices, chunk_size=chunk_size), expected
+            )
+
+    def test_prefixes_single_row(self):
+        mps = random_uniform_mps(2, 5, D=3, rng=self.rng)
+        indices = np.array([1, 0, 1, 1, 0])
+        self.assertSimilar(
+            evaluate_mps_prefixes(mps, indices), evaluate_mps(mps, indices)
+        )
+
+    def test_stream_accepts_arrays_and_iterables(self):
+        mps = random_uniform_mps(2, 6, D=4, rng=self.rng)
+        indices = random_mps_indices([2] * 6, 30, rng=self.rng)
+        expected = evaluate_mps(mps, indices)
+        chunks = list(evaluate_mps_stream(mps, indices, chunk_size=8))
+        self.assertEqual([len(c) for c in chunks], [8, 8, 8, 6])
+        self.assertSimilar(np.concatenate(chunks), expected)
+        chunks = evaluate_mps_stream(mps, (indices[i : i + 5] for i in range(0, 30, 5)))
+        self.assertSimilar(np.concatenate(list(chunks)), expected)
+
+
+class TestMeshStream(SeeMPSTestCase):
+    def test_iterate_mesh_indices_covers_mesh_in_order(self):
+        mesh = Mesh([RegularInterval(0, 1, 4), RegularInterval(0, 1, 3)])
+        indices = np.vstack(list(iterate_mesh_indices(mesh, chunk_size=5)))
+        self.assertEqual(indices.shape, (12, 2))
+        self.assertSimilar(
+            mesh[indices].reshape(4, 3, 2), mesh.to_tensor(channels_first=False)
+        )
+
+    def test_evaluate_mesh_stream_matches_tensor(self):
+        mps = random_uniform_mps(2, 5, D=4, rng=self.rng)
+        mesh = Mesh([RegularInterval(0, 1, 4), RegularInterval(0, 1, 8)])
+        map_matrix = mps_to_mesh_matrix([2, 3])
+        values = np.zeros(mesh.dimensions)
+        for mesh_indices, chunk in evaluate_mesh_stream(
+            mps, mesh, map_matrix, chunk_size=6
+        ):
+            values[tuple(mesh_indices.T)] = chunk
+        self.assertSimilar(values.reshape(-1), mps.to_vector())
@@ -173,6 +173,26 @@ class TestChebyshevMPS(SeeMPSTestCase):
         self.assertSimilar(f(x), mps_cheb_clen)
         self.assertSimilar(f(x), mps_cheb_poly)
 
+    def test_gaussian_1d_paterson_stockmeyer(self):
+        f = lambda x: np.exp(-(x**2))  # noqa: E731
+        a, b, n = -1, 2, 5
+        interval = RegularInterval(a, b, 2**n)
+        x = interval.to_vector()
+
+        for order in (1, 2, 3, 30, 101):
+            expansion = ChebyshevExpansion.interpolate(f, (a, b), order)
+            mps_cheb_clen = expansion.to_mps(argument=interval, method="clenshaw")
+            mps_cheb_ps = expansion.to_mps(
+                argument=interval, method="paterson-stockmeyer"
+            )
+            self.assertSimilar(mps_cheb_clen, mps_cheb_ps)
+        self.assertSimilar(f(x), mps_cheb_ps)
+
+    def test_expansion_rejects_unknown_method(self):
+        expansion = ChebyshevExpansion.interpolate(np.exp, (-1, 1), 10)
+        with self.assertRaises(Exception):
+            expansion.to_mps(RegularInterval(-1, 1, 4), method="horner")  # type: ignore
+
     def test_gaussian_1d_inside_approximation_domain(self):
         # Test that any argument defined *within* the approximation domain is well approximated.
         f = lambda x: np.exp(-(x**2))  # noqa: E731
@@ -262,12 +282,15 @@ class TestChebyshevMPO(SeeMPSTestCase):
         expansion = ChebyshevExpansion.interpolate(f, (a, b), order=30)
         mpo_leg_clen = expansion.to_mpo(mpo_x, clenshaw=True)
         mpo_leg_poly = expansion.to_mpo(mpo_x, clenshaw=False)
+        mpo_leg_ps = expansion.to_mpo(mpo_x, method="paterson-stockmeyer")
 
         I = MPS([np.ones((1, 2, 1))] * n)
         y_clen = mpo_leg_clen.apply(I)
         y_poly = mpo_leg_poly.apply(I)
+        y_ps = mpo_leg_ps.apply(I)
         self.assertSimilar(f(x), y_clen)
         self.assertSimilar(f(x), y_poly)
+        self.assertSimilar(f(x), y_ps)
 
 
 # TODO: Refactor tests and combine by PolynomialExpansion
@@ -286,6 +309,8 @@ class TestLegendreMPS(SeeMPSTestCase):
 
         self.assertSimilar(f(x), mps_leg_clen)
         self.assertSimilar(f(x), mps_leg_poly)
+        mps_leg_ps = expansion.to_mps(argument=interval, method="paterson-stockmeyer")
+        self.assertSimilar(f(x), mps_leg_ps)
 
     def test_gaussian_2d(self):
         f = lambda z: np.exp(-(z**2))  # noqa: E731
@@ -327,12 +352,15 @@ class TestLegendreMPO(SeeMPSTestCase):
         expansion = LegendreExpansion.project(f, order=30, approximation_domain=(a, b))
         mpo_leg_clen = expansion.to_mpo(mpo_x, clenshaw=True)
         mpo_leg_poly = expansion.to_mpo(mpo_x, clenshaw=False)
+        mpo_leg_ps = expansion.to_mpo(mpo_x, method="paterson-stockmeyer")
 
         I = MPS([np.ones((1, 2, 1))] * n)
         y_clen = mpo_leg_clen.apply(I)
         y_poly = mpo_leg_poly.apply(I)
+        y_ps = mpo_leg_ps.apply(I)
         self.assertSimilar(f(x), y_clen)
         self.assertSimilar(f(x), y_poly)
+        self.assertSimilar(f(x), y_ps)
 
 
 class TestPowerExpansion(SeeMPSTestCase):
@@ -351,6 +379,8 @@ class TestPowerExpansion(SeeMPSTestCase):
         self.assertSimilar(y, mps_clen, atol=1e-6)
         mps_poly = expansion.to_mps(argument=interval, clenshaw=False)
         self.assertSimilar(y, mps_poly, atol=1e-6)
+        mps_ps = expansion.to_mps(argument=interval, method="paterson-stockmeyer")
+        self.assertSimilar(y, mps_ps, atol=1e-6)
 
     def test_mpo_expansion(self):
         a, b, n = -1, 1, 10
@@ -373,3 +403,5 @@ class TestPowerExpansion(SeeMPSTestCase):
         self.assertSimilar(mpo_clen, mpo_y, atol=1e-6)
         mpo_poly = expansion.to_mpo(mpo_x, clenshaw=False)
         self.assertSimilar(mpo_poly, mpo_y, atol=1e-6)
+        mpo_ps = expansion.to_mpo(mpo_x, method="paterson-stockmeyer")
+        self.assertSimilar(mpo_ps, mpo_y, atol=1e-6)
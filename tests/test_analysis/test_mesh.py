@@ -5,8 +5,12 @@ from seemps.analysis.mesh import (
     QuantizedInterval,
     RegularInterval,
     ChebyshevInterval,
+    IntegerInterval,
+    ArrayInterval,
+    MeshIndexMapper,
     mps_to_mesh_matrix,
     interleaving_permutation,
+    mesh_to_mps_indices,
 )
 from ..tools import SeeMPSTestCase
 
@@ -236,3 +240,71 @@ class TestMesh(SeeMPSTestCase):
 
         T = mps_to_mesh_matrix([2, 2], interleaving_permutation([2, 2]))
         self.assertSimilar(T, [[2.0, 0.0], [0.0, 2.0], [1.0, 0.0], [0.0, 1.0]])
+
+
+class TestMeshIndexMapper(SeeMPSTestCase):
+    def random_mps_indices(self, sites_per_dimension, base=2, size=100):
+        return self.rng.integers(0, base, size=(size, sum(sites_per_dimension)))
+
+    def test_mapper_matches_map_matrix(self):
+        for sites in ([3], [2, 3], [3, 3, 2]):
+            for permutation in (None, interleaving_permutation(sites)):
+                T = mps_to_mesh_matrix(sites, permutation)
+                mapper = MeshIndexMapper(T)
+                mps_indices = self.random_mps_indices(sites)
+                mesh_indices = mapper.to_mesh_indices(mps_indices)
+                self.assertTrue(np.array_equal(mesh_indices, mps_indices @ T))
+                self.assertTrue(
+                    np.array_equal(mapper.to_mps_indices(mesh_indices), mps_indices)
+                )
+
+    def test_mesh_to_mps_indices_with_other_bases(self):
+        sites = [2, 3]
+        T = mps_to_mesh_matrix(sites, interleaving_permutation(sites), base=3)
+        mps_indices = self.random_mps_indices(sites, base=3)
+        mesh_indices = mps_indices @ T
+        self.assertTrue(
+            np.array_equal(mesh_to_mps_indices(mesh_indices, T), mps_indices)
+        )
+
+    def test_mapper_accepts_any_site_order(self):
+        sites = [3, 2]
+        permutation = self.rng.permutation(sum(sites))
+        T = mps_to_mesh_matrix(sites, permutation)
+        mps_indices = self.random_mps_indices(sites)
+        self.assertTrue(
+            np.array_equal(mesh_to_mps_indices(mps_indices @ T, T), mps_indices)
+        )
+
+    def test_mapper_coordinates_match_mesh(self):
+        mesh = Mesh(
+            [
+                RegularInterval(-1, 1, 8, endpoint_left=False),
+                ChebyshevInterval(-2, 3, 8),
+                ChebyshevInterval(0, 1, 8, endpoints=True),
+                IntegerInterval(3, 19, 2),
+                ArrayInterval(np.linspace(0, 1, 8) ** 2),
+            ]
+        )
+        sites = [3] * mesh.dimension
+        T = mps_to_mesh_matrix(sites, interleaving_permutation(sites))
+        mps_indices = self.random_mps_indices(sites)
+        expected = mesh[mps_indices @ T]
+        for max_table_size in (0, 8):
+            mapper = MeshIndexMapper(T, mesh, max_table_size=max_table_size)
+            self.assertSimilar(mapper.coordinates(mps_indices), expected)
+
+    def test_mapper_without_map_matrix(self):
+        mesh = Mesh([RegularInterval(0, 1, 4), ChebyshevInterval(0, 1, 3)])
+        mapper = MeshIndexMapper(None, mesh)
+        indices = np.array([[0, 0], [3, 2], [1, 1]])
+        self.assertSimilar(mapper.coordinates(indices), mesh[indices])
+        self.assertIs(mapper.to_mps_indices(indices), indices)
+
+    def test_mapper_rejects_invalid_matrices(self):
+        with self.assertRaises(ValueError):
+            MeshIndexMapper(np.array([[0.5], [1.0]]))
+        with self.assertRaises(ValueError):
+            MeshIndexMapper(
+                mps_to_mesh_matrix([2, 2]), Mesh([RegularInterval(0, 1, 4)])
+            )
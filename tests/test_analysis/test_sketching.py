@@ -4,7 +4,15 @@ from ..tools import SeeMPSTestCase
 
 from seemps.state import DEFAULT_STRATEGY
 from seemps.analysis.mesh import RegularInterval, Mesh, mps_to_mesh_matrix
-from seemps.analysis.sketching import tt_rss, BlackBoxLoadMPS
+from seemps.analysis.sketching import (
+    tt_rss,
+    BlackBoxLoadMPS,
+    SketchedCross,
+    _unique_rows,
+    _make_sketch,
+    _SRHTSketch,
+    _parity,
+)
 
 
 class TestTTRSS(SeeMPSTestCase):
@@ -89,3 +97,99 @@ class TestTTRSS(SeeMPSTestCase):
         mps = tt_rss(black_box, samples, max_bonds, strategy=DEFAULT_STRATEGY)
         z_mps = mps.to_vector()
         self.assertTrue(np.allclose(z_vec, z_mps, atol=1e-6))
+
+
+def _gaussian_2d(tensor):
+    return np.exp(-0.5 * (tensor[0] ** 2 + tensor[1] ** 2))
+
+
+class TestTTRSSStreaming(SeeMPSTestCase):
+    def setup_gaussian_2d(self, n=6, num_samples=100):
+        interval = RegularInterval(-1.0, 1.0, 2**n)
+        mesh = Mesh([interval, interval])
+        black_box = BlackBoxLoadMPS(
+            _gaussian_2d, mesh, mps_to_mesh_matrix([n, n]), [2] * (2 * n)
+        )
+        samples = self.rng.normal(size=(num_samples, 2))
+        x = interval.to_vector()
+        X, Y = np.meshgrid(x, x, indexing="ij")
+        z_vec = np.exp(-0.5 * (X**2 + Y**2)).reshape(-1)
+        return black_box, samples, z_vec
+
+    def test_chunked_sketch_matches_full_fiber(self):
+        black_box, samples, _ = self.setup_gaussian_2d()
+        cross = SketchedCross(black_box, samples)
+        for k in [0, 3, 6, 11]:
+            f_k = cross.sample_fiber(k)
+            Ω = self.rng.normal(size=(f_k.shape[2], 3))
+            expected = np.einsum("lsr,rc->lsc", f_k, Ω)
+            for chunk_size in [1, 7, 50, 10**6]:
+                self.assertSimilar(cross.sketch_fiber(k, Ω, chunk_size), expected)
+
+    def test_recursive_sets_locate_prefixes(self):
+        black_box, samples, _ = self.setup_gaussian_2d()
+        cross = SketchedCross(black_box, samples)
+        for k, (β_k, x_k) in enumerate(cross.recursive_sets):
+            S_kp1 = cross.I_l[k + 1]
+            self.assertSimilar(
+                np.hstack([cross.I_l[k][β_k], x_k.reshape(-1, 1)]), S_kp1
+            )
+
+    def test_tt_rss_chunked_and_parallel(self):
+        black_box, samples, z_vec = self.setup_gaussian_2d()
+        max_bonds = np.array([10] * 12)
+        mps = tt_rss(black_box, samples, max_bonds)
+        serial_evals = black_box.evals
+        for options in [
+            dict(chunk_size=64),
+            dict(executor="process", max_workers=2),
+            dict(executor="thread", max_workers=2, chunk_size=100),
+        ]:
+            black_box.evals = 0
+            mps = tt_rss(black_box, samples, max_bonds, **options)
+            self.assertTrue(np.allclose(z_vec, mps.to_vector(), atol=1e-7))
+            self.assertEqual(black_box.evals, serial_evals)
+
+    def test_unique_rows_matches_numpy(self):
+        for dims in [[2] * 6, [3, 5, 2, 7], [2**40, 2**30]]:
+            rows = np.stack(
+                [self.rng.integers(0, min(d, 3), size=200) for d in dims], axis=1
+            )
+            unique, inverse = _unique_rows(rows, dims)
+            expected, expected_inverse = np.unique(rows, axis=0, return_inverse=True)
+            self.assertSimilar(unique, expected)
+            self.assertSimilar(inverse, expected_inverse.reshape(-1))
+
+    def test_structured_sketches_match_their_matrices(self):
+        multi_indices = self.rng.integers(0, 2, size=(37, 4))
+        f = self.rng.normal(size=(5, 37))
+        for kind in ["gaussian", "srht", "countsketch", "sparse-sign", "khatri-rao"]:
+            sketch = _make_sketch(kind, multi_indices, [2] * 4, 6, self.rng)
+            Ω = sketch.block(0, 37)
+            self.assertEqual(Ω.shape, (37, 6))
+            self.assertSimilar(sketch.apply(f), f @ Ω)
+            self.assertSimilar(sketch.apply(f[:, 10:20], 10), f[:, 10:20] @ Ω[10:20])
+        with self.assertRaises(Exception):
+            _make_sketch("fourier", multi_indices, [2] * 4, 6, self.rng)
+
+    def test_parity_counts_set_bits(self):
+        x = self.rng.integers(0, 2**62, size=100)
+        expected = [bin(int(n)).count("1") % 2 for n in x]
+        self.assertEqual(_parity(x).tolist(), expected)
+
+    def test_srht_sketch_is_scaled_hadamard(self):
+        sketch = _SRHTSketch(8, 8, self.rng)
+        Ω = sketch.block(0, 8)
+        self.assertSimilar(Ω.T @ Ω, np.eye(8))
+        f = self.rng.normal(size=(3, 8))
+        self.assertSimilar(sketch.apply(f), f @ Ω)
+
+    def test_tt_rss_structured_sketches(self):
+        black_box, samples, z_vec = self.setup_gaussian_2d()
+        max_bonds = np.array([10] * 12)
+        for sketch in ["srht", "countsketch", "sparse-sign", "khatri-rao"]:
+            for chunk_size in [None, 100]:
+                mps = tt_rss(
+                    black_box, samples, max_bonds, sketch=sketch, chunk_size=chunk_size
+                )
+                self.assertTrue(np.allclose(z_vec, mps.to_vector(), atol=1e-7))
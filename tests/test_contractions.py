@@ -44,3 +44,92 @@ class TestDMRGHamiltonianContraction(SeeMPSTestCase):
         dmrg_contractor = DMRGMatrixOperator(L, H12, R)  # type: ignore
         fast_contraction = dmrg_contractor(v.reshape(-1))
         self.assertSimilar(exact_contraction, fast_contraction)
+
+    def test_two_site_operator_in_both_orders(self):
+        from seemps.optimization.dmrg import TwoSiteDMRGOperator
+
+        for a, f in [(3, 17), (17, 3)]:
+            L = self.rng.normal(size=(a, 5, a)) + 1j * self.rng.normal(size=(a, 5, a))
+            R = self.rng.normal(size=(f, 6, f))
+            H1 = self.rng.normal(size=(5, 3, 3, 4))
+            H2 = self.rng.normal(size=(4, 2, 2, 6)) + 1j * self.rng.normal(
+                size=(4, 2, 2, 6)
+            )
+            v = self.rng.normal(size=(a, 3, 2, f))
+            op = TwoSiteDMRGOperator(L, H1, H2, R)  # type: ignore
+            exact_contraction = np.einsum(
+                "acb,cikg,gjlh,ehf,bklf->aije", L, H1, H2, R, v
+            ).reshape(-1)
+            for from_left in [True, False]:
+                op.from_left = from_left
+                self.assertSimilar(op @ v.reshape(-1), exact_contraction)
+            self.assertSimilar(
+                op.rmatvec(v.reshape(-1)),
+                np.einsum(
+                    "acb,cikg,gjlh,ehf,aije->bklf",
+                    L.conj(),
+                    H1.conj(),
+                    H2.conj(),
+                    R.conj(),
+                    v,
+                ).reshape(-1),
+            )
+            self.assertAlmostEqual(
+                op.trace(), np.einsum("aca,ciig,gjjh,ehe->", L, H1, H2, R)
+            )
+
+
+class TestMPOEnvironments(SeeMPSTestCase):
+    def random_tensor(self, *shape, complex=False):
+        A = self.rng.normal(size=shape)
+        if complex:
+            A = A + 1j * self.rng.normal(size=shape)
+        return A
+
+    def assertEnvironmentsMatch(self, a, b, d, f, complex=False):
+        A = self.random_tensor(a, 3, d, complex=complex)
+        O = self.random_tensor(4, 3, 2, 5, complex=complex)
+        B = self.random_tensor(b, 2, f, complex=complex)
+        rho = self.random_tensor(a, 4, b, complex=complex)
+        left = seemps.cython._update_left_mpo_environment(rho, A, O, B)
+        self.assertTrue(left.flags.c_contiguous)
+        self.assertSimilar(
+            left, np.einsum("acb,ajd,cjie,bif->def", rho, A.conj(), O, B)
+        )
+        rho = self.random_tensor(d, 5, f, complex=complex)
+        right = seemps.cython._update_right_mpo_environment(rho, A, O, B)
+        self.assertTrue(right.flags.c_contiguous)
+        self.assertSimilar(
+            right, np.einsum("def,ajd,cjie,bif->acb", rho, A.conj(), O, B)
+        )
+
+    def test_mpo_environments_with_equal_bond_dimensions(self):
+        self.assertEnvironmentsMatch(10, 10, 12, 12)
+        self.assertEnvironmentsMatch(10, 10, 12, 12, complex=True)
+
+    def test_mpo_environments_with_larger_ket(self):
+        self.assertEnvironmentsMatch(3, 20, 4, 25)
+        self.assertEnvironmentsMatch(3, 20, 4, 25, complex=True)
+
+    def test_mpo_environments_with_larger_bra(self):
+        self.assertEnvironmentsMatch(20, 3, 25, 4)
+        self.assertEnvironmentsMatch(20, 3, 25, 4, complex=True)
+
+    def test_mpo_environments_preserve_single_precision(self):
+        A = self.random_tensor(4, 2, 5).astype(np.float32)
+        O = self.random_tensor(3, 2, 2, 3).astype(np.float32)
+        rho = self.random_tensor(4, 3, 4).astype(np.float32)
+        left = seemps.cython._update_left_mpo_environment(rho, A, O, A)
+        self.assertEqual(left.dtype, np.float32)
+
+    def test_mpo_environments_reject_mismatched_tensors(self):
+        A = self.random_tensor(4, 2, 5)
+        O = self.random_tensor(3, 2, 2, 3)
+        with self.assertRaises(ValueError):
+            seemps.cython._update_left_mpo_environment(
+                self.random_tensor(4, 2, 4), A, O, A
+            )
+        with self.assertRaises(ValueError):
+            seemps.cython._update_right_mpo_environment(
+                self.random_tensor(5, 3, 5), A, O[:, :, :, :, np.newaxis], A
+            )
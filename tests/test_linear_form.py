@@ -2,6 +2,8 @@ import numpy as np
 from .tools import SeeMPSTestCase, almostIdentity
 from seemps.state import CanonicalMPS, MPS
 from seemps.state.simplification import AntilinearForm
+from seemps.state.antilinear import AntilinearFormSum, MPOAntilinearForm
+from seemps.hamiltonians import HeisenbergHamiltonian
 from seemps.expectation import expectation1
 
 
@@ -96,3 +98,52 @@ class TestLinearForm(SeeMPSTestCase):
         O1 = np.array([[0.3, 0.2 + 1.0j], [0.2 - 1.0j, 2.0]])
         O2 = np.array([[0.34, 0.4 - 0.7j], [0.4 + 0.7j, -0.6]])
         self.run_over_random_uniform_mps(lambda ϕ: self.tensor2siteok(ϕ, O1, O2))
+
+
+class TestMPOAntilinearForm(SeeMPSTestCase):
+    def test_mpo_antilinear_form_tensors(self):
+        H = HeisenbergHamiltonian(6).to_mpo()
+        ψ = self.random_uniform_mps(2, 6, D=3)
+        for center in range(ψ.size):
+            ξ = CanonicalMPS(self.random_uniform_mps(2, 6, D=2), center=center)
+            expected = H.expectation(ξ, ψ)
+            LF = MPOAntilinearForm(ξ, H, ψ, center)
+            self.assertAlmostEqual(np.vdot(ξ[center], LF.tensor1site()), expected)
+            if center + 1 < ψ.size:
+                AB = np.einsum("aib,bjc->aijc", ξ[center], ξ[center + 1])
+                self.assertAlmostEqual(np.vdot(AB, LF.tensor2site(+1)), expected)
+
+
+class TestAntilinearFormSum(SeeMPSTestCase):
+    def assertSameForms(self, F: AntilinearFormSum, forms: list, weights: list):
+        self.assertSimilar(
+            F.tensor1site(), sum(w * f.tensor1site() for w, f in zip(weights, forms))
+        )
+        for direction in [+1, -1]:
+            if 0 <= F.center + direction < F.size:
+                self.assertSimilar(
+                    F.tensor2site(direction),
+                    sum(w * f.tensor2site(direction) for w, f in zip(weights, forms)),
+                )
+
+    def test_antilinear_form_sum_matches_separate_forms(self):
+        ξ = self.random_uniform_mps(2, 6, D=3)
+        kets = [self.random_uniform_mps(2, 6, D=D) for D in [2, 20, 5, 30]]
+        kets[1] = kets[1] * 1j
+        weights = [0.5, -1.0, 2j, 1.0]
+        for center in range(ξ.size):
+            F = AntilinearFormSum(ξ, kets, weights, center)
+            forms = [AntilinearForm(ξ, ψ, center) for ψ in kets]
+            self.assertSameForms(F, forms, weights)
+
+    def test_antilinear_form_sum_updates(self):
+        ξ = self.random_uniform_mps(2, 5, D=3)
+        kets = [self.random_uniform_mps(2, 5, D=D) for D in [2, 3, 40]]
+        weights = [1.0, -2.0, 0.5]
+        F = AntilinearFormSum(ξ, kets, weights, center=0)
+        forms = [AntilinearForm(ξ, ψ, center=0) for ψ in kets]
+        for direction in [+1] * 4 + [-1] * 4:
+            F.update(direction)
+            for f in forms:
+                f.update(direction)
+            self.assertSameForms(F, forms, weights)
@@ -2,7 +2,9 @@ import numpy as np
 import seemps
 from seemps.state import CanonicalMPS, scprod, product_state
 from seemps.expectation import (
+    all_connected_expectation2,
     all_expectation1,
+    all_expectation2,
     expectation1,
     expectation2,
     product_expectation,
@@ -206,3 +208,33 @@ class TestExpectation(SeeMPSTestCase):
         σz = np.array([[1, 0], [0, -1]])
         with self.assertRaises(Exception):
             product_expectation(state, [σz] * 4)
+
+    def test_all_expectation2_matches_expectation2(self):
+        state = self.random_uniform_mps(2, 6, D=3, complex=True)
+        O = np.array([[0.3, 1.0 + 0.2j], [0.1j, 0.5]])
+        Q = np.array([[0.34, 0.4 - 0.7j], [-0.2, -0.6]])
+        C = all_expectation2(state, O, Q)
+        self.assertEqual(C.shape, (6, 6))
+        for i in range(6):
+            for j in range(6):
+                self.assertAlmostEqual(C[i, j], expectation2(state, O, Q, i, j))
+
+    def test_all_connected_expectation2(self):
+        state = self.random_uniform_mps(2, 5, D=3, complex=True)
+        state = state * (1 / state.norm())
+        σz = np.array([[1, 0], [0, -1]])
+        σx = np.array([[0, 1], [1, 0]])
+        C = all_connected_expectation2(state, σz, σx)
+        for i in range(5):
+            for j in range(5):
+                self.assertAlmostEqual(
+                    C[i, j],
+                    expectation2(state, σz, σx, i, j)
+                    - expectation1(state, σz, i) * expectation1(state, σx, j),
+                )
+
+    def test_all_connected_expectation2_vanishes_on_product_states(self):
+        state = product_state([1 / np.sqrt(2), 1j / np.sqrt(2)], 4)
+        σy = np.array([[0, -1j], [1j, 0]])
+        C = all_connected_expectation2(state, σy, σy)
+        self.assertSimilar(C, np.zeros((4, 4)))
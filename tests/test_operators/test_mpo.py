@@ -1,6 +1,7 @@
 import numpy as np
 from seemps.tools import σx, σy, σz
 from seemps.state import (
+    CanonicalMPS,
     MPSSum,
     DEFAULT_STRATEGY,
     Simplification,
@@ -71,6 +72,85 @@ class TestMPO(SeeMPSTestCase):
             2 * (mpo.to_matrix() @ mps.to_vector()),
         )
 
+    def random_mpo(self, d: int, size: int, D: int = 3) -> MPO:
+        bonds = [1] + [D] * (size - 1) + [1]
+        shapes = [(a, d, d, b) for a, b in zip(bonds[:-1], bonds[1:])]
+        return MPO(
+            [
+                self.rng.normal(size=shape) + 1j * self.rng.normal(size=shape)
+                for shape in shapes
+            ]
+        )
+
+    def test_mpo_apply_fit_matches_product(self):
+        mpo = self.random_mpo(2, 6)
+        mps = self.random_uniform_mps(2, mpo.size, D=3)
+        self.assertSimilar(
+            mpo.apply(mps, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mpo.to_matrix() @ mps.to_vector(),
+        )
+
+    def test_mpo_apply_fit_works_on_mpssum(self):
+        mpo = self.random_mpo(2, 5)
+        a = self.random_uniform_mps(2, mpo.size, D=2)
+        b = self.random_uniform_mps(2, mpo.size, D=3)
+        self.assertSimilar(
+            mpo.apply(a - 0.5j * b, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mpo.to_matrix() @ (a.to_vector() - 0.5j * b.to_vector()),
+        )
+
+    def test_mpo_apply_fit_uses_guess(self):
+        mpo = self.random_mpo(2, 6)
+        mps = self.random_uniform_mps(2, mpo.size, D=3)
+        exact = mpo.apply(mps, strategy=TEST_STRATEGY)
+        strategy = TEST_STRATEGY.replace(max_sweeps=1)
+        self.assertSimilar(
+            mpo.apply(mps, strategy=strategy, method="fit", guess=exact).to_vector(),
+            exact.to_vector(),
+        )
+
+    def test_mpo_apply_fit_changes_physical_dimensions(self):
+        mpo = MPO([self.rng.normal(size=(1, 3, 2, 1)) for _ in range(4)])
+        mps = self.random_uniform_mps(2, mpo.size, D=2)
+        self.assertSimilar(
+            mpo.apply(mps, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mpo.to_matrix() @ mps.to_vector(),
+        )
+
+    def test_mpo_apply_zipup_matches_product(self):
+        mpo = self.random_mpo(2, 6)
+        mps = self.random_uniform_mps(2, mpo.size, D=3)
+        exact = mpo.to_matrix() @ mps.to_vector()
+        for simplify in [False, True]:
+            with self.subTest(simplify=simplify):
+                output = mpo.apply(
+                    mps, strategy=TEST_STRATEGY, simplify=simplify, method="zipup"
+                )
+                self.assertIsInstance(output, CanonicalMPS)
+                self.assertSimilar(output.to_vector(), exact)
+
+    def test_mpo_apply_zipup_truncates_bonds(self):
+        mpo = self.random_mpo(2, 8)
+        mps = self.random_uniform_mps(2, mpo.size, D=4)
+        strategy = TEST_STRATEGY.replace(max_bond_dimension=5)
+        output = mpo.apply(mps, strategy=strategy, simplify=False, method="zipup")
+        self.assertLessEqual(max(output.bond_dimensions()), 5)
+
+    def test_mpo_apply_zipup_works_on_mpssum(self):
+        mpo = self.random_mpo(2, 5)
+        a = self.random_uniform_mps(2, mpo.size, D=2)
+        b = self.random_uniform_mps(2, mpo.size, D=3)
+        self.assertSimilar(
+            mpo.apply(a + 2 * b, strategy=TEST_STRATEGY, method="zipup").to_vector(),
+            mpo.to_matrix() @ (a.to_vector() + 2 * b.to_vector()),
+        )
+
+    def test_mpo_apply_rejects_unknown_method(self):
+        mpo = MPO([σx.reshape(1, 2, 2, 1)] * 5)
+        mps = self.random_uniform_mps(2, mpo.size, D=2)
+        with self.assertRaises(Exception):
+            mpo.apply(mps, method="unknown")
+
     def test_mpo_apply_rejects_non_mps(self):
         mpo = MPO([σx.reshape(1, 2, 2, 1)] * 5)
         with self.assertRaises(TypeError):
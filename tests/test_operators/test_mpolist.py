@@ -7,6 +7,7 @@ from seemps.state import (
     Strategy,
 )
 from seemps.operators import MPO, MPOList
+from seemps.operators.mpo import MAX_FUSED_BOND_DIMENSION, _fused_groups
 
 from ..tools import SeeMPSTestCase, contain_same_objects
 
@@ -56,6 +57,58 @@ class TestMPOList(SeeMPSTestCase):
             (UV.to_matrix() @ mps.to_vector()),
         )
 
+    def test_mpolist_apply_with_zipup(self):
+        U = MPO([σx.reshape(1, 2, 2, 1)] * 3)
+        V = MPO([σz.reshape(1, 2, 2, 1)] * 3)
+        UV = MPOList([U, V], NO_TRUNCATION)
+        mps = self.random_uniform_mps(2, 3)
+        self.assertSimilar(
+            UV.apply(mps, strategy=TEST_STRATEGY, method="zipup").to_vector(),
+            (UV.to_matrix() @ mps.to_vector()),
+        )
+
+    def random_mpo(self, size: int, D: int = 3) -> MPO:
+        bonds = [1] + [D] * (size - 1) + [1]
+        return MPO(
+            [
+                self.rng.normal(size=(a, 2, 2, b))
+                + 1j * self.rng.normal(size=(a, 2, 2, b))
+                for a, b in zip(bonds[:-1], bonds[1:])
+            ]
+        )
+
+    def test_mpolist_fused_groups_limit_bond_dimension(self):
+        mpos = [self.random_mpo(4, D=3) for _ in range(5)]
+        groups = _fused_groups(mpos)
+        self.assertEqual(len(groups), 2)
+        for tensors in groups:
+            self.assertTrue(
+                max(O.shape[-1] for O in tensors) <= MAX_FUSED_BOND_DIMENSION
+            )
+        self.assertSimilar(
+            MPO(groups[1]).to_matrix() @ MPO(groups[0]).to_matrix(),
+            MPOList(mpos).to_matrix(),
+        )
+
+    def test_mpolist_apply_with_fit(self):
+        mpos = MPOList([self.random_mpo(5, D=3) for _ in range(5)])
+        mps = self.random_uniform_mps(2, 5, D=2)
+        self.assertSimilar(
+            mpos.apply(mps, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mpos.to_matrix() @ mps.to_vector(),
+        )
+
+    def test_mpolist_apply_fit_works_on_mpssum(self):
+        U = MPO([σx.reshape(1, 2, 2, 1)] * 3)
+        V = MPO([σz.reshape(1, 2, 2, 1)] * 3)
+        UV = MPOList([U, V], NO_TRUNCATION)
+        a = self.random_uniform_mps(2, 3)
+        b = self.random_uniform_mps(2, 3)
+        self.assertSimilar(
+            UV.apply(a - b, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            UV.to_matrix() @ (a.to_vector() - b.to_vector()),
+        )
+
     def test_mpo_set_strategy(self):
         new_strategy = Strategy(tolerance=1e-10)
         U = MPO([σx.reshape(1, 2, 2, 1)] * 3)
@@ -101,6 +101,42 @@ class TestMPOSum(SeeMPSTestCase):
             mposum.to_matrix() @ state.to_vector(),
         )
 
+    def random_mpo(self, size: int, D: int = 3) -> MPO:
+        bonds = [1] + [D] * (size - 1) + [1]
+        return MPO(
+            [
+                self.rng.normal(size=(a, 2, 2, b))
+                + 1j * self.rng.normal(size=(a, 2, 2, b))
+                for a, b in zip(bonds[:-1], bonds[1:])
+            ]
+        )
+
+    def test_mposum_apply_fit_matches_product(self):
+        A, B = self.random_mpo(6), self.random_mpo(6, D=2)
+        mposum = MPOSum([A, MPOList([A, B])], [0.5, -1j])
+        state = self.random_uniform_mps(2, A.size, D=3)
+        self.assertSimilar(
+            mposum.apply(state, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mposum.to_matrix() @ state.to_vector(),
+        )
+
+    def test_mposum_apply_fit_works_on_mpssum(self):
+        mposum = self.random_mpo(5) - 2 * self.random_mpo(5, D=2)
+        a = self.random_uniform_mps(2, mposum.size, D=2)
+        b = self.random_uniform_mps(2, mposum.size, D=3)
+        self.assertSimilar(
+            mposum.apply(a + 1j * b, strategy=TEST_STRATEGY, method="fit").to_vector(),
+            mposum.to_matrix() @ (a.to_vector() + 1j * b.to_vector()),
+        )
+
+    def test_mposum_apply_passes_method_to_terms(self):
+        mposum = self.mpoA + self.mpoC
+        state = self.random_uniform_mps(2, self.mpoA.size, D=3)
+        self.assertSimilar(
+            mposum.apply(state, strategy=TEST_STRATEGY, method="zipup").to_vector(),
+            mposum.to_matrix() @ state.to_vector(),
+        )
+
     def test_mpo_set_strategy(self):
         new_strategy = Strategy(tolerance=1e-10)
         mposum = (self.mpoA + self.mpoB).set_strategy(new_strategy)
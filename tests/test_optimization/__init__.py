@@ -2,6 +2,7 @@ from . import (
     test_arnoldi,
     test_gradient_descent,
     test_dmrg,
+    test_eigensolvers,
     test_itime_euler,
     test_itime_improved_euler,
     test_itime_rk,
@@ -12,6 +13,7 @@ __all__ = [
     "test_arnoldi",
     "test_gradient_descent",
     "test_dmrg",
+    "test_eigensolvers",
     "test_itime_euler",
     "test_itime_improved_euler",
     "test_itime_rk",
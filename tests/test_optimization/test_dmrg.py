@@ -1,9 +1,9 @@
 import numpy as np
 import scipy.sparse.linalg  # type: ignore
-from seemps.optimization.dmrg import QuadraticForm, dmrg
+from seemps.optimization.dmrg import QuadraticForm, TwoSiteDMRGOperator, dmrg
 from seemps.hamiltonians import ConstantTIHamiltonian, HeisenbergHamiltonian
 from seemps.cython import _contract_last_and_first
-from seemps.state import product_state, CanonicalMPS
+from seemps.state import product_state, CanonicalMPS, DEFAULT_STRATEGY, Precision
 from seemps.operators import MPO
 from seemps.typing import DenseOperator
 from ..tools import SeeMPSTestCase
@@ -79,6 +79,61 @@ class TestQuadraticForm(SeeMPSTestCase):
         exact_expected = Hmpo.expectation(state)
         self.assertAlmostEqual(expected, exact_expected)  # type: ignore
 
+    def test_quadratic_form_avoids_H12_for_qutrits(self):
+        S = np.diag([1.0, 0.0, -1.0])
+        H = ConstantTIHamiltonian(size=4, interaction=np.kron(S, S))
+        Hmpo = H.to_mpo()
+        state = CanonicalMPS(self.random_uniform_mps(3, 4, D=3), center=1)
+
+        Q = QuadraticForm(Hmpo, state, start=1)
+        Hop = Q.two_site_Hamiltonian(1)
+        self.assertIsInstance(Hop, TwoSiteDMRGOperator)
+        AB = _contract_last_and_first(state[1], state[2])
+        expected = np.vdot(AB, Hop @ AB.reshape(-1))
+        self.assertAlmostEqual(expected, Hmpo.expectation(state))  # type: ignore
+
+    def test_quadratic_form_variance_methods(self):
+        H = HeisenbergHamiltonian(size=6, field=[0.0, 0.0, 0.1]).to_mpo()
+        state = CanonicalMPS(self.random_uniform_mps(2, 6, D=3), center=2)
+        Q = QuadraticForm(H, state, start=2)
+        E, variance = Q.energy_and_variance("full")
+        normalized = CanonicalMPS(state, normalize=True)
+        exact_E = H.expectation(normalized).real
+        self.assertAlmostEqual(E, exact_E)
+        self.assertAlmostEqual(
+            variance, (H @ normalized).norm_squared() - exact_E * exact_E
+        )
+        E_env, variance_env = Q.energy_and_variance("environment")
+        self.assertAlmostEqual(E_env, E)
+        self.assertAlmostEqual(variance_env, variance)
+        E_local, variance_local = Q.energy_and_variance("two-site")
+        self.assertAlmostEqual(E_local, E)
+        self.assertLessEqual(variance_local, variance + 1e-12)
+        with self.assertRaises(Exception):
+            Q.energy_and_variance("unknown")
+
+    def test_quadratic_form_one_site_expansion_keeps_canonical_form(self):
+        H = HeisenbergHamiltonian(size=5).to_mpo()
+        state = CanonicalMPS(self.random_uniform_mps(2, 5, D=2), center=2)
+        Q = QuadraticForm(H, state, start=2)
+        A = state[2].copy()
+        Q.update_1site_right(A, 2, DEFAULT_STRATEGY, mixing=0.1)
+        self.assertEqual(Q.state.center, 3)
+        self.assertEqual(Q.state[2].shape[2], 4)
+        self.assertApproximateIsometry(Q.state[2], +1)
+        Q.update_1site_left(Q.state[3].copy(), 3, DEFAULT_STRATEGY, mixing=0.1)
+        self.assertEqual(Q.state.center, 2)
+        self.assertApproximateIsometry(Q.state[3], -1)
+        #
+        # Without mixing, the updates preserve the state
+        v = Q.state.to_vector()
+        Q.update_1site_right(Q.state[2].copy(), 2, DEFAULT_STRATEGY)
+        self.assertSimilar(Q.state.to_vector(), v)
+        #
+        # The environments match the new tensors
+        Q2 = QuadraticForm(H, Q.state, start=3)
+        self.assertSimilar(Q.left_env[3], Q2.left_env[3])
+
 
 class TestDMRG(SeeMPSTestCase):
     Sz: DenseOperator = np.diag([1.0, -1.0])
@@ -132,3 +187,73 @@ class TestDMRG(SeeMPSTestCase):
         v = result.state.to_vector()
         self.assertAlmostEqual(v[0] ** 2 + v[3] ** 2, 1.0)
         self.assertAlmostEqual(v[1] ** 2 + v[2] ** 2, 0.0)
+
+    def test_dmrg_on_spin_one_chain(self):
+        Sz = np.diag([1.0, 0.0, -1.0])
+        Sp = np.sqrt(2.0) * np.diag([1.0, 1.0], 1)
+        SS = np.kron(Sz, Sz) + 0.5 * (np.kron(Sp, Sp.T) + np.kron(Sp.T, Sp))
+        H = ConstantTIHamiltonian(size=5, interaction=SS)
+        result = dmrg(H.to_mpo(), guess=self.random_uniform_mps(3, 5, D=3))
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        self.assertAlmostEqual(result.energy, E[0])
+
+    def test_dmrg_in_single_precision(self):
+        H = HeisenbergHamiltonian(size=5, field=[0.0, 0.0, 0.1])
+        strategy = DEFAULT_STRATEGY.replace(precision=Precision.SINGLE)
+        result = dmrg(H, guess=self.random_uniform_mps(2, 5), strategy=strategy)
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        for A in result.state:
+            self.assertIn(A.dtype, [np.float32, np.complex64])
+        self.assertAlmostEqual(result.energy, E[0], delta=1e-4)
+
+    def test_dmrg_with_davidson_and_lanczos_eigensolvers(self):
+        H = HeisenbergHamiltonian(size=6, field=[0.0, 0.0, 0.1])
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        for eigensolver in ["davidson", "lanczos"]:
+            with self.subTest(eigensolver=eigensolver):
+                guess = CanonicalMPS(self.random_uniform_mps(2, 6), normalize=True)
+                result = dmrg(
+                    H,
+                    guess=guess,
+                    eigensolver=eigensolver,
+                    max_subspace=6,
+                )
+                self.assertTrue(result.converged)
+                self.assertAlmostEqual(result.energy, E[0])
+
+    def test_dmrg_rejects_unknown_eigensolver(self):
+        H = HeisenbergHamiltonian(size=4)
+        with self.assertRaises(Exception):
+            dmrg(H, guess=self.random_uniform_mps(2, 4), eigensolver="unknown")
+
+    def test_dmrg_variance_methods(self):
+        H = HeisenbergHamiltonian(size=6, field=[0.0, 0.0, 0.1])
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        for variance in ["environment", "two-site", "full"]:
+            with self.subTest(variance=variance):
+                guess = CanonicalMPS(self.random_uniform_mps(2, 6), normalize=True)
+                result = dmrg(H, guess=guess, variance=variance)
+                self.assertAlmostEqual(result.energy, E[0])
+                self.assertAlmostEqual(result.variances[-1], 0.0)
+
+    def test_single_site_dmrg_grows_bond_dimension(self):
+        H = HeisenbergHamiltonian(size=8, field=[0.0, 0.0, 0.1])
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        guess = CanonicalMPS(self.random_uniform_mps(2, 8, D=1), normalize=True)
+        result = dmrg(H, guess=guess, sites=1, maxiter=40)
+        self.assertTrue(result.converged)
+        self.assertAlmostEqual(result.energy, E[0])
+        self.assertGreater(max(A.shape[0] for A in result.state), 1)
+
+    def test_single_site_dmrg_starting_from_the_right(self):
+        H = HeisenbergHamiltonian(size=6, field=[0.0, 0.0, 0.1])
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        guess = CanonicalMPS(self.random_uniform_mps(2, 6), center=-1, normalize=True)
+        result = dmrg(H, guess=guess, sites=1, maxiter=40, variance="two-site")
+        self.assertAlmostEqual(result.energy, E[0])
+
+    def test_single_site_dmrg_without_guess(self):
+        H = HeisenbergHamiltonian(size=6, field=[0.0, 0.0, 0.1])
+        E = scipy.sparse.linalg.eigsh(H.to_matrix(), k=1, which="SA")[0]
+        result = dmrg(H, sites=1, maxiter=40)
+        self.assertAlmostEqual(result.energy, E[0])
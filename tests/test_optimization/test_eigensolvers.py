@@ -0,0 +1,62 @@
+import numpy as np
+from scipy.sparse.linalg import aslinearoperator  # type: ignore
+from seemps.optimization import davidson, lanczos
+from ..tools import SeeMPSTestCase
+
+
+class TestEigensolvers(SeeMPSTestCase):
+    def random_hermitian(self, n: int, complex: bool = False) -> np.ndarray:
+        A = self.rng.normal(size=(n, n))
+        if complex:
+            A = A + 1j * self.rng.normal(size=(n, n))
+        # A dominant diagonal, as in DMRG, where Davidson's preconditioner works
+        return 0.5 * (A + A.T.conj()) + np.diag(np.arange(n) * 1.0)
+
+    def assertLowestEigenpair(self, A: np.ndarray, E: float, v: np.ndarray):
+        exact_E, exact_v = np.linalg.eigh(A)
+        self.assertAlmostEqual(E, exact_E[0])
+        self.assertAlmostEqual(np.linalg.norm(v), 1.0)
+        self.assertAlmostEqual(abs(np.vdot(exact_v[:, 0], v)), 1.0)
+
+    def test_davidson_finds_lowest_eigenpair(self):
+        for complex in [False, True]:
+            A = self.random_hermitian(60, complex)
+            v0 = self.rng.normal(size=60)
+            with self.subTest(complex=complex):
+                E, v = davidson(aslinearoperator(A), v0, np.diag(A).real)
+                self.assertLowestEigenpair(A, E, v)
+
+    def test_davidson_without_diagonal(self):
+        A = self.random_hermitian(40)
+        E, v = davidson(aslinearoperator(A), self.rng.normal(size=40))
+        self.assertLowestEigenpair(A, E, v)
+
+    def test_davidson_restarts_with_small_subspace(self):
+        A = self.random_hermitian(60, True)
+        v0 = self.rng.normal(size=60)
+        E, v = davidson(aslinearoperator(A), v0, np.diag(A).real, max_subspace=4)
+        self.assertLowestEigenpair(A, E, v)
+
+    def test_lanczos_finds_lowest_eigenpair(self):
+        for complex in [False, True]:
+            A = self.random_hermitian(60, complex)
+            v0 = self.rng.normal(size=60)
+            with self.subTest(complex=complex):
+                E, v = lanczos(aslinearoperator(A), v0, max_subspace=60)
+                self.assertLowestEigenpair(A, E, v)
+
+    def test_lanczos_restarts_with_small_subspace(self):
+        A = self.random_hermitian(30)
+        v0 = self.rng.normal(size=30)
+        E, v = lanczos(aslinearoperator(A), v0, max_subspace=8, maxiter=2000)
+        self.assertLowestEigenpair(A, E, v)
+
+    def test_eigensolvers_stop_on_invariant_subspaces(self):
+        A = np.diag(np.arange(10.0))
+        v0 = np.zeros(10)
+        v0[0] = 1.0
+        for solver in [davidson, lanczos]:
+            with self.subTest(solver=solver.__name__):
+                E, v = solver(aslinearoperator(A), v0)
+                self.assertAlmostEqual(E, 0.0)
+                self.assertSimilar(np.abs(v), v0)
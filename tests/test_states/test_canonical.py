@@ -6,6 +6,7 @@ from seemps.state.canonical_mps import (
     _update_in_canonical_form_right,
     _canonicalize,
 )
+from seemps.tools import σx, σz
 from ..fixture_mps_states import MPSStatesFixture
 from ..tools import (
     approximateIsometry,
@@ -190,6 +191,23 @@ class TestCanonicalForm(MPSStatesFixture):
         self.assertAlmostEqual(mps.Renyi_entropy(0, alpha=2), 0.0)
         self.assertAlmostEqual(mps.Renyi_entropy(-1, alpha=2), 0.0)
 
+    def test_canonical_Schmidt_spectra(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 8, D=5, complex=True), center=3)
+        tensors = list(state)
+        spectra = state.Schmidt_spectra()
+        self.assertEqual(len(spectra), state.size)
+        for site, s in enumerate(spectra):
+            self.assertSimilar(s, state.Schmidt_weights(site))
+        self.assertEqual(state.center, 3)
+        self.assertTrue(all(A is B for A, B in zip(tensors, state)))
+
+    def test_canonical_entanglement_profile(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 8, D=5), center=5)
+        entropies, Renyi = state.entanglement_profile(alpha=3)
+        for site in range(state.size):
+            self.assertAlmostEqual(entropies[site], state.entanglement_entropy(site))
+            self.assertAlmostEqual(Renyi[site], state.Renyi_entropy(site, 3))
+
     def test_canonical_from_vector(self):
         state = self.rng.normal(size=2**8)
         state /= np.linalg.norm(state)
@@ -208,3 +226,75 @@ class TestCanonicalForm(MPSStatesFixture):
                 self.assertEqual(Bi.shape[0], 1)
                 self.assertEqual(Bi.shape[2], 1)
             self.assertEqual(A.physical_dimensions(), B.physical_dimensions())
+
+
+class TestCanonicalEnvironmentCache(MPSStatesFixture):
+    def assertSameMeasurements(self, cached: CanonicalMPS, state: CanonicalMPS):
+        for i in range(state.size):
+            self.assertSimilar(cached.left_environment(i), state.left_environment(i))
+            self.assertSimilar(cached.right_environment(i), state.right_environment(i))
+            self.assertAlmostEqual(
+                cached.expectation1(σz, i), state.expectation1(σz, i)
+            )
+            if i + 2 < state.size:
+                self.assertAlmostEqual(
+                    cached.expectation2(σx, σz, i, i + 2),
+                    state.expectation2(σx, σz, i, i + 2),
+                )
+
+    def test_cached_environments_match_uncached_ones(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 8, D=5), center=3)
+        cached = state.copy().cache_environments()
+        self.assertSameMeasurements(cached, state)
+        # A second pass reuses the environments
+        self.assertSameMeasurements(cached, state)
+
+    def test_environment_cache_follows_updates(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 8, D=5), center=0)
+        cached = state.copy().cache_environments()
+        for site in range(state.size - 1):
+            AA = np.einsum("aib,bjc->aijc", state[site], state[site + 1])
+            state.update_2site_right(AA.copy(), site, DEFAULT_STRATEGY)
+            cached.update_2site_right(AA, site, DEFAULT_STRATEGY)
+            self.assertSameMeasurements(cached, state)
+        for site in reversed(range(state.size - 1)):
+            AA = np.einsum("aib,bjc->aijc", state[site], state[site + 1])
+            state.update_2site_left(AA.copy(), site, DEFAULT_STRATEGY)
+            cached.update_2site_left(AA, site, DEFAULT_STRATEGY)
+            self.assertSameMeasurements(cached, state)
+        for center in [2, 6]:
+            state.recenter(center)
+            cached.recenter(center)
+            self.assertSameMeasurements(cached, state)
+        state[4] = 2 * state[4]
+        cached[4] = 2 * cached[4]
+        self.assertSameMeasurements(cached, state)
+
+    def test_cached_Schmidt_weights(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 8, D=5), center=3)
+        cached = state.copy().cache_environments()
+        for site in range(state.size):
+            expected = state.Schmidt_weights(site)
+            weights = cached.Schmidt_weights(site)
+            self.assertSimilar(weights[: expected.size], expected)
+            self.assertAlmostEqual(
+                cached.entanglement_entropy(site), state.entanglement_entropy(site)
+            )
+
+    def test_cached_Schmidt_weights_of_rank_deficient_bond(self):
+        state = CanonicalMPS(self.random_uniform_mps(2, 6, D=4), center=2)
+        # A rank-1 center tensor leaves zero eigenvalues in the environments
+        u = self.rng.normal(size=4)
+        v = self.rng.normal(size=(2, 4))
+        state[2] = np.einsum("a,ib->aib", u, v) / (
+            np.linalg.norm(u) * np.linalg.norm(v)
+        )
+        cached = state.copy().cache_environments()
+        for site in [0, 1, 3, 4, 5]:
+            expected = state.Schmidt_weights(site)
+            weights = cached.Schmidt_weights(site)
+            self.assertEqual(weights.size, expected.size)
+            self.assertSimilar(weights, expected)
+            entropy = cached.entanglement_entropy(site)
+            self.assertFalse(np.isnan(entropy))
+            self.assertAlmostEqual(entropy, state.entanglement_entropy(site))
@@ -110,3 +110,18 @@ class TestGEMM(tools.SeeMPSTestCase):
         self.assertSimilar(
             np.matmul(A.T, B.T), _gemm(A.T, GemmOrder.NORMAL, B.T, GemmOrder.NORMAL)
         )
+
+    def test_single_precision_product(self):
+        for dtype in [np.float32, np.complex64]:
+            A = self.rng.normal(size=(4, 3)).astype(dtype)
+            B = self.rng.normal(size=(3, 5)).astype(dtype)
+            C = _gemm(A, GemmOrder.NORMAL, B, GemmOrder.NORMAL)
+            self.assertEqual(C.dtype, dtype)
+            self.assertSimilar(np.matmul(A, B), C, rtol=1e-5, atol=1e-6)
+
+    def test_mixed_precision_product_is_promoted(self):
+        A = self.rng.normal(size=(4, 3)).astype(np.float32)
+        B = self.rng.normal(size=(3, 5)) + 1j * self.rng.normal(size=(3, 5))
+        C = _gemm(A, GemmOrder.NORMAL, B, GemmOrder.NORMAL)
+        self.assertEqual(C.dtype, np.complex128)
+        self.assertSimilar(np.matmul(A, B), C, rtol=1e-6)
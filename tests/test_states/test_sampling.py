@@ -49,3 +49,26 @@ class TestSampling(SeeMPSTestCase):
         mps = CanonicalMPS(product_state([0.0, 1.0], 10), center=4)
         instances = sample_mps(mps, size=100, rng=self.rng)
         self.assertTrue(np.all(instances == 1))
+
+    def assertSamplesDistribution(self, mps, samples: int = 100000, **kwdargs):
+        p = np.abs(mps.to_vector()) ** 2
+        p /= np.sum(p)
+        instances = sample_mps(mps, size=samples, rng=self.rng, **kwdargs)
+        weights = 2 ** np.arange(mps.size - 1, -1, -1)
+        frequencies = np.bincount(instances @ weights, minlength=p.size) / samples
+        self.assertTrue(np.max(np.abs(frequencies - p)) < 0.01)
+
+    def test_sample_mps_entangled_canonical_states(self):
+        mps = self.random_uniform_mps(2, 4, D=3, complex=True)
+        for center in [0, 2, -1]:
+            self.assertSamplesDistribution(CanonicalMPS(mps, center=center))
+
+    def test_sample_mps_unnormalized_mps(self):
+        mps = 3.0 * self.random_uniform_mps(2, 4, D=3, complex=True)
+        self.assertSamplesDistribution(mps)
+
+    def test_sample_mps_in_chunks(self):
+        mps = self.random_uniform_mps(2, 4, D=3)
+        self.assertSamplesDistribution(mps, chunk_size=7000)
+        instances = sample_mps(mps, size=25, chunk_size=10)
+        self.assertEqual(instances.shape, (25, 4))
@@ -1,5 +1,14 @@
+import numpy as np
 import scipy.linalg
 from seemps.state.schmidt import _destructive_svd
+from seemps.cython import (
+    Precision,
+    Strategy,
+    _configure_randomized_svd,
+    _left_orth_2site,
+    _randomized_svd,
+    _right_orth_2site,
+)
 from .. import tools
 
 
@@ -24,3 +33,80 @@ class TestSVD(tools.SeeMPSTestCase):
             self.assertSimilar(A, (U * s) @ VT, rtol=1e-10, atol=1e-15)
             U, s, VT = _destructive_svd(A.copy())
             self.assertSimilar(A, (U * s) @ VT, rtol=1e-10, atol=1e-15)
+
+
+class TestRandomizedSVD(tools.SeeMPSTestCase):
+    def tearDown(self):
+        _configure_randomized_svd()
+        super().tearDown()
+
+    def low_rank_matrix(self, m: int, n: int, rank: int, noise: float = 1e-3):
+        return self.rng.normal(size=(m, rank)) @ self.rng.normal(
+            size=(rank, n)
+        ) + noise * self.rng.normal(size=(m, n))
+
+    def test_randomized_svd_captures_leading_singular_values(self):
+        A = self.low_rank_matrix(120, 90, 6)
+        exact_s = scipy.linalg.svd(A, compute_uv=False)
+        U, s, V, _ = _randomized_svd(A.copy(), 6)
+        self.assertSimilar(s[:6], exact_s[:6], rtol=1e-10)
+        self.assertApproximateIsometry(U.reshape(120, 1, -1), +1)
+        self.assertApproximateIsometry(V.reshape(-1, 1, 90), -1)
+
+    def test_randomized_svd_reports_discarded_weight(self):
+        for A in [
+            self.low_rank_matrix(80, 100, 5),
+            self.low_rank_matrix(100, 80, 5) + 1j * self.low_rank_matrix(100, 80, 5),
+        ]:
+            U, s, V, discarded = _randomized_svd(A.copy(), 5)
+            error = np.linalg.norm(A - (U * s) @ V) ** 2
+            self.assertAlmostEqual(
+                discarded, error, delta=1e-12 * np.linalg.norm(A) ** 2
+            )
+
+    def test_left_orth_2site_uses_randomized_driver_consistently(self):
+        AA = self.low_rank_matrix(128, 96, 6).reshape(32, 4, 4, 24)
+        strategy = Strategy(max_bond_dimension=6)
+        _configure_randomized_svd(max_rank_fraction=0.0)
+        exact_B, exact_C, exact_err = _left_orth_2site(AA.copy(), strategy)
+        _configure_randomized_svd()
+        B, C, err = _left_orth_2site(AA.copy(), strategy)
+        self.assertEqual(B.shape, exact_B.shape)
+        self.assertEqual(C.shape, exact_C.shape)
+        self.assertAlmostEqual(err, exact_err, delta=1e-6 * exact_err)
+        self.assertSimilar(
+            B.reshape(-1, 6) @ C.reshape(6, -1),
+            exact_B.reshape(-1, 6) @ exact_C.reshape(6, -1),
+        )
+
+    def test_right_orth_2site_reports_truncation_error(self):
+        AA = self.low_rank_matrix(96, 128, 8).reshape(24, 4, 4, 32)
+        B, C, err = _right_orth_2site(AA.copy(), Strategy(max_bond_dimension=4))
+        self.assertEqual(C.shape[0], 4)
+        self.assertApproximateIsometry(C, -1)
+        self.assertAlmostEqual(
+            err,
+            np.linalg.norm(AA.reshape(96, 128) - B.reshape(96, 4) @ C.reshape(4, 128)),
+        )
+
+
+class TestSinglePrecisionSVD(tools.SeeMPSTestCase):
+    def test_single_precision_svd_keeps_dtype(self):
+        for dtype in [np.float32, np.complex64]:
+            A = self.rng.normal(size=(6, 5)).astype(dtype)
+            U, s, VT = _destructive_svd(A.copy())
+            self.assertEqual(s.dtype, np.float64)
+            self.assertSimilar(A, (U * s) @ VT, rtol=1e-5, atol=1e-6)
+            AA = A.reshape(3, 2, 5, 1)
+            B, C, _ = _left_orth_2site(AA.copy(), Strategy(precision=Precision.SINGLE))
+            self.assertEqual(B.dtype, dtype)
+            self.assertEqual(C.dtype, dtype)
+
+    def test_double_precision_strategy_promotes_single_tensors(self):
+        AA = self.rng.normal(size=(3, 2, 5, 1)).astype(np.float32)
+        B, C, _ = _left_orth_2site(AA.copy(), Strategy())
+        self.assertEqual(B.dtype, np.float64)
+        self.assertEqual(C.dtype, np.float64)
+        self.assertSimilar(
+            AA.reshape(6, 5), B.reshape(6, -1) @ C.reshape(-1, 5), atol=1e-6
+        )
@@ -1,8 +1,10 @@
 import numpy as np
 from .tools import SeeMPSTestCase
 from seemps.cython import (
+    Precision,
     Strategy,
     Truncation,
+    _cast_to_precision,
     NO_TRUNCATION,
     destructively_truncate_vector,
 )
@@ -112,3 +114,22 @@ class TestStrategyRelativeSingularValue(TestStrategy):
         err = destructively_truncate_vector(values, strategy)
         self.assertEqual(values.size, 2)
         self.assertEqual(err, np.sum(orig_values[2:] ** 2))
+
+
+class TestStrategyPrecision(TestStrategy):
+    def test_strategy_defaults_to_double_precision(self):
+        self.assertEqual(Strategy().get_precision(), Precision.DOUBLE)
+
+    def test_strategy_replace_changes_precision(self):
+        strategy = Strategy(tolerance=1e-5).replace(precision=Precision.SINGLE)
+        self.assertEqual(strategy.get_precision(), Precision.SINGLE)
+        self.assertEqual(strategy.get_tolerance(), 1e-5)
+
+    def test_strategy_casts_tensors_to_its_precision(self):
+        A = self.rng.normal(size=(2, 3)) + 1j * self.rng.normal(size=(2, 3))
+        single = Strategy(precision=Precision.SINGLE)
+        self.assertEqual(_cast_to_precision(A, single).dtype, np.complex64)
+        self.assertEqual(
+            _cast_to_precision(A.astype(np.complex64), Strategy()).dtype,
+            np.complex128,
+        )
@@ -0,0 +1,3 @@
+from . import test_tensor, test_symmetric_dmrg
+
+__all__ = ["test_tensor", "test_symmetric_dmrg"]
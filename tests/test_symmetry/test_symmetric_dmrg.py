@@ -0,0 +1,86 @@
+import numpy as np
+from seemps.hamiltonians import HeisenbergHamiltonian
+from seemps.optimization import dmrg
+from seemps.optimization.dmrg import SymmetricQuadraticForm
+from seemps.state import Strategy, product_state
+from seemps.symmetry import (
+    BlockSparseTensor,
+    random_symmetric_mps,
+    symmetric_mpo,
+    symmetric_mps,
+    to_dense_mps,
+)
+from ..tools import SeeMPSTestCase
+
+
+class TestSymmetricMPS(SeeMPSTestCase):
+    def test_random_symmetric_mps_has_definite_charge(self):
+        state = random_symmetric_mps([0, 1], 6, 3, D=6, rng=self.rng)
+        self.assertEqual(state.center, 0)
+        v = to_dense_mps(state).to_vector()
+        self.assertAlmostEqual(np.linalg.norm(v), 1.0)
+        wrong = [k for k in range(2**6) if bin(k).count("1") != 3]
+        self.assertAlmostEqual(np.linalg.norm(v[wrong]), 0.0)
+
+    def test_symmetric_mps_of_product_state(self):
+        up, down = np.array([1.0, 0.0]), np.array([0.0, 1.0])
+        state = product_state([up, down, down, up])
+        sym = symmetric_mps(state, [0, 1])
+        self.assertTrue(all(isinstance(A, BlockSparseTensor) for A in sym))
+        self.assertSimilar(to_dense_mps(sym).to_vector(), state.to_vector())
+
+    def test_symmetric_mps_rejects_superpositions(self):
+        state = product_state(np.array([1.0, 1.0]) / np.sqrt(2.0), 3)
+        with self.assertRaises(ValueError):
+            symmetric_mps(state, [0, 1])
+
+    def test_symmetric_mpo_of_heisenberg_model(self):
+        H = HeisenbergHamiltonian(5).to_mpo()
+        Hsym = symmetric_mpo(H, [0, 1])
+        for O, Osym in zip(H, Hsym):
+            self.assertSimilar(Osym.to_dense(), O)
+            self.assertLess(Osym.stored_size, O.size)
+
+
+class TestSymmetricDMRG(SeeMPSTestCase):
+    def exact_sector_energy(self, H, N):
+        M = H.to_matrix()
+        M = M.toarray() if hasattr(M, "toarray") else M
+        sector = [k for k in range(2**H.size) if bin(k).count("1") == N]
+        return np.linalg.eigvalsh(M[np.ix_(sector, sector)])[0]
+
+    def test_energy_and_variance_match_dense_state(self):
+        H = HeisenbergHamiltonian(6).to_mpo()
+        state = random_symmetric_mps([0, 1], 6, 2, D=4, rng=self.rng)
+        QF = SymmetricQuadraticForm(symmetric_mpo(H, [0, 1]), state)
+        energy, variance = QF.energy_and_variance()
+        v = to_dense_mps(state).to_vector()
+        M = H.to_matrix()
+        Mv = M @ v
+        self.assertAlmostEqual(energy, np.vdot(v, Mv).real)
+        self.assertAlmostEqual(variance, np.vdot(Mv, Mv).real - energy**2)
+
+    def test_dmrg_stays_in_charge_sector(self):
+        H = HeisenbergHamiltonian(8).to_mpo()
+        Hsym = symmetric_mpo(H, [0, 1])
+        strategy = Strategy(max_bond_dimension=20, tolerance=1e-12)
+        for N in [2, 3, 4]:
+            guess = random_symmetric_mps([0, 1], 8, N, D=4, rng=self.rng)
+            result = dmrg(Hsym, guess, strategy=strategy)
+            self.assertTrue(result.converged)
+            self.assertAlmostEqual(result.energy, self.exact_sector_energy(H, N))
+            self.assertTrue(all(isinstance(A, BlockSparseTensor) for A in result.state))
+            v = to_dense_mps(result.state).to_vector()
+            wrong = [k for k in range(2**8) if bin(k).count("1") != N]
+            self.assertAlmostEqual(np.linalg.norm(v[wrong]), 0.0)
+
+    def test_dmrg_requires_guess_for_symmetric_mpo(self):
+        Hsym = symmetric_mpo(HeisenbergHamiltonian(4).to_mpo(), [0, 1])
+        with self.assertRaises(ValueError):
+            dmrg(Hsym)
+
+    def test_single_site_dmrg_rejects_symmetric_mpo(self):
+        Hsym = symmetric_mpo(HeisenbergHamiltonian(4).to_mpo(), [0, 1])
+        guess = random_symmetric_mps([0, 1], 4, 2, D=2, rng=self.rng)
+        with self.assertRaises(ValueError):
+            dmrg(Hsym, guess, sites=1)
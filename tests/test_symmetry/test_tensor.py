@@ -0,0 +1,116 @@
+import numpy as np
+from seemps.state import Strategy
+from seemps.symmetry import U1, Z2, Leg, BlockSparseTensor, tensordot
+from ..tools import SeeMPSTestCase
+
+
+class TestBlockSparseTensor(SeeMPSTestCase):
+    def random_tensor(self, legs, symmetry=U1, complex=False):
+        return BlockSparseTensor.random(legs, symmetry, complex, self.rng)
+
+    def test_leg_sectors_and_dual(self):
+        leg = Leg([0, 1, 1, 2], +1)
+        self.assertEqual(leg.dim, 4)
+        self.assertEqual(leg.sector_dim(1), 2)
+        self.assertEqual(leg.sector_dim(3), 0)
+        dual = leg.dual()
+        self.assertEqual(dual.flow, -1)
+        self.assertTrue(dual.same_charges(leg))
+        self.assertNotEqual(dual, leg)
+
+    def test_z2_charges_are_reduced(self):
+        leg = Leg([0, 1, 2, 3], +1, Z2)
+        self.assertEqual(sorted(leg.sectors), [0, 1])
+        self.assertEqual(leg.sector_dim(0), 2)
+
+    def test_only_conserving_blocks_are_stored(self):
+        legs = [Leg([0, 1], +1), Leg([0, 1], +1), Leg([0, 1, 2], -1)]
+        A = self.random_tensor(legs)
+        for key in A.blocks:
+            self.assertEqual(key[0] + key[1], key[2])
+        dense = A.to_dense()
+        q0, q1, q2 = np.ix_(*(leg.charges for leg in legs))
+        self.assertTrue(np.all(dense[q0 + q1 != q2] == 0))
+        self.assertLess(A.stored_size, dense.size)
+
+    def test_from_dense_to_dense_roundtrip(self):
+        legs = [Leg([0, 1, 1], +1), Leg([0, 1], +1), Leg([0, 1, 2, 2], -1)]
+        A = self.random_tensor(legs, complex=True)
+        B = BlockSparseTensor.from_dense(A.to_dense(), legs)
+        self.assertSimilar(B.to_dense(), A.to_dense())
+        self.assertEqual(B.dtype, np.complex128)
+
+    def test_from_dense_rejects_non_conserving_tensor(self):
+        legs = [Leg([0, 1], +1), Leg([0, 1], -1)]
+        with self.assertRaises(ValueError):
+            BlockSparseTensor.from_dense(np.ones((2, 2)), legs)
+
+    def test_tensordot_matches_dense(self):
+        a = Leg([0, 1, 1, 2], +1)
+        i = Leg([0, 1], +1)
+        b = Leg([0, 1, 1, 2, 2, 3], -1)
+        A = self.random_tensor([a, i, b], complex=True)
+        B = self.random_tensor([b.dual(), i.dual(), Leg([-1, 0, 1, 1, 2], -1)])
+        C = tensordot(A, B, (2, 0))
+        self.assertSimilar(
+            C.to_dense(), np.tensordot(A.to_dense(), B.to_dense(), (2, 0))
+        )
+        D = np.tensordot(A, B, ([1, 2], [1, 0]))
+        self.assertIsInstance(D, BlockSparseTensor)
+        self.assertSimilar(
+            D.to_dense(), np.tensordot(A.to_dense(), B.to_dense(), ([1, 2], [1, 0]))
+        )
+
+    def test_tensordot_rejects_incompatible_legs(self):
+        a = Leg([0, 1], +1)
+        A = self.random_tensor([a, a.dual()])
+        with self.assertRaises(ValueError):
+            tensordot(A, A, (1, 1))
+
+    def test_conj_transpose_and_norm(self):
+        legs = [Leg([0, 1], +1), Leg([0, 1], +1), Leg([0, 1, 2], -1)]
+        A = self.random_tensor(legs, complex=True)
+        self.assertSimilar(np.conj(A).to_dense(), A.to_dense().conj())
+        self.assertSimilar(
+            A.transpose(2, 0, 1).to_dense(), A.to_dense().transpose(2, 0, 1)
+        )
+        self.assertAlmostEqual(np.linalg.norm(A), np.linalg.norm(A.to_dense()))
+        self.assertAlmostEqual(np.vdot(A, A), np.vdot(A.to_dense(), A.to_dense()))
+
+    def test_block_vector_roundtrip(self):
+        legs = [Leg([0, 1], +1), Leg([0, 1], +1), Leg([0, 1, 2], -1)]
+        A = self.random_tensor(legs)
+        layout = A.block_layout()
+        v = A.to_block_vector(layout)
+        self.assertEqual(v.size, A.stored_size)
+        self.assertSimilar(A.from_block_vector(v, layout).to_dense(), A.to_dense())
+
+    def test_left_orth_2site_reconstructs_tensor(self):
+        a = Leg([0, 1, 1, 2], +1)
+        i = Leg([0, 1], +1)
+        AA = self.random_tensor([a, i, i, Leg([1, 2, 2, 3, 4], -1)])
+        B, C, err = AA.left_orth_2site(Strategy(tolerance=1e-14))
+        self.assertAlmostEqual(err, 0.0)
+        self.assertSimilar(
+            np.tensordot(B.to_dense(), C.to_dense(), (2, 0)), AA.to_dense()
+        )
+        Bd = B.to_dense().reshape(-1, B.shape[-1])
+        self.assertAlmostIdentity(Bd.T.conj() @ Bd)
+
+    def test_right_orth_2site_truncates_like_dense_svd(self):
+        a = Leg([0, 1, 1, 2], +1)
+        i = Leg([0, 1], +1)
+        AA = self.random_tensor([a, i, i, Leg([1, 2, 2, 3, 4], -1)], complex=True)
+        D = 3
+        B, C, err = AA.right_orth_2site(Strategy(max_bond_dimension=D))
+        self.assertEqual(C.shape[0], D)
+        Cd = C.to_dense().reshape(D, -1)
+        self.assertAlmostIdentity(Cd @ Cd.T.conj())
+        s = np.linalg.svd(AA.to_dense().reshape(8, -1), compute_uv=False)
+        self.assertAlmostEqual(err**2, np.sum(s[D:] ** 2))
+        self.assertAlmostEqual(
+            np.linalg.norm(
+                np.tensordot(B.to_dense(), C.to_dense(), (2, 0)) - AA.to_dense()
+            ),
+            err,
+        )
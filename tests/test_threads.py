@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from seemps.state import CanonicalMPS, Strategy, random_uniform_mps, scprod
+from seemps.cython import (
+    GemmOrder,
+    _contract_nrjl_ijk_klm,
+    _destructive_svd,
+    _gemm,
+    _left_orth_2site,
+    _update_left_environment,
+    _update_right_environment,
+)
+from .tools import SeeMPSTestCase
+
+
+class TestThreadSafety(SeeMPSTestCase):
+    """Run the Cython kernels from a thread pool, where they release the GIL
+    in the BLAS and LAPACK sections, and compare with serial results."""
+
+    threads: int = 4
+    repeats: int = 8
+
+    def run_concurrently(self, function, arguments: list) -> list:
+        tasks = arguments * self.repeats
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            results = list(executor.map(lambda args: function(*args), tasks))
+        return results
+
+    def assertSameResults(self, function, arguments: list, copy=tuple):
+        expected = [function(*copy(args)) for args in arguments]
+        results = self.run_concurrently(lambda *args: function(*copy(args)), arguments)
+        for i, result in enumerate(results):
+            self.assertSimilar(result, expected[i % len(arguments)])
+
+    def test_gemm_is_thread_safe(self):
+        arguments = []
+        for dtype in [np.float64, np.complex128, np.float32, np.complex64]:
+            A = self.rng.normal(size=(60, 50)).astype(dtype)
+            B = self.rng.normal(size=(50, 40)).astype(dtype)
+            arguments.append((A, GemmOrder.NORMAL, B, GemmOrder.NORMAL))
+            arguments.append((A.T, GemmOrder.TRANSPOSE, B.T, GemmOrder.TRANSPOSE))
+        self.assertSameResults(_gemm, arguments)
+
+    def test_svd_is_thread_safe(self):
+        arguments = [
+            (self.rng.normal(size=(60, 45)),),
+            (self.rng.normal(size=(45, 60)) + 1j * self.rng.normal(size=(45, 60)),),
+        ]
+        self.assertSameResults(
+            lambda A: np.abs(_destructive_svd(A)[1]),
+            arguments,
+            copy=lambda args: tuple(A.copy() for A in args),
+        )
+
+    def test_two_site_splitting_is_thread_safe(self):
+        strategy = Strategy(max_bond_dimension=12)
+        arguments = [(self.rng.normal(size=(20, 2, 2, 20)),) for _ in range(4)]
+
+        def split(AA):
+            B, C, _ = _left_orth_2site(AA, strategy)
+            return np.einsum("aib,bjc->aijc", B, C)
+
+        self.assertSameResults(
+            split, arguments, copy=lambda args: tuple(A.copy() for A in args)
+        )
+
+    def test_environment_updates_are_thread_safe(self):
+        arguments = []
+        for _ in range(4):
+            A = self.rng.normal(size=(40, 2, 40))
+            B = self.rng.normal(size=(40, 2, 40))
+            rho = self.rng.normal(size=(40, 40))
+            arguments.append((B, A, rho))
+        self.assertSameResults(_update_left_environment, arguments)
+        self.assertSameResults(_update_right_environment, arguments)
+
+    def test_two_site_gate_contraction_is_thread_safe(self):
+        arguments = [
+            (
+                self.rng.normal(size=(4, 4)),
+                self.rng.normal(size=(30, 2, 30)),
+                self.rng.normal(size=(30, 2, 30)),
+            )
+            for _ in range(4)
+        ]
+        self.assertSameResults(_contract_nrjl_ijk_klm, arguments)
+
+    def test_scalar_products_are_thread_safe(self):
+        states = [random_uniform_mps(2, 10, D=20, rng=self.rng) for _ in range(4)]
+        arguments = [(a, b) for a in states for b in states]
+        self.assertSameResults(scprod, arguments)
+
+    def test_canonicalization_is_thread_safe(self):
+        strategy = Strategy(tolerance=1e-8)
+        states = [random_uniform_mps(2, 10, D=20, rng=self.rng) for _ in range(4)]
+        self.assertSameResults(
+            lambda state: CanonicalMPS(state, center=5, strategy=strategy).to_vector(),
+            [(state,) for state in states],
+        )
@@ -145,3 +145,27 @@ class TestStrategy(tools.SeeMPSTestCase):
         err = destructively_truncate_vector(news := s.copy(), strategy)
         self.assertSimilar(news, s)
         self.assertAlmostEqual(err, norm_errors[4])
+
+    def test_strategy_adds_discarded_weight(self):
+        s = np.array([1.0, 0.1, 0.01, 0.001])
+        for method in [
+            Truncation.DO_NOT_TRUNCATE,
+            Truncation.RELATIVE_SINGULAR_VALUE,
+            Truncation.ABSOLUTE_SINGULAR_VALUE,
+            Truncation.RELATIVE_NORM_SQUARED_ERROR,
+        ]:
+            strategy = Strategy(method=method, tolerance=1e-5, max_bond_dimension=2)
+            err0 = destructively_truncate_vector(s.copy(), strategy)
+            err = destructively_truncate_vector(s.copy(), strategy, 1e-8)
+            self.assertAlmostEqual(err, err0 + 1e-8)
+
+    def test_strategy_relative_norm_counts_discarded_weight_in_tolerance(self):
+        s = np.array([1.0, 0.1, 0.01, 0.001])
+        strategy = Strategy(
+            method=Truncation.RELATIVE_NORM_SQUARED_ERROR, tolerance=1e-5
+        )
+        err = destructively_truncate_vector(news := s.copy(), strategy)
+        self.assertSimilar(news, s[:3])
+        err = destructively_truncate_vector(news := s.copy(), strategy, 1e-5)
+        self.assertSimilar(news, s)
+        self.assertAlmostEqual(err, 1e-5)